@@ -842,9 +842,13 @@ def cmd_rebalance(
 
     # 3. Concentration (optional, from forecast positions)
     concentration = None
+    snapshot = None  # fetched once, shared by steps 3-5
     if HAS_CONCENTRATION and HAS_PORTFOLIO_MANAGER:
         try:
-            concentration = pm_get_structure_analysis(csv_path, yahoo_client)
+            snapshot = pm_get_snapshot(csv_path, yahoo_client)
+            concentration = pm_get_structure_analysis(
+                csv_path, yahoo_client, snapshot=snapshot
+            )
         except Exception as e:
             print(f"Warning: 構造分析取得エラー: {e}", file=sys.stderr)
 
@@ -853,7 +857,8 @@ def cmd_rebalance(
     if HAS_CORRELATION:
         try:
             # Build portfolio_data for correlation from snapshot positions
-            snapshot = pm_get_snapshot(csv_path, yahoo_client) if HAS_PORTFOLIO_MANAGER else None
+            if snapshot is None and HAS_PORTFOLIO_MANAGER:
+                snapshot = pm_get_snapshot(csv_path, yahoo_client)
             if snapshot and snapshot.get("positions"):
                 corr_portfolio = []
                 for pos in snapshot["positions"]:
@@ -875,7 +880,8 @@ def cmd_rebalance(
     # 5. Enrich forecast positions with sector/country/currency from snapshot
     if HAS_PORTFOLIO_MANAGER:
         try:
-            snapshot = pm_get_snapshot(csv_path, yahoo_client)
+            if snapshot is None:
+                snapshot = pm_get_snapshot(csv_path, yahoo_client)
             snapshot_map = {
                 p["symbol"]: p for p in snapshot.get("positions", [])
             }
@@ -5,7 +5,7 @@ Usage:
     python3 .github/scripts/collect_market_data.py \
         --region japan \
         --output data/market \
-        [--verbose]
+        [--max-age-hours 6] [--verbose]
 
 Output layout:
     data/market/
@@ -25,7 +25,7 @@ import argparse
 import json
 import sys
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -35,9 +35,17 @@ _SCRIPT_DIR = Path(__file__).resolve().parent          # .github/scripts/
 _PROJECT_ROOT = _SCRIPT_DIR.parent.parent              # repo root
 sys.path.insert(0, str(_PROJECT_ROOT))
 
+import numpy as np                                     # noqa: E402
+import pandas as pd                                    # noqa: E402
 import yfinance as yf                                  # noqa: E402
 from yfinance import EquityQuery                       # noqa: E402
 
+try:
+    import orjson                                      # noqa: E402
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ---------------------------------------------------------------------------
 # Japan core stock universe (~80 major stocks by market cap)
 # These are always collected regardless of screening results.
@@ -144,86 +152,153 @@ def _symbol_to_filename(symbol: str) -> str:
     return symbol.replace(".", "_").replace("/", "_")
 
 
-def _normalize_ratio(val):
-    """Convert percentage > 1 to ratio form."""
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        if f != f or f == float("inf") or f == float("-inf"):  # NaN / inf guard
-            return None
-        if f > 1.0:
-            return f / 100.0
-        return f
-    except (TypeError, ValueError):
-        return None
+# Canonical numeric field → yfinance info keys (first finite value wins).
+# Order matches the output format of src/data/yahoo_client/detail.py.
+_NUMERIC_FIELDS: dict[str, tuple[str, ...]] = {
+    # Price
+    "price": ("regularMarketPrice", "currentPrice"),
+    "market_cap": ("marketCap",),
+    # Valuation
+    "per": ("trailingPE",),
+    "forward_per": ("forwardPE",),
+    "pbr": ("priceToBook",),
+    "psr": ("priceToSalesTrailing12Months",),
+    # Profitability
+    "roe": ("returnOnEquity",),
+    "roa": ("returnOnAssets",),
+    "profit_margin": ("profitMargins",),
+    "operating_margin": ("operatingMargins",),
+    # Dividend
+    "dividend_yield": ("dividendYield",),
+    "dividend_yield_trailing": ("trailingAnnualDividendYield",),
+    "payout_ratio": ("payoutRatio",),
+    # Growth
+    "revenue_growth": ("revenueGrowth",),
+    "earnings_growth": ("earningsGrowth",),
+    # Financial health
+    "debt_to_equity": ("debtToEquity",),
+    "current_ratio": ("currentRatio",),
+    "free_cashflow": ("freeCashflow",),
+    # Other
+    "beta": ("beta",),
+    "fifty_two_week_high": ("fiftyTwoWeekHigh",),
+    "fifty_two_week_low": ("fiftyTwoWeekLow",),
+}
 
+# Fields reported as percentages by yfinance; values > 1 are divided by 100.
+_RATIO_FIELDS = ("dividend_yield",)
 
-def _safe_get(info: dict, *keys):
-    """Return first non-None, finite value from info dict."""
-    for key in keys:
-        val = info.get(key)
-        if val is None:
-            continue
-        try:
-            f = float(val)
-            if f != f or abs(f) == float("inf"):
-                continue
-            return f
-        except (TypeError, ValueError):
-            return val  # string values (name, sector) are OK
-    return None
+_INFO_KEYS = sorted({k for keys in _NUMERIC_FIELDS.values() for k in keys})
+
+# Fetched stocks are normalized and written every this many symbols, so an
+# interrupted run keeps what it already collected.
+_WRITE_CHUNK = 50
 
 
-def _normalize_stock_info(symbol: str, info: dict) -> dict:
-    """Normalize raw ticker.info dict into the application's canonical format.
+def _normalize_stock_infos(raw: list[tuple[str, dict]], now_iso: str) -> list[dict]:
+    """Normalize raw ticker.info dicts into the application's canonical format.
+
+    All numeric fields of all stocks are coerced in one vectorized pass:
+    for each field the first key holding a finite number or a non-numeric
+    value wins.  NaN/inf are skipped, non-numeric values (strings) are
+    passed through as-is except in ratio fields (None there), and ratio
+    fields > 1 are converted from percentage to ratio form.  *now_iso* is
+    stamped as ``_market_data_updated`` on every entry (one timestamp per
+    collection run).
 
     The output format matches exactly what src/data/yahoo_client/detail.py
     get_stock_info() returns, so it can be used as a drop-in replacement.
     """
-    return {
-        "symbol": symbol,
-        "name": info.get("shortName") or info.get("longName"),
-        "sector": info.get("sector"),
-        "industry": info.get("industry"),
-        "currency": info.get("currency"),
-        # Price
-        "price": _safe_get(info, "regularMarketPrice", "currentPrice"),
-        "market_cap": _safe_get(info, "marketCap"),
-        # Valuation
-        "per": _safe_get(info, "trailingPE"),
-        "forward_per": _safe_get(info, "forwardPE"),
-        "pbr": _safe_get(info, "priceToBook"),
-        "psr": _safe_get(info, "priceToSalesTrailing12Months"),
-        # Profitability
-        "roe": _safe_get(info, "returnOnEquity"),
-        "roa": _safe_get(info, "returnOnAssets"),
-        "profit_margin": _safe_get(info, "profitMargins"),
-        "operating_margin": _safe_get(info, "operatingMargins"),
-        # Dividend
-        "dividend_yield": _normalize_ratio(_safe_get(info, "dividendYield")),
-        "dividend_yield_trailing": _safe_get(info, "trailingAnnualDividendYield"),
-        "payout_ratio": _safe_get(info, "payoutRatio"),
-        # Growth
-        "revenue_growth": _safe_get(info, "revenueGrowth"),
-        "earnings_growth": _safe_get(info, "earningsGrowth"),
-        # Financial health
-        "debt_to_equity": _safe_get(info, "debtToEquity"),
-        "current_ratio": _safe_get(info, "currentRatio"),
-        "free_cashflow": _safe_get(info, "freeCashflow"),
-        # Other
-        "beta": _safe_get(info, "beta"),
-        "fifty_two_week_high": _safe_get(info, "fiftyTwoWeekHigh"),
-        "fifty_two_week_low": _safe_get(info, "fiftyTwoWeekLow"),
+    if not raw:
+        return []
+
+    df = pd.DataFrame.from_records(
+        [{k: info.get(k) for k in _INFO_KEYS} for _, info in raw],
+        columns=_INFO_KEYS,
+    )
+    numeric = df.apply(pd.to_numeric, errors="coerce")
+    # Present but non-numeric (e.g. strings): passed through unconverted
+    other = (df.notna() & numeric.isna()).to_numpy()
+    arr = numeric.to_numpy(dtype=np.float64)
+    arr = np.where(np.isfinite(arr), arr, np.nan)
+    col = {k: i for i, k in enumerate(_INFO_KEYS)}
+
+    columns: dict[str, np.ndarray] = {}
+    passthrough: dict[str, np.ndarray] = {}  # field -> index of key to copy, or -1
+    for field, keys in _NUMERIC_FIELDS.items():
+        values = np.full(len(raw), np.nan)
+        source = np.full(len(raw), -1)
+        for j, key in enumerate(keys):
+            pending = np.isnan(values) & (source < 0)
+            values = np.where(pending, arr[:, col[key]], values)
+            source = np.where(pending & other[:, col[key]], j, source)
+        if field in _RATIO_FIELDS:
+            values = np.where(values > 1.0, values / 100.0, values)
+        columns[field] = values
+        passthrough[field] = source
+
+    results = []
+    for i, (symbol, info) in enumerate(raw):
+        entry = {
+            "symbol": symbol,
+            "name": info.get("shortName") or info.get("longName"),
+            "sector": info.get("sector"),
+            "industry": info.get("industry"),
+            "currency": info.get("currency"),
+        }
+        for field, values in columns.items():
+            j = passthrough[field][i]
+            if j >= 0:
+                entry[field] = (None if field in _RATIO_FIELDS
+                                else info[_NUMERIC_FIELDS[field][j]])
+                continue
+            v = values[i]
+            entry[field] = None if np.isnan(v) else float(v)
         # Market data timestamp
-        "_market_data_updated": datetime.now(timezone.utc).isoformat(),
-    }
+        entry["_market_data_updated"] = now_iso
+        results.append(entry)
+    return results
+
 
+def _write_stock_infos(raw: list[tuple[str, dict]], stocks_dir: Path,
+                       now_iso: str) -> int:
+    """Normalize and write one chunk of fetched stocks; return the count."""
+    for info in _normalize_stock_infos(raw, now_iso):
+        fname = _symbol_to_filename(info["symbol"]) + ".json"
+        _write_json(stocks_dir / fname, info, pretty=False)
+    return len(raw)
 
-def _write_json(path: Path, data: dict | list) -> None:
+
+def _write_json(path: Path, data: dict | list, pretty: bool = True) -> None:
+    """Write JSON; pretty=False writes compact output for machine-read caches."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not pretty and HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+        return
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        if pretty:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+
+
+def _is_fresh(path: Path, cutoff: datetime) -> bool:
+    """Return True if the cached stock file was collected at or after *cutoff*.
+
+    The file mtime is checked first so stale files are rejected without
+    parsing; otherwise ``_market_data_updated`` inside the file decides.
+    """
+    try:
+        if path.stat().st_mtime < cutoff.timestamp():
+            return False
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        updated = datetime.fromisoformat(data["_market_data_updated"])
+        return updated >= cutoff
+    except (OSError, ValueError, KeyError, TypeError):
+        # TypeError also covers a naive timestamp compared with *cutoff*
+        return False
 
 
 # ---------------------------------------------------------------------------
@@ -231,7 +306,7 @@ def _write_json(path: Path, data: dict | list) -> None:
 # ---------------------------------------------------------------------------
 
 def fetch_stock_info(symbol: str, verbose: bool = False) -> dict | None:
-    """Fetch and normalize stock info for a single symbol."""
+    """Fetch raw ticker.info for a single symbol (normalized later in batch)."""
     try:
         ticker = yf.Ticker(symbol)
         info = ticker.info
@@ -239,8 +314,7 @@ def fetch_stock_info(symbol: str, verbose: bool = False) -> dict | None:
             if verbose:
                 print(f"  ⚠ {symbol}: no regularMarketPrice in response")
             return None
-        result = _normalize_stock_info(symbol, info)
-        return result
+        return info
     except Exception as e:
         if verbose:
             print(f"  ✗ {symbol}: {e}")
@@ -318,8 +392,14 @@ def run_screen_preset(preset_name: str, verbose: bool = False) -> list[dict]:
 # Main collection logic
 # ---------------------------------------------------------------------------
 
-def collect_region(region: str, output_dir: Path, verbose: bool) -> dict:
-    """Collect market data for a region and return summary."""
+def collect_region(
+    region: str, output_dir: Path, verbose: bool, max_age_hours: float = 6.0,
+) -> dict:
+    """Collect market data for a region and return summary.
+
+    Stocks whose cache file is younger than *max_age_hours* are not
+    re-fetched (0 disables the skip).
+    """
     if region != "japan":
         print(f"[collect] Region '{region}' not yet supported (only 'japan')")
         return {}
@@ -329,7 +409,9 @@ def collect_region(region: str, output_dir: Path, verbose: bool) -> dict:
     stocks_dir.mkdir(parents=True, exist_ok=True)
     screen_dir.mkdir(parents=True, exist_ok=True)
 
-    updated_at = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
+    updated_at = now.isoformat()
+    fresh_cutoff = now - timedelta(hours=max_age_hours)
     collected_symbols: set[str] = set()
 
     # --- Step 1: Run screening presets ---
@@ -349,51 +431,61 @@ def collect_region(region: str, output_dir: Path, verbose: bool) -> dict:
         }
         _write_json(screen_dir / f"{preset}.json", screen_data)
         # Collect symbols for detail fetch
-        for q in quotes:
-            sym = q.get("symbol")
-            if sym:
-                collected_symbols.add(sym)
+        collected_symbols |= {q["symbol"] for q in quotes if q.get("symbol")}
         time.sleep(1)  # rate-limit
 
     # Add core list
     collected_symbols.update(JAPAN_CORE_STOCKS)
-    # Deduplicate (already a set)
+    # Deduplicate (already a set); sorted once and reused for _meta.json
     symbols_to_fetch = sorted(collected_symbols)
     print(f"\n[collect] Fetching detail for {len(symbols_to_fetch)} stocks...")
 
     # --- Step 2: Fetch individual stock details ---
-    success = 0
+    raw_infos: list[tuple[str, dict]] = []
+    written = 0
     failed = 0
+    cached = 0
     for i, symbol in enumerate(symbols_to_fetch, 1):
         if verbose:
             print(f"  [{i}/{len(symbols_to_fetch)}] {symbol}", end=" ")
+        fname = _symbol_to_filename(symbol) + ".json"
+        if max_age_hours > 0 and _is_fresh(stocks_dir / fname, fresh_cutoff):
+            cached += 1
+            if verbose:
+                print("= cached")
+            continue
         info = fetch_stock_info(symbol, verbose=False)
         if info is not None:
-            fname = _symbol_to_filename(symbol) + ".json"
-            _write_json(stocks_dir / fname, info)
-            success += 1
+            raw_infos.append((symbol, info))
             if verbose:
-                price = info.get("price")
-                name = info.get("name", "")
+                price = info.get("regularMarketPrice")
+                name = info.get("shortName") or info.get("longName") or ""
                 print(f"✓ {name} @ {price}")
+            if len(raw_infos) >= _WRITE_CHUNK:
+                written += _write_stock_infos(raw_infos, stocks_dir, updated_at)
+                raw_infos.clear()
         else:
             failed += 1
             if verbose:
                 print("✗ no data")
         time.sleep(0.5)  # rate-limit: ~0.5s per stock
 
+    written += _write_stock_infos(raw_infos, stocks_dir, updated_at)
+    success = written + cached
+
     # --- Step 3: Write metadata ---
     meta = {
         "_updated": updated_at,
         "region": region,
         "stocks_collected": success,
         "stocks_failed": failed,
+        "stocks_cached": cached,
         "presets_screened": JAPAN_SCREEN_PRESETS,
-        "symbols": sorted(collected_symbols),
+        "symbols": symbols_to_fetch,
     }
     _write_json(output_dir / region / "_meta.json", meta)
 
-    print(f"\n[collect] {region}: ✓ {success} stocks, ✗ {failed} failed")
+    print(f"\n[collect] {region}: ✓ {success} stocks ({cached} cached), ✗ {failed} failed")
     return meta
 
 
@@ -403,6 +495,9 @@ def main():
                         help="Region to collect: japan, us, all (default: japan)")
     parser.add_argument("--output", default="data/market",
                         help="Output directory (default: data/market)")
+    parser.add_argument("--max-age-hours", type=float, default=6.0,
+                        help="Skip stocks collected within this many hours "
+                             "(0 = always re-fetch, default: 6)")
     parser.add_argument("--verbose", action="store_true",
                         help="Verbose output")
     args = parser.parse_args()
@@ -412,7 +507,8 @@ def main():
 
     print(f"[collect] Starting market data collection → {output_dir}")
     for region in regions:
-        collect_region(region, output_dir, verbose=args.verbose)
+        collect_region(region, output_dir, verbose=args.verbose,
+                       max_age_hours=args.max_age_hours)
 
     print("\n[collect] Done.")
 
@@ -4,6 +4,7 @@
 Usage:
     python3 scripts/init_graph.py [--history-dir data/history] [--notes-dir data/notes]
     python3 scripts/init_graph.py --rebuild   # full wipe + reimport (with embeddings if TEI available)
+    python3 scripts/init_graph.py --force     # reimport files the manifest marks as unchanged
 
 This script:
 1. Creates schema constraints and indexes (including vector indexes, KIK-420)
@@ -12,328 +13,687 @@ This script:
 4. Imports existing notes
 5. Links research SUPERSEDES chains
 6. Generates semantic_summary + embedding for each node (KIK-420, TEI optional)
-7. Is idempotent (safe to run multiple times)
+7. Is idempotent (safe to run multiple times); files unchanged since the
+   last import are skipped via data/cache/import_manifest.sqlite3
 """
 
 import argparse
-import csv
 import json
+import operator
+import os
 import sys
 from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _loads = json.loads
+    HAS_ORJSON = False
+
+# Optional streaming parser for large notes/watchlist arrays
+try:
+    import ijson
+    HAS_IJSON = True
+    _PARSE_ERRORS: tuple = (ValueError, ijson.JSONError)
+except ImportError:
+    HAS_IJSON = False
+    _PARSE_ERRORS = (ValueError,)
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from scripts.common import try_import
+# graph_store defers the neo4j driver import to its first connection
 from src.data.graph_store import (
     clear_all,
     get_mode,
     init_schema,
     is_available,
-    link_research_supersedes,
-    merge_forecast,
-    merge_health,
-    merge_market_context,
+    link_research_supersedes_bulk,
+    merge_forecasts_bulk,
+    merge_health_checks_bulk,
     merge_market_context_full,
-    merge_note,
-    merge_report,
-    merge_report_full,
-    merge_research,
+    merge_notes_bulk,
+    merge_reports_bulk,
     merge_research_full,
-    merge_screen,
-    merge_stock,
-    merge_stress_test,
-    merge_trade,
-    merge_watchlist,
+    merge_screens_bulk,
+    merge_stocks_bulk,
+    merge_stress_tests_bulk,
+    merge_trades_bulk,
+    merge_watchlists_bulk,
     sync_portfolio,
 )
 
-# KIK-420: Optional embedding support (graceful degradation if TEI unavailable)
-HAS_EMBEDDING, _emb = try_import("src.data", "embedding_client", "summary_builder")
-if HAS_EMBEDDING:
-    embedding_client = _emb["embedding_client"]
-    summary_builder = _emb["summary_builder"]
+_emb_modules: "dict | None" = None
 
 
-def _get_embedding(summary_text: str) -> "list[float] | None":
-    """Get embedding for summary text. Returns None if TEI unavailable."""
-    if not HAS_EMBEDDING:
+def _embedding_modules() -> dict:
+    """Import the optional embedding modules on first use (KIK-420).
+
+    Deferred so that --help and the Neo4j availability check do not pay
+    for requests/numpy. Returns {} when the modules are unavailable
+    (graceful degradation).
+    """
+    global _emb_modules
+    if _emb_modules is None:
+        from scripts.common import try_import
+        ok, mods = try_import(
+            "src.data", "embedding_client", "summary_builder", "embedding_cache")
+        _emb_modules = mods if ok else {}
+    return _emb_modules
+
+
+# Malformed history records make the summary templates fail with these;
+# the record is still imported, just without a summary/embedding.
+_SUMMARY_ERRORS = (TypeError, ValueError, KeyError, AttributeError, IndexError)
+
+
+# Whether TEI is reachable for this run (set by main(); None = not checked,
+# in which case summaries are built whenever the modules are installed)
+_emb_active: "bool | None" = None
+
+
+def _active_summary_builder():
+    """Return summary_builder, or None when no embeddings will be generated.
+
+    Summaries are only used as embedding input here, so building them is
+    skipped entirely when TEI was found unavailable at startup.
+    """
+    if _emb_active is False:
         return None
+    return _embedding_modules().get("summary_builder")
+
+
+def _get_embeddings(texts: list[str]) -> "list[np.ndarray | None]":
+    """Get embeddings for many summary texts in batched TEI requests.
+
+    Texts already in the on-disk embedding cache are not sent to TEI;
+    newly fetched embeddings are added to the cache.
+    Returns a list aligned with *texts* of float32 arrays (graph_store
+    converts them to lists when sending); entries are None when TEI is
+    unavailable or the text is empty.
+    """
+    emb_mods = _embedding_modules()
+    if not emb_mods or not any(texts):
+        return [None] * len(texts)
+    embedding_client = emb_mods["embedding_client"]
+    embedding_cache = emb_mods["embedding_cache"]
+    keys = [embedding_cache.key(t) if t else None for t in texts]
+    cached = embedding_cache.get_many([k for k in keys if k is not None])
+    embeddings = [cached.get(k) if k is not None else None for k in keys]
+
+    misses = [i for i, k in enumerate(keys) if k is not None and k not in cached]
+    if not misses:
+        return embeddings
+    # The client returns None entries on failure and fails fast once TEI is down
+    fetched = embedding_client.get_embeddings_batch([texts[i] for i in misses])
+    import numpy as np
+    new_items = []
+    for i, emb in zip(misses, fetched):
+        if emb is not None:
+            embeddings[i] = np.asarray(emb, dtype=np.float32)
+            new_items.append((keys[i], embeddings[i]))
+    embedding_cache.put_many(new_items)
+    return embeddings
+
+
+def _merge_pending(pending: "list[tuple[str, dict]]",
+                   merge_rows: "Callable[[list[dict]], object]",
+                   imported: "list[tuple[str, int, int]] | None" = None) -> int:
+    """Embed all pending summaries in batches, then merge all rows at once.
+
+    Each entry is (summary_text, row) where row holds the keyword arguments
+    of the graph_store merge_* function; semantic_summary and embedding are
+    filled in here. *imported* (from _changed_files) is recorded in the
+    import manifest only when the merge succeeds and no embedding is
+    missing, so failed files and files still lacking embeddings (TEI down)
+    are picked up again by the next run.
+    Returns the number of rows merged.
+    """
+    texts = [text for text, _ in pending]
+    embeddings = _get_embeddings(texts)
+    rows = []
+    for (text, row), emb in zip(pending, embeddings):
+        row["semantic_summary"] = text
+        row["embedding"] = emb
+        rows.append(row)
+    ok = merge_rows(rows) if rows else True
+    if imported and ok is True and not _embeddings_missing(texts, embeddings):
+        from src.data import import_manifest
+        import_manifest.record(imported)
+    if ok is False:
+        return merge_rows.merged if isinstance(merge_rows, _OneByOne) else 0
+    return len(rows)
+
+
+def _embeddings_missing(texts: list[str],
+                        embeddings: "list[np.ndarray | None]") -> bool:
+    """Whether some row was merged without an embedding it should have had.
+
+    That is a TEI failure for a non-empty summary, or TEI being down for
+    this run. Nothing is missing when the embedding modules are not
+    installed, as embeddings are never generated then.
+    """
+    if not _embedding_modules():
+        return False
+    if _emb_active is False:
+        return bool(texts)
+    return any(text and emb is None for text, emb in zip(texts, embeddings))
+
+
+# Skip files unchanged since the last import (enabled by main())
+_use_manifest = False
+
+
+def _set_use_manifest(enabled: bool) -> None:
+    """Enable/disable the import manifest."""
+    global _use_manifest
+    _use_manifest = enabled
+
+
+def _init_worker(use_manifest: bool, emb_active: "bool | None") -> None:
+    """Copy main()'s run settings into an importer worker process.
+
+    Workers defer their Stock rows to the parent (see _merge_stocks).
+    """
+    global _emb_active, _deferred_stocks
+    _set_use_manifest(use_manifest)
+    _emb_active = emb_active
+    _deferred_stocks = []
+
+
+def _run_deferred(fn: "Callable[[Path], int]", d: Path) -> "tuple[int, list]":
+    """Run importer *fn* in a worker; return (count, deferred Stock triples)."""
+    count = fn(d)
+    stocks = list(dict.fromkeys(_deferred_stocks))
+    _deferred_stocks.clear()
+    return count, stocks
+
+
+def _changed_files(files: list[str]) -> "tuple[list[str], list[tuple[str, int, int]]]":
+    """Drop files recorded as imported and unchanged since.
+
+    Returns (files_to_import, manifest_entries); the entries go through
+    _read_changed and then _merge_pending, so they are recorded only after
+    a successful merge.
+    """
+    if not _use_manifest:
+        return files, []
+    from src.data import import_manifest
+    return import_manifest.filter_changed(files)
+
+
+# (symbol, name, sector) already merged in this process
+_seen_stocks: set[tuple[str, str, str]] = set()
+
+# Stock triples collected instead of merged (importer worker processes only)
+_deferred_stocks: "list[tuple[str, str, str]] | None" = None
+
+
+def _merge_stocks(stocks: "list[tuple[str, str, str]]") -> None:
+    """Merge (symbol, name, sector) Stock rows in one bulk call.
+
+    The same symbol recurs across screens, reports, trades and watchlists;
+    triples already merged in this run are skipped, since an identical
+    MERGE+SET is a no-op in Neo4j but still costs work.
+    Worker processes only collect the triples; the parent merges them once
+    all workers finish, so concurrent workers never SET the same Stock
+    nodes and name/sector do not depend on which worker wrote last.
+    """
+    if _deferred_stocks is not None:
+        _deferred_stocks.extend(stocks)
+        return
+    rows = []
+    for k in stocks:
+        if k in _seen_stocks:
+            continue
+        _seen_stocks.add(k)
+        rows.append({"symbol": k[0], "name": k[1], "sector": k[2]})
+    if rows:
+        merge_stocks_bulk(rows)
+
+
+class _OneByOne:
+    """Adapt a single-record merge_* function to the bulk row interface.
+
+    Used for node types whose full-mode sub-node expansion has no bulk form.
+    A failing row does not stop the others; calling returns whether every
+    row merged, and *merged* holds how many did.
+    """
+
+    def __init__(self, merge: Callable):
+        self.merge = merge
+        self.merged = 0
+
+    def __call__(self, rows: list[dict]) -> bool:
+        results = []
+        for row in rows:
+            try:
+                results.append(self.merge(**row) is not False)
+            except Exception as e:
+                print(f"[init_graph] Warning: {getattr(self.merge, '__name__', 'merge')} failed: {e}",
+                      file=sys.stderr)
+                results.append(False)
+        self.merged = sum(results)
+        return all(results)
+
+
+def _one_by_one(merge: Callable) -> _OneByOne:
+    """Wrap *merge* for _merge_pending (see _OneByOne)."""
+    return _OneByOne(merge)
+
+
+def _list_json(d: Path) -> list[str]:
+    """List the *.json files in *d*, ordered by inode number.
+
+    A single scandir pass (no per-file stat), and inode order approximates
+    on-disk layout so the reads that follow are mostly sequential. Callers
+    must not rely on filename order (SUPERSEDES chains are ordered by date
+    in Cypher).
+    """
+    with os.scandir(d) as it:
+        entries = [(e.inode(), e.path) for e in it
+                   if e.name.endswith(".json") and e.is_file()]
+    entries.sort()
+    return [path for _, path in entries]
+
+
+def _read_json(fp: "Path | str"):
+    """Read and parse a JSON file (orjson when installed, stdlib json otherwise).
+
+    Both parsers raise ValueError subclasses on malformed input.
+    """
+    with open(fp, "rb") as f:
+        return _loads(f.read())
+
+
+def _read_bytes(fp: "Path | str") -> "bytes | None":
+    """Read a whole file, returning None if it cannot be read."""
     try:
-        return embedding_client.get_embedding(summary_text)
-    except Exception:
+        with open(fp, "rb") as f:
+            return f.read()
+    except OSError:
         return None
 
 
-def import_screens(history_dir: str) -> int:
-    """Import screening history files."""
-    d = Path(history_dir) / "screen"
-    if not d.exists():
-        return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            screen_date = data.get("date", "")
-            preset = data.get("preset", "")
-            region = data.get("region", "")
-            results = data.get("results", [])
-            symbols = [r.get("symbol", "") for r in results if r.get("symbol")]
-
-            # Merge stock nodes with metadata
-            for r in results:
-                sym = r.get("symbol", "")
-                if sym:
-                    merge_stock(
-                        symbol=sym,
-                        name=r.get("name", ""),
-                        sector=r.get("sector", ""),
-                    )
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    top_syms = symbols[:5]
-                    summary_text = summary_builder.build_screen_summary(
-                        screen_date, preset, region, top_syms)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_screen(screen_date, preset, region, len(results), symbols,
-                         semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
-    return count
+def _parse_or_none(raw: "bytes | None"):
+    """Parse JSON bytes, returning None for missing or malformed input."""
+    if raw is None:
+        return None
+    try:
+        return _loads(raw)
+    except ValueError:
+        return None
 
 
-def import_reports(history_dir: str) -> int:
-    """Import report history files."""
-    d = Path(history_dir) / "report"
+# Reads kept in flight at once (storage queue depth)
+_READ_CONCURRENCY = 64
+
+
+async def _read_all_async(files: "list[Path] | list[str]",
+                          limit: int = _READ_CONCURRENCY,
+                          parse: bool = True) -> list:
+    """Read up to *limit* files concurrently; parse each as its read completes.
+
+    With parse=False the raw bytes (None if unreadable) are returned.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(limit)
+
+    async def one(fp):
+        async with sem:
+            raw = await loop.run_in_executor(pool, _read_bytes, fp)
+        return _parse_or_none(raw) if parse else raw
+
+    with ThreadPoolExecutor(max_workers=min(limit, len(files))) as pool:
+        return await asyncio.gather(*(one(fp) for fp in files))
+
+
+def _read_all(files: "list[Path] | list[str]", parse: bool = True) -> list:
+    """Read and parse many JSON files, preserving the order of *files*.
+
+    Reads are issued concurrently so the disk sees more than one request
+    at a time; parsing happens on the calling thread. Entries are None for
+    files that could not be read or parsed. With parse=False the raw bytes
+    are returned instead.
+    """
+    if len(files) < 2:
+        raws = [_read_bytes(fp) for fp in files]
+        return [_parse_or_none(r) for r in raws] if parse else raws
+    import asyncio
+    return asyncio.run(_read_all_async(files, parse=parse))
+
+
+def _read_changed(files: list[str], imported: list) -> "tuple[list, list]":
+    """Read and parse *files* from _changed_files, skipping same-content files.
+
+    With the manifest enabled, each file's bytes are hashed before parsing;
+    files whose content matches the recorded digest (only their stat
+    changed) come back as None and are not parsed. The bytes are read only
+    once for both the hash and the parse.
+    Returns (parsed data list, manifest entries to record after the merge).
+    """
+    if not _use_manifest:
+        return _read_all(files), imported
+    from src.data import import_manifest
+    raws, imported = import_manifest.skip_same_content(
+        imported, _read_all(files, parse=False))
+    return [_parse_or_none(r) for r in raws], imported
+
+
+# Files at least this large are parsed from a memory map (orjson only)
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_file(f):
+    """Parse the open binary file *f*.
+
+    Large files are memory-mapped and handed to orjson as a memoryview, so
+    the page cache is parsed in place instead of being copied into a bytes
+    object first. stdlib json cannot parse a memoryview, so without orjson
+    the file is always read.
+    """
+    if HAS_ORJSON and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+        import mmap
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+    return _loads(f.read())
+
+
+def _iter_json_array(fp: "Path | str", allow_object: bool = False):
+    """Yield the elements of the top-level JSON array in *fp*.
+
+    Arrays are streamed with ijson when installed, so only one element is
+    held in memory at a time; otherwise the file is parsed in full
+    (memory-mapped when large, see _load_file).
+    With allow_object=True a top-level object is yielded as a single
+    element; other non-array files yield nothing.
+    """
+    with open(fp, "rb") as f:
+        if HAS_IJSON and f.read(64).lstrip()[:1] == b"[":
+            f.seek(0)
+            yield from ijson.items(f, "item", use_float=True)
+            return
+        f.seek(0)
+        data = _load_file(f)
+    if isinstance(data, list):
+        yield from data
+    elif allow_object:
+        yield data
+
+
+def import_screens(d: Path) -> int:
+    """Import screening history files from *d* (history/screen)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            symbol = data.get("symbol", "")
-            if not symbol:
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
+            continue
+        screen_date = data.get("date", "")
+        preset = data.get("preset", "")
+        region = data.get("region", "")
+        results = data.get("results", [])
+        # One pass for both the symbol list and the Stock rows (with metadata)
+        symbols = []
+        for r in results:
+            sym = r.get("symbol")
+            if not sym:
                 continue
-            merge_stock(
-                symbol=symbol,
-                name=data.get("name", ""),
-                sector=data.get("sector", ""),
-            )
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_report_summary(
-                        symbol, data.get("name", ""),
-                        data.get("value_score", 0), data.get("verdict", ""),
-                        data.get("sector", ""))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_report_full(
-                report_date=data.get("date", ""),
-                symbol=symbol,
-                score=data.get("value_score", 0),
-                verdict=data.get("verdict", ""),
-                price=data.get("price", 0),
-                per=data.get("per", 0),
-                pbr=data.get("pbr", 0),
-                dividend_yield=data.get("dividend_yield", 0),
-                roe=data.get("roe", 0),
-                market_cap=data.get("market_cap", 0),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+            symbols.append(sym)
+            stocks.append((sym, r.get("name", ""), r.get("sector", "")))
+
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                top_syms = symbols[:5]
+                summary_text = summary_builder.build_screen_summary(
+                    screen_date, preset, region, top_syms)
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "screen_date": screen_date, "preset": preset, "region": region,
+            "count": len(results), "symbols": symbols,
+        }))
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_screens_bulk, imported)
+
+
+# Field defaults for history records, in unpacking order. Overlaying the
+# record on the defaults and unpacking with itemgetter replaces a .get()
+# call per field.
+_REPORT_DEFAULTS = {
+    "date": "", "symbol": "", "name": "", "sector": "", "value_score": 0,
+    "verdict": "", "price": 0, "per": 0, "pbr": 0, "dividend_yield": 0,
+    "roe": 0, "market_cap": 0,
+}
+_REPORT_FIELDS = operator.itemgetter(*_REPORT_DEFAULTS)
+
+_TRADE_DEFAULTS = {
+    "date": "", "trade_type": "buy", "symbol": "", "shares": 0, "price": 0,
+    "currency": "JPY", "memo": "",
+}
+_TRADE_FIELDS = operator.itemgetter(*_TRADE_DEFAULTS)
+
+
+def import_reports(d: Path) -> int:
+    """Import report history files from *d* (history/report)."""
+    if not d.exists():
+        return 0
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
             continue
-    return count
-
-
-def import_trades(history_dir: str) -> int:
-    """Import trade history files."""
-    d = Path(history_dir) / "trade"
+        (report_date, symbol, name, sector, score, verdict, price, per, pbr,
+         dividend_yield, roe, market_cap) = _REPORT_FIELDS({**_REPORT_DEFAULTS, **data})
+        if not symbol:
+            continue
+        stocks.append((symbol, name, sector))
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_report_summary(
+                    symbol, name, score, verdict, sector)
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "report_date": report_date,
+            "symbol": symbol,
+            "score": score,
+            "verdict": verdict,
+            "price": price,
+            "per": per,
+            "pbr": pbr,
+            "dividend_yield": dividend_yield,
+            "roe": roe,
+            "market_cap": market_cap,
+        }))
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_reports_bulk, imported)
+
+
+def import_trades(d: Path) -> int:
+    """Import trade history files from *d* (history/trade)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            symbol = data.get("symbol", "")
-            if not symbol:
-                continue
-            merge_stock(symbol=symbol)
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_trade_summary(
-                        data.get("date", ""), data.get("trade_type", "buy"),
-                        symbol, data.get("shares", 0), data.get("memo", ""))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_trade(
-                trade_date=data.get("date", ""),
-                trade_type=data.get("trade_type", "buy"),
-                symbol=symbol,
-                shares=data.get("shares", 0),
-                price=data.get("price", 0),
-                currency=data.get("currency", "JPY"),
-                memo=data.get("memo", ""),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
             continue
-    return count
-
-
-def import_health(history_dir: str) -> int:
-    """Import health check history files."""
-    d = Path(history_dir) / "health"
+        (trade_date, trade_type, symbol, shares, price, currency,
+         memo) = _TRADE_FIELDS({**_TRADE_DEFAULTS, **data})
+        if not symbol:
+            continue
+        stocks.append((symbol, "", ""))
+
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_trade_summary(
+                    trade_date, trade_type, symbol, shares, memo)
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "trade_date": trade_date,
+            "trade_type": trade_type,
+            "symbol": symbol,
+            "shares": shares,
+            "price": price,
+            "currency": currency,
+            "memo": memo,
+        }))
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_trades_bulk, imported)
+
+
+def import_health(d: Path) -> int:
+    """Import health check history files from *d* (history/health)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            health_date = data.get("date", "")
-            summary = data.get("summary", {})
-            positions = data.get("positions", [])
-            symbols = [p.get("symbol", "") for p in positions if p.get("symbol")]
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_health_summary(
-                        health_date, summary)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_health(health_date, summary, symbols,
-                         semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    pending: list[tuple[str, dict]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
             continue
-    return count
-
-
-def import_research(history_dir: str) -> int:
-    """Import research history files and build SUPERSEDES chains."""
-    d = Path(history_dir) / "research"
+        health_date = data.get("date", "")
+        summary = data.get("summary", {})
+        positions = data.get("positions", [])
+        symbols = [sym for p in positions if (sym := p.get("symbol"))]
+
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_health_summary(
+                    health_date, summary)
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "health_date": health_date, "summary": summary, "symbols": symbols,
+        }))
+    return _merge_pending(pending, merge_health_checks_bulk, imported)
+
+
+def import_research(d: Path) -> int:
+    """Import research history files from *d* (history/research).
+
+    Also builds the SUPERSEDES chains for the imported targets.
+    """
     if not d.exists():
         return 0
-    count = 0
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
     # Track unique (type, target) pairs for SUPERSEDES linking
     targets = defaultdict(set)
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            research_date = data.get("date", "")
-            research_type = data.get("research_type", "")
-            target = data.get("target", "")
-            if not target:
-                continue
-
-            # For stock/business, also merge the Stock node
-            if research_type in ("stock", "business"):
-                merge_stock(symbol=target, name=data.get("name", ""))
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_research_summary(
-                        research_type, target, data)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_research_full(
-                research_date=research_date,
-                research_type=research_type,
-                target=target,
-                summary=data.get("summary", ""),
-                grok_research=data.get("grok_research"),
-                x_sentiment=data.get("x_sentiment"),
-                news=data.get("news"),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            targets[research_type].add(target)
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
+            continue
+        research_date = data.get("date", "")
+        research_type = data.get("research_type", "")
+        target = data.get("target", "")
+        if not target:
             continue
 
-    # Build SUPERSEDES chains for each unique type+target
-    for rtype, target_set in targets.items():
-        for t in target_set:
-            link_research_supersedes(rtype, t)
+        # For stock/business, also merge the Stock node
+        if research_type in ("stock", "business"):
+            stocks.append((target, data.get("name", ""), ""))
+
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_research_summary(
+                    research_type, target, data)
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "research_date": research_date,
+            "research_type": research_type,
+            "target": target,
+            "summary": data.get("summary", ""),
+            "grok_research": data.get("grok_research"),
+            "x_sentiment": data.get("x_sentiment"),
+            "news": data.get("news"),
+        }))
+        targets[research_type].add(target)
+    # Sub-node expansion (News/Sentiment/...) is per record
+    _merge_stocks(stocks)
+    count = _merge_pending(pending, _one_by_one(merge_research_full), imported)
+
+    # Build SUPERSEDES chains for all unique type+target pairs in one call
+    pairs = [(rtype, t) for rtype, target_set in targets.items() for t in target_set]
+    if pairs:
+        link_research_supersedes_bulk(pairs)
 
     return count
 
 
-def import_market_context(history_dir: str) -> int:
-    """Import market context history files."""
-    d = Path(history_dir) / "market_context"
+def import_market_context(d: Path) -> int:
+    """Import market context history files from *d* (history/market_context)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            context_date = data.get("date", "")
-            if not context_date:
-                continue
-            indices = data.get("indices", [])
+    pending: list[tuple[str, dict]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
+            continue
+        context_date = data.get("date", "")
+        if not context_date:
+            continue
+        indices = data.get("indices", [])
 
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_market_context_summary(
-                        context_date, indices, data.get("grok_research"))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
+        # KIK-420: Build summary (embedded in batch below)
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_market_context_summary(
+                    context_date, indices, data.get("grok_research"))
+            except _SUMMARY_ERRORS:
+                pass
 
-            merge_market_context_full(
-                context_date=context_date, indices=indices,
-                grok_research=data.get("grok_research"),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
-    return count
+        pending.append((summary_text, {
+            "context_date": context_date, "indices": indices,
+            "grok_research": data.get("grok_research"),
+        }))
+    # Sub-node expansion (Indicator/UpcomingEvent/...) is per record
+    return _merge_pending(pending, _one_by_one(merge_market_context_full), imported)
 
 
 def import_notes(notes_dir: str) -> int:
@@ -341,43 +701,41 @@ def import_notes(notes_dir: str) -> int:
     d = Path(notes_dir)
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
+    pending: list[tuple[str, dict]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    for fp in files:
         try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            notes = data if isinstance(data, list) else [data]
-            for note in notes:
+            for note in _iter_json_array(fp, allow_object=True):
                 note_id = note.get("id", "")
                 if not note_id:
                     continue
-                # KIK-420: Generate embedding
+                # KIK-420: Build summary (embedded in batch below)
                 summary_text = ""
-                emb = None
-                if HAS_EMBEDDING:
+                if summary_builder is not None:
                     try:
                         summary_text = summary_builder.build_note_summary(
                             note.get("symbol", ""),
                             note.get("type", "observation"),
                             note.get("content", ""))
-                        emb = _get_embedding(summary_text)
-                    except Exception:
+                    except _SUMMARY_ERRORS:
                         pass
 
-                merge_note(
-                    note_id=note_id,
-                    note_date=note.get("date", ""),
-                    note_type=note.get("type", "observation"),
-                    content=note.get("content", ""),
-                    symbol=note.get("symbol"),
-                    source=note.get("source", ""),
-                    semantic_summary=summary_text,
-                    embedding=emb,
-                )
-                count += 1
-        except (json.JSONDecodeError, OSError):
+                pending.append((summary_text, {
+                    "note_id": note_id,
+                    "note_date": note.get("date", ""),
+                    "note_type": note.get("type", "observation"),
+                    "content": note.get("content", ""),
+                    "symbol": note.get("symbol"),
+                    "source": note.get("source", ""),
+                }))
+        except (*_PARSE_ERRORS, OSError):
             continue
-    return count
+    return _merge_pending(pending, merge_notes_bulk, imported)
+
+
+_HOLDING_COLUMNS = frozenset(
+    ("symbol", "shares", "cost_price", "cost_currency", "purchase_date", "memo"))
 
 
 def import_portfolio(csv_path: str) -> int:
@@ -385,21 +743,32 @@ def import_portfolio(csv_path: str) -> int:
     p = Path(csv_path)
     if not p.exists():
         return 0
+    import csv
     count = 0
     holdings = []
+    stocks: list[tuple[str, str, str]] = []
     try:
-        with open(p, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(p, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "symbol" not in header:
+                return 0
+            sym_i = header.index("symbol")
+            # Only the columns used here and by sync_portfolio
+            cols = [(h, i) for i, h in enumerate(header) if h in _HOLDING_COLUMNS]
             for row in reader:
-                symbol = row.get("symbol", "")
+                symbol = row[sym_i] if sym_i < len(row) else ""
                 if not symbol or symbol.upper().endswith(".CASH"):
                     continue
-                merge_stock(symbol=symbol, name=row.get("memo", ""))
-                holdings.append(row)
+                holding = {h: row[i] for h, i in cols if i < len(row)}
+                stocks.append((symbol, holding.get("memo", ""), ""))
+                holdings.append(holding)
                 count += 1
     except (OSError, csv.Error):
         pass
 
+    _merge_stocks(stocks)
+
     # KIK-414: Sync Portfolio→HOLDS→Stock relationships
     if holdings:
         try:
@@ -415,129 +784,142 @@ def import_watchlists(watchlists_dir: str) -> int:
     d = Path(watchlists_dir)
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    for fp in files:
         try:
-            with open(fp, encoding="utf-8") as f:
-                symbols = json.load(f)
-            if not isinstance(symbols, list):
-                continue
-            # Filter empty symbols
-            symbols = [s for s in symbols if s]
+            # Filter empty symbols (non-list files yield nothing)
+            symbols = [s for s in _iter_json_array(fp) if s]
             if not symbols:
                 continue
-            name = fp.stem  # filename without extension
-            for sym in symbols:
-                merge_stock(symbol=sym)
+            name = Path(fp).stem  # filename without extension
+            stocks.extend((sym, "", "") for sym in symbols)
             summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
+            if summary_builder is not None:
                 try:
                     summary_text = summary_builder.build_watchlist_summary(
                         name, symbols)
-                    emb = _get_embedding(summary_text)
-                except Exception:
+                except _SUMMARY_ERRORS:
                     pass
-            merge_watchlist(name, symbols,
-                            semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
+            pending.append((summary_text, {"name": name, "symbols": symbols}))
+        except (*_PARSE_ERRORS, OSError):
             continue
-    return count
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_watchlists_bulk, imported)
 
 
-def import_stress_tests(history_dir: str) -> int:
-    """Import stress test history files (KIK-428)."""
-    d = Path(history_dir) / "stress_test"
+def import_stress_tests(d: Path) -> int:
+    """Import stress test history files from *d* (history/stress_test, KIK-428)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            test_date = data.get("date", "")
-            scenario = data.get("scenario", "")
-            symbols = data.get("symbols", [])
-            portfolio_impact = data.get("portfolio_impact", 0)
-            var_result = data.get("var_result", {})
-
-            for sym in symbols:
-                if sym:
-                    merge_stock(symbol=sym)
-
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_stress_test_summary(
-                        test_date, scenario, portfolio_impact, len(symbols))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_stress_test(
-                test_date=test_date, scenario=scenario,
-                portfolio_impact=portfolio_impact, symbols=symbols,
-                var_95=var_result.get("var_95_daily", 0),
-                var_99=var_result.get("var_99_daily", 0),
-                semantic_summary=summary_text, embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
             continue
-    return count
-
-
-def import_forecasts(history_dir: str) -> int:
-    """Import forecast history files (KIK-428)."""
-    d = Path(history_dir) / "forecast"
+        test_date = data.get("date", "")
+        scenario = data.get("scenario", "")
+        symbols = data.get("symbols", [])
+        portfolio_impact = data.get("portfolio_impact", 0)
+        var_result = data.get("var_result", {})
+
+        stocks.extend((sym, "", "") for sym in symbols if sym)
+
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_stress_test_summary(
+                    test_date, scenario, portfolio_impact, len(symbols))
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "test_date": test_date, "scenario": scenario,
+            "portfolio_impact": portfolio_impact, "symbols": symbols,
+            "var_95": var_result.get("var_95_daily", 0),
+            "var_99": var_result.get("var_99_daily", 0),
+        }))
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_stress_tests_bulk, imported)
+
+
+def import_forecasts(d: Path) -> int:
+    """Import forecast history files from *d* (history/forecast, KIK-428)."""
     if not d.exists():
         return 0
-    count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            forecast_date = data.get("date", "")
-            portfolio = data.get("portfolio", {})
-            positions = data.get("positions", [])
-            symbols = [p.get("symbol", "") for p in positions if p.get("symbol")]
-
-            for sym in symbols:
-                if sym:
-                    merge_stock(symbol=sym)
-
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_forecast_summary(
-                        forecast_date,
-                        portfolio.get("optimistic"),
-                        portfolio.get("base"),
-                        portfolio.get("pessimistic"),
-                        len(symbols))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_forecast(
-                forecast_date=forecast_date,
-                optimistic=portfolio.get("optimistic", 0),
-                base=portfolio.get("base", 0),
-                pessimistic=portfolio.get("pessimistic", 0),
-                symbols=symbols,
-                total_value_jpy=data.get("total_value_jpy", 0),
-                semantic_summary=summary_text, embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    pending: list[tuple[str, dict]] = []
+    stocks: list[tuple[str, str, str]] = []
+    summary_builder = _active_summary_builder()
+    files, imported = _changed_files(_list_json(d))
+    datas, imported = _read_changed(files, imported)
+    for data in datas:
+        if data is None:
             continue
-    return count
+        forecast_date = data.get("date", "")
+        portfolio = data.get("portfolio", {})
+        positions = data.get("positions", [])
+        symbols = [sym for p in positions if (sym := p.get("symbol"))]
+
+        stocks.extend((sym, "", "") for sym in symbols if sym)
+
+        summary_text = ""
+        if summary_builder is not None:
+            try:
+                summary_text = summary_builder.build_forecast_summary(
+                    forecast_date,
+                    portfolio.get("optimistic"),
+                    portfolio.get("base"),
+                    portfolio.get("pessimistic"),
+                    len(symbols))
+            except _SUMMARY_ERRORS:
+                pass
+
+        pending.append((summary_text, {
+            "forecast_date": forecast_date,
+            "optimistic": portfolio.get("optimistic", 0),
+            "base": portfolio.get("base", 0),
+            "pessimistic": portfolio.get("pessimistic", 0),
+            "symbols": symbols,
+            "total_value_jpy": data.get("total_value_jpy", 0),
+        }))
+    _merge_stocks(stocks)
+    return _merge_pending(pending, merge_forecasts_bulk, imported)
+
+
+def _run_importers(importers: "dict[str, tuple[Callable[[Path], int], Path]]",
+                   jobs: int) -> "dict[str, int]":
+    """Run independent importers, in worker processes when jobs > 1.
+
+    *importers* maps a label to (import function, directory argument).
+    Each worker opens its own Neo4j driver. The spawn start method is used
+    so that no driver connection inherited from this process is shared.
+    Stock rows found by the workers are merged here afterwards, in
+    importer order, as a sequential run would.
+    Returns {label: imported count}.
+    """
+    if jobs <= 1:
+        return {label: fn(d) for label, (fn, d) in importers.items()}
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx,
+                             initializer=_init_worker,
+                             initargs=(_use_manifest, _emb_active)) as ex:
+        futures = {label: ex.submit(_run_deferred, fn, d)
+                   for label, (fn, d) in importers.items()}
+        results = {label: fut.result() for label, fut in futures.items()}
+    for _, stocks in results.values():
+        _merge_stocks(stocks)
+    return {label: count for label, (count, _) in results.items()}
 
 
 def main():
+    global _emb_active
     parser = argparse.ArgumentParser(description="Initialize Neo4j knowledge graph")
     parser.add_argument("--history-dir", default="data/history")
     parser.add_argument("--notes-dir", default="data/notes")
@@ -550,6 +932,14 @@ def main():
         "--rebuild", action="store_true",
         help="Delete all nodes and reimport everything",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=min(8, os.cpu_count() or 1),
+        help="Worker processes for history import (1 = sequential)",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-import files even if unchanged since the last import",
+    )
     args = parser.parse_args()
 
     print("Checking Neo4j connection...")
@@ -559,8 +949,10 @@ def main():
 
     # KIK-420: Check TEI availability
     tei_ok = False
-    if HAS_EMBEDDING:
-        tei_ok = embedding_client.is_available()
+    emb_mods = _embedding_modules()
+    if emb_mods:
+        tei_ok = emb_mods["embedding_client"].is_available()
+    _emb_active = tei_ok
     if tei_ok:
         print("TEI embedding service: available (embeddings will be generated)")
     else:
@@ -571,6 +963,11 @@ def main():
         clear_all()
         print("All nodes deleted.")
 
+    from src.data import import_manifest
+    if args.rebuild:
+        import_manifest.reset()
+    _set_use_manifest(not args.force)
+
     print("Initializing schema...")
     if not init_schema():
         print("ERROR: Failed to create schema.")
@@ -578,23 +975,20 @@ def main():
     print("Schema initialized.")
 
     print(f"\nImporting history from {args.history_dir}...")
-    screens = import_screens(args.history_dir)
-    reports = import_reports(args.history_dir)
-    trades = import_trades(args.history_dir)
-    health = import_health(args.history_dir)
-    research = import_research(args.history_dir)
-    market_ctx = import_market_context(args.history_dir)
-    stress_tests = import_stress_tests(args.history_dir)
-    forecasts = import_forecasts(args.history_dir)
-
-    print(f"  Screens:        {screens}")
-    print(f"  Reports:        {reports}")
-    print(f"  Trades:         {trades}")
-    print(f"  Health:         {health}")
-    print(f"  Research:       {research}")
-    print(f"  MarketContext:  {market_ctx}")
-    print(f"  StressTests:    {stress_tests}")
-    print(f"  Forecasts:      {forecasts}")
+    hist = Path(args.history_dir)
+    counts = _run_importers({
+        "Screens": (import_screens, hist / "screen"),
+        "Reports": (import_reports, hist / "report"),
+        "Trades": (import_trades, hist / "trade"),
+        "Health": (import_health, hist / "health"),
+        "Research": (import_research, hist / "research"),
+        "MarketContext": (import_market_context, hist / "market_context"),
+        "StressTests": (import_stress_tests, hist / "stress_test"),
+        "Forecasts": (import_forecasts, hist / "forecast"),
+    }, args.jobs)
+
+    for label, count in counts.items():
+        print(f"  {label + ':':<16}{count}")
 
     print(f"\nImporting portfolio from {args.portfolio_csv}...")
     portfolio = import_portfolio(args.portfolio_csv)
@@ -608,7 +1002,7 @@ def main():
     notes = import_notes(args.notes_dir)
     print(f"  Notes:    {notes}")
 
-    total = screens + reports + trades + health + research + stress_tests + forecasts + portfolio + watchlists + notes
+    total = sum(counts.values()) + portfolio + watchlists + notes
     print(f"\nDone. Total {total} records imported.")
 
 
@@ -11,6 +11,11 @@ Alert levels:
 """
 
 import math
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
@@ -18,6 +23,7 @@ from typing import Optional
 
 from src.core.common import is_cash as _is_cash, is_etf as _is_etf, finite_or_none
 from src.core._thresholds import th
+from src.core.screening.technicals import rsi_values
 from src.core.screening.indicators import (
     calculate_shareholder_return,
     calculate_shareholder_return_history,
@@ -30,10 +36,79 @@ ALERT_EARLY_WARNING = "early_warning"
 ALERT_CAUTION = "caution"
 ALERT_EXIT = "exit"
 
+# (emoji, label) shown for each alert level
+_LEVEL_DISPLAY = {
+    ALERT_NONE: ("", "なし"),
+    ALERT_EARLY_WARNING: ("\u26a1", "早期警告"),
+    ALERT_CAUTION: ("\u26a0", "注意"),
+    ALERT_EXIT: ("\U0001f6a8", "撤退"),
+}
+
+# Change quality labels (check_change_quality)
+QUALITY_GOOD = "良好"
+QUALITY_ONE_DOWN = "1指標↓"
+QUALITY_MULTI_DOWN = "複数悪化"
+QUALITY_NA = "対象外"
+
+# Integer codes the alert core branches on; unknown labels map to _Q_OTHER
+_Q_GOOD, _Q_ONE_DOWN, _Q_MULTI_DOWN, _Q_NA, _Q_OTHER = range(5)
+_QUALITY_CODES = {
+    QUALITY_GOOD: _Q_GOOD,
+    QUALITY_ONE_DOWN: _Q_ONE_DOWN,
+    QUALITY_MULTI_DOWN: _Q_MULTI_DOWN,
+    QUALITY_NA: _Q_NA,
+}
+
 # Technical thresholds (from config/thresholds.yaml, KIK-446)
 SMA_APPROACHING_GAP = th("health", "sma_approaching_gap", 0.02)
 RSI_PREV_THRESHOLD = th("health", "rsi_prev_threshold", 50)
 RSI_DROP_THRESHOLD = th("health", "rsi_drop_threshold", 40)
+CROSS_LOOKBACK = th("health", "cross_lookback", 60)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing simple moving average computed from one cumulative sum.
+
+    Returns ``len(values) - window + 1`` points aligned with the tail of
+    *values*. A window containing NaN yields NaN, matching
+    ``Series.rolling(window).mean()``. Values are summed relative to the
+    latest one so that a flat tail averages to exactly that price.
+    """
+    missing = np.isnan(values)
+    ref = values[-1] if not missing[-1] else 0.0
+    cs = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values - ref))))
+    gaps = np.concatenate(([0], np.cumsum(missing)))
+    out = (cs[window:] - cs[:-window]) / window + ref
+    out[gaps[window:] - gaps[:-window] > 0] = np.nan
+    return out
+
+
+# Trend result used when there is not enough price data; callers get a copy
+_DEFAULT_TREND = MappingProxyType({
+    "trend": "不明",
+    "price_above_sma50": False,
+    "price_above_sma200": False,
+    "sma50_above_sma200": False,
+    "dead_cross": False,
+    "sma50_approaching_sma200": False,
+    "rsi": float("nan"),
+    "rsi_drop": False,
+    "current_price": float("nan"),
+    "sma50": float("nan"),
+    "sma200": float("nan"),
+    "cross_signal": "none",
+    "days_since_cross": None,
+    "cross_date": None,
+})
+
+
+def _date_str(value) -> str:
+    """Format an index label (Timestamp, datetime64, date, str) as YYYY-MM-DD."""
+    if hasattr(value, "date"):
+        return str(value.date())
+    if isinstance(value, np.datetime64):
+        return str(value.astype("datetime64[D]"))
+    return str(value)
 
 
 def check_trend_health(hist: Optional[pd.DataFrame]) -> dict:
@@ -52,40 +127,35 @@ def check_trend_health(hist: Optional[pd.DataFrame]) -> dict:
         sma50_approaching_sma200, rsi, rsi_drop, current_price,
         sma50, sma200.
     """
-    default = {
-        "trend": "不明",
-        "price_above_sma50": False,
-        "price_above_sma200": False,
-        "sma50_above_sma200": False,
-        "dead_cross": False,
-        "sma50_approaching_sma200": False,
-        "rsi": float("nan"),
-        "rsi_drop": False,
-        "current_price": float("nan"),
-        "sma50": float("nan"),
-        "sma200": float("nan"),
-        "cross_signal": "none",
-        "days_since_cross": None,
-        "cross_date": None,
-    }
-
     if hist is None or not isinstance(hist, pd.DataFrame):
-        return default
-    if "Close" not in hist.columns or len(hist) < 200:
-        return default
+        return dict(_DEFAULT_TREND)
+    if "Close" not in hist.columns:
+        return dict(_DEFAULT_TREND)
+    # float64 on purpose: a float32 running sum of JPY closes drifts by
+    # more than the 2-decimal SMA display and can flip near-tie crosses.
+    return _check_trend_health_np(hist["Close"].to_numpy(dtype=np.float64), hist.index)
 
-    close = hist["Close"]
 
-    from src.core.screening.technicals import compute_rsi
+def _check_trend_health_np(prices: np.ndarray, dates) -> dict:
+    """check_trend_health() on a float64 close array.
 
-    sma50 = close.rolling(window=50).mean()
-    sma200 = close.rolling(window=200).mean()
-    rsi_series = compute_rsi(close, period=14)
+    *dates* is indexed only for the cross date, so a DatetimeIndex, a
+    datetime64 array or any sequence of labels works.
+    """
+    if len(prices) < 200:
+        return dict(_DEFAULT_TREND)
+
+    # SMAs are only read over the cross lookback, so average just that tail.
+    # RSI keeps the full history: its ewm seed never fully washes out.
+    tail = prices[-(200 + CROSS_LOOKBACK):]
+    sma50 = _rolling_mean(tail, 50)
+    sma200 = _rolling_mean(tail, 200)
+    rsi_series = rsi_values(prices, period=14)
 
-    current_price = float(close.iloc[-1])
-    current_sma50 = float(sma50.iloc[-1])
-    current_sma200 = float(sma200.iloc[-1])
-    current_rsi = float(rsi_series.iloc[-1])
+    current_price = float(prices[-1])
+    current_sma50 = float(sma50[-1])
+    current_sma200 = float(sma200[-1])
+    current_rsi = float(rsi_series[-1])
 
     price_above_sma50 = current_price > current_sma50
     price_above_sma200 = current_price > current_sma200
@@ -93,30 +163,24 @@ def check_trend_health(hist: Optional[pd.DataFrame]) -> dict:
     dead_cross = not sma50_above_sma200
 
     # --- Cross event detection (lookback N trading days) ---
-    _CROSS_LOOKBACK = th("health", "cross_lookback", 60)
     cross_signal = "none"
     days_since_cross = None
     cross_date = None
 
-    max_scan = min(_CROSS_LOOKBACK, len(sma50) - 201)
-    for i in range(max(0, max_scan)):
-        idx = -1 - i
-        prev_idx = idx - 1
-        cur_above = sma50.iloc[idx] > sma200.iloc[idx]
-        prev_above = sma50.iloc[prev_idx] > sma200.iloc[prev_idx]
-
-        if cur_above and not prev_above:
-            cross_signal = "golden_cross"
+    max_scan = min(CROSS_LOOKBACK, len(prices) - 201)
+    if max_scan > 0:
+        window = max_scan + 1
+        above = (
+            sma50[-window:] > sma200[-window:]
+        ).astype(np.int8)
+        # changes[i] != 0 when the state flipped on day -1-i (newest first)
+        changes = np.diff(above)[::-1]
+        flipped = changes != 0
+        if flipped.any():
+            i = int(np.argmax(flipped))
+            cross_signal = "golden_cross" if changes[i] > 0 else "death_cross"
             days_since_cross = i
-            idx_val = hist.index[idx]
-            cross_date = str(idx_val.date()) if hasattr(idx_val, "date") else str(idx_val)
-            break
-        elif not cur_above and prev_above:
-            cross_signal = "death_cross"
-            days_since_cross = i
-            idx_val = hist.index[idx]
-            cross_date = str(idx_val.date()) if hasattr(idx_val, "date") else str(idx_val)
-            break
+            cross_date = _date_str(dates[-1 - i])
 
     # SMA50 approaching SMA200 (gap < 2%)
     sma_gap = (
@@ -129,7 +193,7 @@ def check_trend_health(hist: Optional[pd.DataFrame]) -> dict:
     # RSI drop: was > 50 five days ago and now < 40
     rsi_drop = False
     if len(rsi_series) >= 6:
-        prev_rsi = float(rsi_series.iloc[-6])
+        prev_rsi = float(rsi_series[-6])
         if not np.isnan(prev_rsi) and prev_rsi > RSI_PREV_THRESHOLD and current_rsi < RSI_DROP_THRESHOLD:
             rsi_drop = True
 
@@ -148,11 +212,11 @@ def check_trend_health(hist: Optional[pd.DataFrame]) -> dict:
         "sma50_above_sma200": sma50_above_sma200,
         "dead_cross": dead_cross,
         "sma50_approaching_sma200": sma50_approaching,
-        "rsi": round(current_rsi, 2),
+        "rsi": current_rsi,
         "rsi_drop": rsi_drop,
-        "current_price": round(current_price, 2),
-        "sma50": round(current_sma50, 2),
-        "sma200": round(current_sma200, 2),
+        "current_price": current_price,
+        "sma50": current_sma50,
+        "sma200": current_sma200,
         "cross_signal": cross_signal,
         "days_since_cross": days_since_cross,
         "cross_date": cross_date,
@@ -183,7 +247,7 @@ def check_change_quality(stock_detail: dict) -> dict:
             "passed_count": 0,
             "indicators": {},
             "earnings_penalty": 0,
-            "quality_label": "対象外",
+            "quality_label": QUALITY_NA,
             "is_etf": True,
         }
 
@@ -194,11 +258,11 @@ def check_change_quality(stock_detail: dict) -> dict:
     passed_count = result["passed_count"]
 
     if passed_count >= 3:
-        quality_label = "良好"
+        quality_label = QUALITY_GOOD
     elif passed_count == 2:
-        quality_label = "1指標↓"
+        quality_label = QUALITY_ONE_DOWN
     else:
-        quality_label = "複数悪化"
+        quality_label = QUALITY_MULTI_DOWN
 
     return {
         "change_score": result["change_score"],
@@ -216,6 +280,31 @@ def check_change_quality(stock_detail: dict) -> dict:
     }
 
 
+@dataclass(frozen=True, slots=True)
+class _Fundamentals:
+    """Finite-or-None fundamentals shared by the per-holding checks."""
+
+    per: Optional[float] = None
+    pbr: Optional[float] = None
+    roe: Optional[float] = None
+    eps_growth: Optional[float] = None
+    revenue_growth: Optional[float] = None
+    dividend_yield: Optional[float] = None
+
+
+def _extract_fundamentals(stock_detail: dict | None) -> _Fundamentals:
+    """Read and normalise the valuation fields of *stock_detail* once."""
+    if not stock_detail:
+        return _Fundamentals()
+    get = stock_detail.get
+    return _Fundamentals(
+        per=finite_or_none(get("per")),
+        pbr=finite_or_none(get("pbr")),
+        roe=finite_or_none(get("roe")),
+        eps_growth=finite_or_none(get("eps_growth")),
+        revenue_growth=finite_or_none(get("revenue_growth")),
+        dividend_yield=finite_or_none(get("dividend_yield")),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -228,10 +317,18 @@ _LT_DIVIDEND_HIGH = th("health", "lt_dividend_high", 0.02)
 _LT_PER_OVERVALUED = th("health", "lt_per_overvalued", 40)
 _LT_PER_SAFE = th("health", "lt_per_safe", 25)
 
+# (status, score) by number of thresholds cleared, lowest first
+_LT_UNKNOWN = ("unknown", 0)
+_LT_ROE_CLASSES = (("low", 0), ("medium", 1), ("high", 2))
+_LT_EPS_CLASSES = (("declining", 0), ("flat", 1), ("growing", 2))
+_LT_DIVIDEND_CLASSES = (("low", 0), ("medium", 0.5), ("high", 1))
+_LT_PER_CLASSES = (("safe", 1), ("moderate", 0), ("overvalued", -1))
+
 
 def check_long_term_suitability(
     stock_detail: dict,
     shareholder_return_data: dict | None = None,
+    fundamentals: _Fundamentals | None = None,
 ) -> dict:
     """Evaluate long-term holding suitability from fundamental data.
 
@@ -246,6 +343,9 @@ def check_long_term_suitability(
         From calculate_shareholder_return(). When provided,
         total_return_rate (dividend + buyback) is used instead of
         dividend_yield alone.
+    fundamentals : _Fundamentals, optional
+        Values already extracted from *stock_detail* by
+        run_health_check(); extracted here when omitted.
 
     Returns
     -------
@@ -277,75 +377,57 @@ def check_long_term_suitability(
             "summary": "ETF",
         }
 
-    roe = finite_or_none(stock_detail.get("roe"))
-    eps_growth = finite_or_none(stock_detail.get("eps_growth"))
-    dividend_yield = finite_or_none(stock_detail.get("dividend_yield"))
-    per = finite_or_none(stock_detail.get("per"))
-
-    # --- ROE classification ---
-    if roe is None:
-        roe_status = "unknown"
-        roe_score = 0
-    elif roe >= _LT_ROE_HIGH:
-        roe_status = "high"
-        roe_score = 2
-    elif roe >= _LT_ROE_LOW:
-        roe_status = "medium"
-        roe_score = 1
-    else:
-        roe_status = "low"
-        roe_score = 0
-
-    # --- EPS Growth classification ---
-    if eps_growth is None:
-        eps_growth_status = "unknown"
-        eps_score = 0
-    elif eps_growth >= _LT_EPS_GROWTH_HIGH:
-        eps_growth_status = "growing"
-        eps_score = 2
-    elif eps_growth >= 0:
-        eps_growth_status = "flat"
-        eps_score = 1
-    else:
-        eps_growth_status = "declining"
-        eps_score = 0
+    f = fundamentals if fundamentals is not None else _extract_fundamentals(stock_detail)
 
-    # --- Shareholder return classification (KIK-403) ---
-    # Prefer total return rate (dividend + buyback) if available
+    # Prefer total return rate (dividend + buyback) if available (KIK-403)
     total_return_rate = None
     if shareholder_return_data is not None:
         total_return_rate = finite_or_none(
             shareholder_return_data.get("total_return_rate")
         )
-    return_metric = total_return_rate if total_return_rate is not None else dividend_yield
-    _used_total_return = total_return_rate is not None
-
-    if return_metric is None:
-        dividend_status = "unknown"
-        div_score = 0
-    elif return_metric >= _LT_DIVIDEND_HIGH:
-        dividend_status = "high"
-        div_score = 1
-    elif return_metric > 0:
-        dividend_status = "medium"
-        div_score = 0.5
-    else:
-        dividend_status = "low"
-        div_score = 0
-
-    # --- PER risk classification ---
-    if per is None:
-        per_risk = "unknown"
-        per_score = 0
-    elif per > _LT_PER_OVERVALUED:
-        per_risk = "overvalued"
-        per_score = -1
-    elif per <= _LT_PER_SAFE:
-        per_risk = "safe"
-        per_score = 1
-    else:
-        per_risk = "moderate"
-        per_score = 0
+    return_metric = total_return_rate if total_return_rate is not None else f.dividend_yield
+
+    (label, roe_status, eps_growth_status, dividend_status, per_risk,
+     total_score, summary) = _long_term_verdict(
+        f.roe, f.eps_growth, return_metric, total_return_rate is not None, f.per,
+    )
+    return {
+        "label": label,
+        "roe_status": roe_status,
+        "eps_growth_status": eps_growth_status,
+        "dividend_status": dividend_status,
+        "per_risk": per_risk,
+        "score": total_score,
+        "summary": summary,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _long_term_verdict(roe, eps_growth, return_metric, used_total_return, per) -> tuple:
+    """Classify one set of (finite or None) fundamentals.
+
+    Returns (label, roe_status, eps_growth_status, dividend_status,
+    per_risk, score, summary).
+    """
+    # Each status is picked by counting the thresholds the value clears
+    # (bool + bool) and indexing a (status, score) table.
+    roe_status, roe_score = (
+        _LT_UNKNOWN if roe is None
+        else _LT_ROE_CLASSES[(roe >= _LT_ROE_LOW) + (roe >= _LT_ROE_HIGH)]
+    )
+    eps_growth_status, eps_score = (
+        _LT_UNKNOWN if eps_growth is None
+        else _LT_EPS_CLASSES[(eps_growth >= 0) + (eps_growth >= _LT_EPS_GROWTH_HIGH)]
+    )
+    # Shareholder return (KIK-403)
+    dividend_status, div_score = (
+        _LT_UNKNOWN if return_metric is None
+        else _LT_DIVIDEND_CLASSES[(return_metric > 0) + (return_metric >= _LT_DIVIDEND_HIGH)]
+    )
+    per_risk, per_score = (
+        _LT_UNKNOWN if per is None
+        else _LT_PER_CLASSES[(per > _LT_PER_SAFE) + (per > _LT_PER_OVERVALUED)]
+    )
 
     total_score = roe_score + eps_score + div_score + per_score
 
@@ -370,7 +452,7 @@ def check_long_term_suitability(
     elif eps_growth_status == "declining":
         parts.append("EPS減少")
     if dividend_status == "high":
-        parts.append("高還元" if _used_total_return else "高配当")
+        parts.append("高還元" if used_total_return else "高配当")
     if per_risk == "overvalued":
         parts.append("割高PER")
     # Count unknown fields for summary
@@ -380,103 +462,105 @@ def check_long_term_suitability(
 
     summary = "・".join(parts) if parts else "データ不足"
 
-    return {
-        "label": label,
-        "roe_status": roe_status,
-        "eps_growth_status": eps_growth_status,
-        "dividend_status": dividend_status,
-        "per_risk": per_risk,
-        "score": total_score,
-        "summary": summary,
-    }
+    return (label, roe_status, eps_growth_status, dividend_status, per_risk,
+            total_score, summary)
 
 
 # Value trap detection extracted to src/core/value_trap.py (KIK-392)
 from src.core.value_trap import detect_value_trap as _detect_value_trap  # noqa: F401
-
-
-def compute_alert_level(
-    trend_health: dict,
-    change_quality: dict,
-    stock_detail=None,
-    return_stability: dict | None = None,
-) -> dict:
-    """Compute 3-level alert from trend and change quality.
-
-    Level priority: exit > caution > early_warning > none.
-
-    Returns
-    -------
-    dict
-        Keys: level, emoji, label, reasons.
-    """
+from src.core.value_trap import _value_trap_reasons
+
+
+def _value_trap_from(f: _Fundamentals) -> dict:
+    """detect_value_trap() for already-extracted fundamentals."""
+    reasons = _value_trap_reasons(f.per, f.pbr, f.roe, f.eps_growth, f.revenue_growth)
+    return {"is_trap": bool(reasons), "reasons": list(reasons)}
+
+
+# trend_health fields read by compute_alert_level(), in _alert_level()
+# argument order, with the defaults used when a key is missing
+_ALERT_TREND_DEFAULTS = {
+    "trend": "不明",
+    "dead_cross": False,
+    "rsi_drop": False,
+    "price_above_sma50": True,
+    "sma50_approaching_sma200": False,
+    "cross_signal": "none",
+    "days_since_cross": None,
+    "cross_date": None,
+    "sma50": 0,
+    "current_price": 0,
+    "rsi": 0,
+}
+_ALERT_TREND_FIELDS = operator.itemgetter(*_ALERT_TREND_DEFAULTS)
+
+
+def _display(value):
+    """Round a price/indicator to 2 decimals for a reason string."""
+    return round(value, 2) if isinstance(value, (int, float)) else value
+
+
+def _alert_level(
+    trend, dead_cross, rsi_drop, price_above_sma50, sma50_approaching,
+    cross_signal, days_since_cross, cross_date, sma50_val, price_val, rsi_val,
+    quality, trap_reasons, stability, stability_reason,
+) -> tuple[str, tuple[str, ...]]:
+    """Alert level and reasons for one set of extracted signals."""
     reasons: list[str] = []
     level = ALERT_NONE
 
-    trend = trend_health.get("trend", "不明")
-    quality_label = change_quality.get("quality_label", "良好")
-    dead_cross = trend_health.get("dead_cross", False)
-    rsi_drop = trend_health.get("rsi_drop", False)
-    price_above_sma50 = trend_health.get("price_above_sma50", True)
-    sma50_approaching = trend_health.get("sma50_approaching_sma200", False)
-    cross_signal = trend_health.get("cross_signal", "none")
-    days_since_cross = trend_health.get("days_since_cross")
-    cross_date = trend_health.get("cross_date")
-
-    if quality_label == "対象外":
+    if quality == _Q_NA:
         # ETF: evaluate technical conditions only (no quality data)
         if not price_above_sma50:
             level = ALERT_EARLY_WARNING
-            sma50_val = trend_health.get("sma50", 0)
-            price_val = trend_health.get("current_price", 0)
-            reasons.append(f"SMA50を下回り（現在{price_val}、SMA50={sma50_val}）")
+            reasons.append(
+                f"SMA50を下回り（現在{_display(price_val)}、SMA50={_display(sma50_val)}）"
+            )
         if dead_cross:
             level = ALERT_CAUTION
             reasons.append("デッドクロス")
         if rsi_drop:
             if level == ALERT_NONE:
                 level = ALERT_EARLY_WARNING
-            rsi_val = trend_health.get("rsi", 0)
-            reasons.append(f"RSI急低下（{rsi_val}）")
+            reasons.append(f"RSI急低下（{_display(rsi_val)}）")
     else:
         # --- EXIT ---
         # KIK-357: EXIT requires technical collapse AND fundamental deterioration.
         # Dead cross + good fundamentals = CAUTION (not EXIT).
-        if dead_cross and quality_label == "複数悪化":
+        if dead_cross and quality == _Q_MULTI_DOWN:
             level = ALERT_EXIT
             reasons.append("デッドクロス + 変化スコア複数悪化")
         elif dead_cross and trend == "下降":
-            if quality_label == "良好":
+            if quality == _Q_GOOD:
                 level = ALERT_CAUTION
                 reasons.append("デッドクロス（ファンダメンタル良好のためCAUTION）")
             else:
-                # quality_label is "1指標↓" — technical + fundamental confirm
+                # quality is _Q_ONE_DOWN (or unknown) — technical + fundamental confirm
                 level = ALERT_EXIT
                 reasons.append("トレンド崩壊（デッドクロス + ファンダ悪化）")
 
         # --- CAUTION ---
-        elif sma50_approaching and quality_label in ("1指標↓", "複数悪化"):
+        elif sma50_approaching and quality in (_Q_ONE_DOWN, _Q_MULTI_DOWN):
             level = ALERT_CAUTION
-            if quality_label == "複数悪化":
+            if quality == _Q_MULTI_DOWN:
                 reasons.append("変化スコア複数悪化")
             else:
                 reasons.append("変化スコア1指標悪化")
             reasons.append("SMA50がSMA200に接近")
-        elif quality_label == "複数悪化":
+        elif quality == _Q_MULTI_DOWN:
             level = ALERT_CAUTION
             reasons.append("変化スコア複数悪化")
 
         # --- EARLY WARNING ---
         elif not price_above_sma50:
             level = ALERT_EARLY_WARNING
-            sma50_val = trend_health.get("sma50", 0)
-            price_val = trend_health.get("current_price", 0)
-            reasons.append(f"SMA50を下回り（現在{price_val}、SMA50={sma50_val}）")
+            reasons.append(
+                f"SMA50を下回り（現在{_display(price_val)}、SMA50={_display(sma50_val)}）"
+            )
         elif rsi_drop:
             level = ALERT_EARLY_WARNING
-            rsi_val = trend_health.get("rsi", 0)
-            reasons.append(f"RSI急低下（{rsi_val}）")
-        elif quality_label == "1指標↓":
+            reasons.append(f"RSI急低下（{_display(rsi_val)}）")
+        elif quality == _Q_ONE_DOWN:
             level = ALERT_EARLY_WARNING
             reasons.append("変化スコア1指標悪化")
 
@@ -494,9 +578,8 @@ def compute_alert_level(
         )
 
     # Value trap detection (KIK-381)
-    value_trap = _detect_value_trap(stock_detail)
-    if value_trap["is_trap"]:
-        for reason in value_trap["reasons"]:
+    if trap_reasons:
+        for reason in trap_reasons:
             if reason not in reasons:
                 reasons.append(reason)
         # Escalate to at least EARLY_WARNING
@@ -504,38 +587,88 @@ def compute_alert_level(
             level = ALERT_EARLY_WARNING
 
     # Shareholder return stability (KIK-403)
+    if stability == "temporary":
+        reason_str = f"一時的高還元の可能性（{stability_reason}）"
+        if reason_str not in reasons:
+            reasons.append(reason_str)
+        if level == ALERT_NONE:
+            level = ALERT_EARLY_WARNING
+    elif stability == "decreasing":
+        reason_str = f"株主還元率が減少傾向（{stability_reason}）"
+        if reason_str not in reasons:
+            reasons.append(reason_str)
+
+    return level, tuple(reasons)
+
+
+def compute_alert_level(
+    trend_health: dict,
+    change_quality: dict,
+    stock_detail=None,
+    return_stability: dict | None = None,
+    value_trap: dict | None = None,
+) -> dict:
+    """Compute 3-level alert from trend and change quality.
+
+    Level priority: exit > caution > early_warning > none.
+    *value_trap* is a detect_value_trap() result already computed for
+    *stock_detail*; it is detected here when omitted.
+
+    Returns
+    -------
+    dict
+        Keys: level, emoji, label, reasons.
+    """
+    stability = None
+    stability_reason = None
     if return_stability is not None:
         stability = return_stability.get("stability")
         if stability == "temporary":
-            reason_text = return_stability.get("reason", "一時的高還元")
-            reason_str = f"一時的高還元の可能性（{reason_text}）"
-            if reason_str not in reasons:
-                reasons.append(reason_str)
-            if level == ALERT_NONE:
-                level = ALERT_EARLY_WARNING
+            stability_reason = return_stability.get("reason", "一時的高還元")
         elif stability == "decreasing":
-            reason_text = return_stability.get("reason", "還元率減少傾向")
-            reason_str = f"株主還元率が減少傾向（{reason_text}）"
-            if reason_str not in reasons:
-                reasons.append(reason_str)
-
-    level_map = {
-        ALERT_NONE: ("", "なし"),
-        ALERT_EARLY_WARNING: ("\u26a1", "早期警告"),
-        ALERT_CAUTION: ("\u26a0", "注意"),
-        ALERT_EXIT: ("\U0001f6a8", "撤退"),
-    }
-    emoji, label = level_map[level]
+            stability_reason = return_stability.get("reason", "還元率減少傾向")
+
+    if value_trap is None:
+        value_trap = _detect_value_trap(stock_detail)
+
+    level, reasons = _alert_level(
+        *_ALERT_TREND_FIELDS({**_ALERT_TREND_DEFAULTS, **trend_health}),
+        _QUALITY_CODES.get(change_quality.get("quality_label", QUALITY_GOOD), _Q_OTHER),
+        tuple(value_trap["reasons"]),
+        stability,
+        stability_reason,
+    )
+
+    emoji, label = _LEVEL_DISPLAY[level]
 
     return {
         "level": level,
         "emoji": emoji,
         "label": label,
-        "reasons": reasons,
+        "reasons": list(reasons),
     }
 
 
-def run_health_check(csv_path: str, client) -> dict:
+# Concurrent Yahoo fetches; each client call already sleeps 1s per request
+# for rate limiting, so keep the pool small.
+_FETCH_WORKERS = 8
+
+
+def _fetch_position_data(client, symbol: str) -> tuple:
+    """Fetch one holding and analyse its trend: (trend_health, stock_detail).
+
+    The trend is computed in the worker so it overlaps with the other
+    holdings' fetches, and the price history is dropped right away.
+    """
+    hist = client.get_price_history(symbol, period="1y")
+    trend_health = check_trend_health(hist)
+    stock_detail = client.get_stock_detail(symbol)
+    return trend_health, stock_detail
+
+
+def run_health_check(
+    csv_path: str, client, portfolio: list[dict] | None = None,
+) -> dict:
     """Run health check on all portfolio holdings.
 
     For each holding:
@@ -543,12 +676,19 @@ def run_health_check(csv_path: str, client) -> dict:
     2. Fetch stock detail -> change quality (alpha score)
     3. Compute alert level
 
+    The network fetches and trend analysis for all holdings run
+    concurrently up front; the rest then walks the holdings in portfolio
+    order.
+
     Parameters
     ----------
     csv_path : str
         Path to portfolio CSV.
     client
         yahoo_client module (get_price_history, get_stock_detail).
+    portfolio : list[dict] | None
+        Positions in load_portfolio() format; when given, *csv_path* is
+        not read.
 
     Returns
     -------
@@ -557,7 +697,7 @@ def run_health_check(csv_path: str, client) -> dict:
     """
     from src.core.portfolio.portfolio_manager import get_snapshot
 
-    snapshot = get_snapshot(csv_path, client)
+    snapshot = get_snapshot(csv_path, client, portfolio=portfolio)
     positions = snapshot.get("positions", [])
 
     empty_summary = {
@@ -575,22 +715,29 @@ def run_health_check(csv_path: str, client) -> dict:
     alerts: list[dict] = []
     counts = {"healthy": 0, "early_warning": 0, "caution": 0, "exit": 0}
 
-    for pos in positions:
+    # Skip cash positions (e.g., JPY.CASH, USD.CASH)
+    holdings = [pos for pos in positions if not _is_cash(pos["symbol"])]
+    fetched: list[tuple] = []
+    if holdings:
+        workers = min(_FETCH_WORKERS, len(holdings))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(
+                lambda pos: _fetch_position_data(client, pos["symbol"]),
+                holdings,
+            ))
+
+    for pos, (trend_health, stock_detail) in zip(holdings, fetched):
         symbol = pos["symbol"]
 
-        # Skip cash positions (e.g., JPY.CASH, USD.CASH)
-        if _is_cash(symbol):
-            continue
-
-        # 1. Trend analysis
-        hist = client.get_price_history(symbol, period="1y")
-        trend_health = check_trend_health(hist)
+        # 1. Trend analysis (computed in the fetch workers)
 
         # 2. Change quality
-        stock_detail = client.get_stock_detail(symbol)
         if stock_detail is None:
             stock_detail = {}
         change_quality = check_change_quality(stock_detail)
+        fundamentals = _extract_fundamentals(stock_detail)
+        # Value trap detection (KIK-381), shared by the alert and the result
+        value_trap = _value_trap_from(fundamentals)
 
         # 3. Shareholder return stability (KIK-403)
         sh_return = calculate_shareholder_return(stock_detail)
@@ -602,16 +749,15 @@ def run_health_check(csv_path: str, client) -> dict:
             trend_health, change_quality,
             stock_detail=stock_detail,
             return_stability=sh_stability,
+            value_trap=value_trap,
         )
 
         # 5. Long-term suitability (KIK-371, enhanced KIK-403)
         long_term = check_long_term_suitability(
             stock_detail, shareholder_return_data=sh_return,
+            fundamentals=fundamentals,
         )
 
-        # 6. Value trap detection (KIK-381)
-        value_trap = _detect_value_trap(stock_detail)
-
         result = {
             "symbol": symbol,
             "name": pos.get("name") or pos.get("memo", ""),
@@ -1,10 +1,62 @@
 """Backtest engine -- verify returns of previously screened stocks."""
 
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
-from statistics import median
+from functools import lru_cache
+
+import numpy as np
 
 from src.data.history_store import load_history
 
+# orjson: optional faster serializer for to_json_bytes() (stdlib json otherwise)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Concurrent get_stock_info() calls; the client rate-limits each request,
+# so keep the pool small.
+_FETCH_WORKERS = 8
+
+# Benchmark indices compared against in run_backtest()
+_BENCHMARKS = ("^N225", "^GSPC")
+
+# (client, symbol, start_date) -> (benchmark return, fetched_at)
+_benchmark_cache: dict[tuple, tuple[float, float]] = {}
+_BENCHMARK_TTL = 300.0  # re-fetch after 5 minutes
+
+# (max days back, yfinance period) -- shortest history covering start_date
+_BENCHMARK_PERIODS = ((28, "1mo"), (89, "3mo"), (181, "6mo"), (365, "1y"),
+                      (730, "2y"), (1826, "5y"))
+
+
+@dataclass(frozen=True, slots=True)
+class _ScreenedStock:
+    """Earliest screening record kept for one symbol."""
+
+    symbol: str
+    name: str
+    screen_date: str
+    score_at_screen: float
+    price_at_screen: float
+
+
+@lru_cache(maxsize=1)
+def _today_iso(stamp: int) -> str:
+    """Today's ISO date; *stamp* (the current minute) keys the cache."""
+    return date.today().isoformat()
+
+
+def _today() -> str:
+    """Today's ISO date, re-read from the clock at most once a minute."""
+    return _today_iso(int(time.time() // 60))
+
 
 def _get_benchmark_return(yahoo_client_module, symbol: str, start_date: str) -> float | None:
     """Calculate benchmark return from start_date to today.
@@ -13,9 +65,38 @@ def _get_benchmark_return(yahoo_client_module, symbol: str, start_date: str) ->
     the return between the closest available date to start_date and
     the most recent date.
 
+    Successful results are cached per process for ``_BENCHMARK_TTL``
+    seconds, so repeated backtests skip the history download.
+
     Returns None if data is unavailable.
     """
-    df = yahoo_client_module.get_price_history(symbol, period="1y")
+    key = (yahoo_client_module, symbol, start_date)
+    now = time.time()
+    cached = _benchmark_cache.get(key)
+    if cached is not None and (now - cached[1]) < _BENCHMARK_TTL:
+        return cached[0]
+
+    result = _fetch_benchmark_return(yahoo_client_module, symbol, start_date)
+    if result is not None:
+        _benchmark_cache[key] = (result, now)
+    return result
+
+
+def _benchmark_period(start_date: str) -> str:
+    """Shortest get_price_history() period reaching back to start_date."""
+    try:
+        days = (date.fromisoformat(_today()) - date.fromisoformat(start_date)).days
+    except (TypeError, ValueError):
+        return "1y"
+    for max_days, period in _BENCHMARK_PERIODS:
+        if days <= max_days:
+            return period
+    return "max"
+
+
+def _fetch_benchmark_return(yahoo_client_module, symbol: str, start_date: str) -> float | None:
+    """Download benchmark closes and return first-to-last change (or None)."""
+    df = yahoo_client_module.get_price_history(symbol, period=_benchmark_period(start_date))
     if df is None or df.empty or "Close" not in df.columns:
         return None
 
@@ -40,13 +121,15 @@ def run_backtest(
     region: str | None = None,
     days_back: int = 90,
     base_dir: str = "data/history",
+    max_workers: int = _FETCH_WORKERS,
 ) -> dict:
     """Run return verification on accumulated screening data.
 
     Parameters
     ----------
     yahoo_client_module
-        The yahoo_client module. Uses get_stock_info(symbol) to fetch
+        The yahoo_client module. Uses get_quotes_batch(symbols), with
+        get_stock_info(symbol) as the per-symbol fallback, to fetch
         current prices.
     category : str
         Category to verify. Currently only "screen" is supported.
@@ -58,69 +141,88 @@ def run_backtest(
         How many days back to include. Default 90.
     base_dir : str
         Root history directory. Pass tmp_path in tests.
+    max_workers : int
+        Maximum number of concurrent fetches (benchmark histories and
+        get_stock_info() fallbacks).
 
     Returns
     -------
     dict
         Backtest results with period, stocks, summary stats, and benchmarks.
     """
-    # 1. Load screening history
-    history = load_history(category, days_back=days_back, base_dir=base_dir)
-
-    # 2. Filter by preset/region
-    if preset is not None:
-        history = [h for h in history if h.get("preset") == preset]
-    if region is not None:
-        history = [h for h in history if h.get("region") == region]
+    # 1-2. Load screening history, filtered by preset/region while reading
+    history = load_history(
+        category, days_back=days_back, base_dir=base_dir,
+        preset=preset, region=region,
+    )
 
     if not history:
         return _empty_result(days_back)
 
-    # 3. Expand stocks from all screening results, keeping earliest record
-    # symbol -> {symbol, name, screen_date, score_at_screen, price_at_screen}
-    seen: dict[str, dict] = {}
+    # 3. Expand stocks from all screening results, keeping earliest record.
+    # Walking the history oldest-first (stable sort) makes the first record
+    # seen for a symbol the earliest one.
+    seen: dict[str, _ScreenedStock] = {}
     total_screens = len(history)
+    history.sort(key=lambda h: h.get("date", ""))
 
     for record in history:
         screen_date = record.get("date", "")
         for stock in record.get("results", []):
-            symbol = stock.get("symbol")
-            if not symbol:
+            get = stock.get
+            symbol = get("symbol")
+            if not symbol or symbol in seen:
                 continue
-            price = stock.get("price")
+            price = get("price")
             if price is None or price <= 0:
                 continue
 
-            if symbol not in seen or screen_date < seen[symbol]["screen_date"]:
-                seen[symbol] = {
-                    "symbol": symbol,
-                    "name": stock.get("name", ""),
-                    "screen_date": screen_date,
-                    "score_at_screen": stock.get("value_score", 0),
-                    "price_at_screen": price,
-                }
+            seen[symbol] = _ScreenedStock(
+                symbol, get("name", ""), screen_date, get("value_score", 0), price,
+            )
 
     if not seen:
         return _empty_result(days_back)
 
-    # 4. Get current prices and compute returns
+    # 4. Get current prices and compute returns. Prices come from batched
+    # quote requests; symbols the batch could not price fall back to
+    # get_stock_info(), fetched concurrently.
+    # The benchmark histories are fetched alongside, for the earliest
+    # screen date; that is the backtest start unless its stocks all drop out.
+    entries = list(seen.values())
+    expected_start = min(entry.screen_date for entry in entries)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        benchmark_futures = {
+            symbol: pool.submit(
+                _get_benchmark_return, yahoo_client_module, symbol, expected_start,
+            )
+            for symbol in _BENCHMARKS
+        }
+        quotes = yahoo_client_module.get_quotes_batch(list(seen))
+        infos = [quotes.get(entry.symbol) for entry in entries]
+        missing = [i for i, info in enumerate(infos) if info is None]
+        fetched = pool.map(
+            lambda i: yahoo_client_module.get_stock_info(entries[i].symbol),
+            missing,
+        )
+        for i, info in zip(missing, fetched):
+            infos[i] = info
+
     stocks = []
-    for entry in seen.values():
-        symbol = entry["symbol"]
-        info = yahoo_client_module.get_stock_info(symbol)
+    for entry, info in zip(entries, infos):
         if info is None:
             continue
         price_now = info.get("price")
         if price_now is None or price_now <= 0:
             continue
 
-        return_pct = (price_now - entry["price_at_screen"]) / entry["price_at_screen"]
+        return_pct = (price_now - entry.price_at_screen) / entry.price_at_screen
         stocks.append({
-            "symbol": symbol,
-            "name": entry["name"],
-            "screen_date": entry["screen_date"],
-            "score_at_screen": entry["score_at_screen"],
-            "price_at_screen": entry["price_at_screen"],
+            "symbol": entry.symbol,
+            "name": entry.name,
+            "screen_date": entry.screen_date,
+            "score_at_screen": entry.score_at_screen,
+            "price_at_screen": entry.price_at_screen,
             "price_now": price_now,
             "return_pct": return_pct,
         })
@@ -128,23 +230,30 @@ def run_backtest(
     if not stocks:
         return _empty_result(days_back)
 
-    # Sort by return descending
-    stocks.sort(key=lambda s: s["return_pct"], reverse=True)
+    returns = np.fromiter(
+        (s["return_pct"] for s in stocks), dtype=np.float64, count=len(stocks),
+    )
+
+    # Sort by return descending (stable, so ties keep their order)
+    order = np.argsort(-returns, kind="stable")
+    stocks = [stocks[i] for i in order]
 
     # 5. Compute summary stats
-    returns = [s["return_pct"] for s in stocks]
-    avg_return = sum(returns) / len(returns)
-    median_return = median(returns)
-    win_rate = sum(1 for r in returns if r > 0) / len(returns)
+    avg_return = float(returns.mean())
+    median_return = float(np.median(returns))
+    win_rate = float((returns > 0).mean())
 
     # 6. Determine period
-    screen_dates = [s["screen_date"] for s in stocks]
-    start_date = min(screen_dates)
-    end_date = date.today().isoformat()
+    start_date = min(s["screen_date"] for s in stocks)
+    end_date = _today()
 
     # 7. Benchmark returns
-    nikkei_return = _get_benchmark_return(yahoo_client_module, "^N225", start_date)
-    sp500_return = _get_benchmark_return(yahoo_client_module, "^GSPC", start_date)
+    if start_date == expected_start:
+        nikkei_return = benchmark_futures["^N225"].result()
+        sp500_return = benchmark_futures["^GSPC"].result()
+    else:
+        nikkei_return = _get_benchmark_return(yahoo_client_module, "^N225", start_date)
+        sp500_return = _get_benchmark_return(yahoo_client_module, "^GSPC", start_date)
 
     benchmark = {
         "nikkei": nikkei_return,
@@ -170,10 +279,10 @@ def run_backtest(
 
 def _empty_result(days_back: int) -> dict:
     """Return an empty result dict when no data is available."""
-    end = date.today()
-    start = end - timedelta(days=days_back)
+    end = _today()
+    start = date.fromisoformat(end) - timedelta(days=days_back)
     return {
-        "period": {"start": start.isoformat(), "end": end.isoformat()},
+        "period": {"start": start.isoformat(), "end": end},
         "total_screens": 0,
         "total_stocks": 0,
         "stocks": [],
@@ -184,3 +293,36 @@ def _empty_result(days_back: int) -> dict:
         "alpha_nikkei": None,
         "alpha_sp500": None,
     }
+
+
+def _json_default(obj):
+    """Convert numpy scalars/arrays for the stdlib json fallback."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite_or_null(obj):
+    """Replace NaN/Inf floats with None, recursing into dicts and lists."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_null(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_null(v) for v in obj]
+    return obj
+
+
+def to_json_bytes(result: dict) -> bytes:
+    """Serialize a run_backtest() result to UTF-8 JSON bytes.
+
+    Uses orjson when installed (numpy values serialized natively) and
+    stdlib json otherwise. Prefer this over json.dumps() for results with
+    many stock rows. Non-finite floats are written as null either way.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        _finite_or_null(result), ensure_ascii=False, separators=(",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
@@ -4,10 +4,19 @@ Provides HHI (Herfindahl-Hirschman Index) calculation and
 multi-axis concentration analysis for sector, region, and currency.
 """
 
+from collections import defaultdict
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 
-def compute_hhi(weights: list[float]) -> float:
+# Below this many weights the plain Python sum beats numpy's call overhead
+_HHI_NUMPY_MIN = 16
+# Holdings from which _group_axes() groups with factorize + bincount
+_GROUP_NUMPY_MIN = 500
+
+
+def compute_hhi(weights: "list[float] | np.ndarray") -> float:
     """Compute the Herfindahl-Hirschman Index for a set of weights.
 
     HHI = sum(w_i^2) for each weight w_i.
@@ -15,17 +24,24 @@ def compute_hhi(weights: list[float]) -> float:
 
     Parameters
     ----------
-    weights : list[float]
-        Portfolio weights that should sum to approximately 1.0.
+    weights : list[float] | np.ndarray
+        Portfolio weights that should sum to approximately 1.0. Arrays
+        (float32 included) are used directly and summed in float64.
 
     Returns
     -------
     float
         HHI value between 0 and 1.
     """
+    if isinstance(weights, np.ndarray):
+        a = weights.astype(np.float64, copy=False).ravel()
+        return float(a @ a)
     if not weights:
         return 0.0
-    return sum(w * w for w in weights)
+    if len(weights) < _HHI_NUMPY_MIN:
+        return sum(w * w for w in weights)
+    a = np.asarray(weights, dtype=np.float64)
+    return float(a @ a)
 
 
 def get_concentration_multiplier(hhi: float) -> float:
@@ -48,51 +64,96 @@ def get_concentration_multiplier(hhi: float) -> float:
     float
         Concentration multiplier (1.0 to 1.6).
     """
-    if hhi < 0.25:
-        return 1.0
-    if hhi <= 0.50:
+    # Clamp into [0.25, 1.0]; the lower clamp yields exactly 1.0
+    x = min(max(hhi, 0.25), 1.00)
+    if x <= 0.50:
         # Linear interpolation: 0.25 -> 1.0, 0.50 -> 1.3
-        return 1.0 + (hhi - 0.25) / (0.50 - 0.25) * (1.3 - 1.0)
-    # hhi > 0.50: Linear interpolation: 0.50 -> 1.3, 1.00 -> 1.6
-    multiplier = 1.3 + (hhi - 0.50) / (1.00 - 0.50) * (1.6 - 1.3)
-    return min(multiplier, 1.6)
+        return 1.0 + (x - 0.25) / (0.50 - 0.25) * (1.3 - 1.0)
+    # Linear interpolation: 0.50 -> 1.3, 1.00 -> 1.6
+    return min(1.3 + (x - 0.50) / (1.00 - 0.50) * (1.6 - 1.3), 1.6)
+
+
+def get_concentration_multiplier_vec(hhi) -> np.ndarray:
+    """Vectorised get_concentration_multiplier() for an array of HHI values.
+
+    Parameters
+    ----------
+    hhi : array-like
+        HHI values (e.g. one per stress-test scenario).
+
+    Returns
+    -------
+    np.ndarray
+        float64 multipliers, element-wise equal to the scalar function.
+    """
+    x = np.clip(np.asarray(hhi, dtype=np.float64), 0.25, 1.00)
+    low = 1.0 + (x - 0.25) / (0.50 - 0.25) * (1.3 - 1.0)
+    high = np.minimum(1.3 + (x - 0.50) / (1.00 - 0.50) * (1.6 - 1.3), 1.6)
+    return np.where(x <= 0.50, low, high)
 
 
-def _compute_axis_hhi(
+def _group_sum_np(labels: list, weights_arr: np.ndarray) -> tuple[np.ndarray, list]:
+    """Sum ``weights_arr`` per label: (group sums, labels in first-seen order).
+
+    NaN labels form their own group, as they do in the dict path, rather
+    than getting the -1 code that bincount rejects.
+    """
+    codes, uniques = pd.factorize(
+        np.asarray(labels, dtype=object), sort=False, use_na_sentinel=False,
+    )
+    sums = np.bincount(codes, weights=weights_arr, minlength=len(uniques))
+    return sums, uniques.tolist()
+
+
+def _group_axes(
     portfolio_data: list[dict],
-    weights: list[float],
-    key: str,
+    weights: list[float] | np.ndarray,
+    keys: tuple[str, ...],
     default_label: str = "Unknown",
-) -> tuple[float, dict[str, float]]:
-    """Compute HHI along a single axis (sector, country, or currency).
+) -> list[dict[str, float]]:
+    """Group portfolio weights along several axes in one pass.
 
-    Groups portfolio weights by the given ``key`` and calculates HHI
-    on the grouped weights.
+    Each stock dict is visited once and its weight is added to the
+    category named by every key in ``keys``.
 
     Parameters
     ----------
     portfolio_data : list[dict]
-        Per-stock data dicts.  Each must contain the field named ``key``.
-    weights : list[float]
+        Per-stock data dicts.
+    weights : list[float] or np.ndarray
         Portfolio weights aligned with ``portfolio_data``.
-    key : str
-        The dict key to group by (e.g. ``"sector"``, ``"country"``, ``"currency"``).
+    keys : tuple[str, ...]
+        The dict keys to group by (e.g. ``("sector", "currency")``).
     default_label : str
-        Label used when the key is missing or None.
+        Label used when a key is missing or None.
 
     Returns
     -------
-    tuple[float, dict[str, float]]
-        ``(hhi, breakdown)`` where breakdown maps category -> summed weight.
+    list[dict[str, float]]
+        One breakdown (category -> summed weight) per key, in ``keys`` order.
     """
-    breakdown: dict[str, float] = {}
+    if len(portfolio_data) >= _GROUP_NUMPY_MIN:
+        # Large portfolios: integer-code each axis and bincount in C
+        n = min(len(portfolio_data), len(weights))
+        weights_arr = np.asarray(weights[:n], dtype=np.float64)
+        rows = portfolio_data[:n]
+        out = []
+        for key in keys:
+            sums, labels = _group_sum_np(
+                [stock.get(key) or default_label for stock in rows], weights_arr,
+            )
+            out.append(dict(zip(labels, sums.tolist())))
+        return out
+
+    if isinstance(weights, np.ndarray):
+        weights = weights.tolist()
+    grouped = [defaultdict(float) for _ in keys]
+    axes = list(zip(keys, grouped))
     for stock, w in zip(portfolio_data, weights):
-        label = stock.get(key) or default_label
-        breakdown[label] = breakdown.get(label, 0.0) + w
-
-    group_weights = list(breakdown.values())
-    hhi = compute_hhi(group_weights)
-    return hhi, breakdown
+        get = stock.get
+        for key, breakdown in axes:
+            breakdown[get(key) or default_label] += w
+    return [dict(breakdown) for breakdown in grouped]
 
 
 def _classify_risk_level(hhi: float) -> str:
@@ -117,7 +178,7 @@ def _classify_risk_level(hhi: float) -> str:
 
 def analyze_concentration(
     portfolio_data: list[dict],
-    weights: list[float],
+    weights: list[float] | np.ndarray,
 ) -> dict:
     """Perform multi-axis concentration analysis on a portfolio.
 
@@ -129,7 +190,7 @@ def analyze_concentration(
     portfolio_data : list[dict]
         Per-stock data dicts.  Expected keys per stock:
         ``sector``, ``country`` (or ``region``), ``currency``.
-    weights : list[float]
+    weights : list[float] or np.ndarray
         Portfolio weights aligned with ``portfolio_data``.
         Should sum to approximately 1.0.
 
@@ -149,34 +210,31 @@ def analyze_concentration(
             "risk_level": str,            # "分散", "やや集中", "危険な集中"
         }
     """
-    # Sector HHI
-    sector_hhi, sector_breakdown = _compute_axis_hhi(
-        portfolio_data, weights, "sector", default_label="不明"
-    )
-
-    # Region HHI -- try "country" first, fall back to "region"
-    region_hhi, region_breakdown = _compute_axis_hhi(
-        portfolio_data, weights, "country", default_label="不明"
-    )
-    # If all ended up "不明", try the "region" key instead
-    if list(region_breakdown.keys()) == ["不明"]:
-        region_hhi, region_breakdown = _compute_axis_hhi(
-            portfolio_data, weights, "region", default_label="不明"
+    # Group every axis in a single pass over the holdings. Region uses
+    # "country", falling back to "region" when no holding has a country.
+    sector_breakdown, country_breakdown, region_key_breakdown, currency_breakdown = (
+        _group_axes(
+            portfolio_data, weights,
+            ("sector", "country", "region", "currency"),
+            default_label="不明",
         )
-
-    # Currency HHI
-    currency_hhi, currency_breakdown = _compute_axis_hhi(
-        portfolio_data, weights, "currency", default_label="不明"
     )
-
-    # Determine the axis with the highest HHI
-    axes = {
-        "sector": sector_hhi,
-        "region": region_hhi,
-        "currency": currency_hhi,
-    }
-    max_hhi_axis = max(axes, key=axes.get)
-    max_hhi = axes[max_hhi_axis]
+    if list(country_breakdown.keys()) == ["不明"]:
+        region_breakdown = region_key_breakdown
+    else:
+        region_breakdown = country_breakdown
+
+    sector_hhi = compute_hhi(list(sector_breakdown.values()))
+    region_hhi = compute_hhi(list(region_breakdown.values()))
+    currency_hhi = compute_hhi(list(currency_breakdown.values()))
+
+    # Determine the axis with the highest HHI (ties: sector > region > currency)
+    if sector_hhi >= region_hhi and sector_hhi >= currency_hhi:
+        max_hhi_axis, max_hhi = "sector", sector_hhi
+    elif region_hhi >= currency_hhi:
+        max_hhi_axis, max_hhi = "region", region_hhi
+    else:
+        max_hhi_axis, max_hhi = "currency", currency_hhi
 
     concentration_multiplier = get_concentration_multiplier(max_hhi)
     risk_level = _classify_risk_level(max_hhi)
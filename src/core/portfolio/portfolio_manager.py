@@ -4,12 +4,15 @@ Provides CSV-based portfolio management with position tracking,
 real-time pricing, P&L calculation, and structural analysis.
 """
 
-import copy
 import csv
 import os
-from datetime import datetime
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import Optional
 
+import numpy as np
+
 from src.core.common import is_cash as _is_cash
 from src.core.ticker_utils import (
     SUFFIX_TO_REGION as _SUFFIX_TO_COUNTRY,
@@ -42,6 +45,23 @@ CSV_COLUMNS = [
     "memo",
 ]
 
+# load_portfolio() switches to the pandas parser from this file size on
+_FAST_LOAD_MIN_BYTES = 256 * 1024
+
+# Parsed portfolios keyed by path: ((mtime_ns, size), positions).
+# load_portfolio() hands out copies, save_portfolio() drops the entry.
+_portfolio_cache: dict[str, tuple[tuple[int, int], list[dict]]] = {}
+
+# Values for columns absent from an older CSV header
+_CSV_DEFAULTS = {
+    "symbol": "",
+    "shares": "0",
+    "cost_price": "0.0",
+    "cost_currency": "JPY",
+    "purchase_date": "",
+    "memo": "",
+}
+
 # FX pairs to fetch for JPY conversion
 _FX_PAIRS = [
     "USDJPY=X",
@@ -63,6 +83,10 @@ _FX_PAIRS = [
 ]
 
 
+# Concurrent client calls in get_snapshot() / get_portfolio_shareholder_return()
+_FETCH_WORKERS = 8
+
+
 def _fx_symbol_for_currency(currency: str) -> Optional[str]:
     """Return the yfinance FX pair symbol for converting currency to JPY."""
     if currency == "JPY":
@@ -86,27 +110,117 @@ def load_portfolio(csv_path: str = DEFAULT_CSV_PATH) -> list[dict]:
         ファイルが存在しない場合は空リストを返す。
     """
     csv_path = os.path.normpath(csv_path)
-    if not os.path.exists(csv_path):
+    try:
+        st = os.stat(csv_path)
+    except OSError:
         return []
 
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _portfolio_cache.get(csv_path)
+    if cached is not None and cached[0] == key:
+        return [dict(p) for p in cached[1]]
+
+    if st.st_size >= _FAST_LOAD_MIN_BYTES:
+        portfolio = load_portfolio_fast(csv_path)
+    else:
+        portfolio = _load_portfolio_csv(csv_path)
+    _portfolio_cache[csv_path] = (key, [dict(p) for p in portfolio])
+    return portfolio
+
+
+def _load_portfolio_csv(csv_path: str) -> list[dict]:
+    """Parse the portfolio CSV with the csv module."""
     portfolio: list[dict] = []
     with open(csv_path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Column positions by name; columns missing from the header read
+        # their default from cells appended after the row
+        col = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        extra: list[str] = []
+        for name in CSV_COLUMNS:
+            if name not in col:
+                col[name] = width + len(extra)
+                extra.append(_CSV_DEFAULTS[name])
+        i_symbol, i_shares, i_cost, i_currency, i_date, i_memo = (
+            col[name] for name in CSV_COLUMNS
+        )
         for row in reader:
-            position = {
-                "symbol": row.get("symbol", "").strip(),
-                "shares": int(float(row.get("shares", 0))),
-                "cost_price": float(row.get("cost_price", 0.0)),
-                "cost_currency": row.get("cost_currency", "JPY").strip(),
-                "purchase_date": row.get("purchase_date", "").strip(),
-                "memo": row.get("memo", "").strip(),
-            }
-            if position["symbol"] and position["shares"] > 0:
-                portfolio.append(position)
+            if not row:
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            if extra:
+                row += extra
+            symbol = row[i_symbol].strip()
+            shares = int(float(row[i_shares]))
+            if symbol and shares > 0:
+                portfolio.append({
+                    "symbol": symbol,
+                    "shares": shares,
+                    "cost_price": float(row[i_cost]),
+                    "cost_currency": row[i_currency].strip(),
+                    "purchase_date": row[i_date].strip(),
+                    "memo": row[i_memo].strip(),
+                })
 
     return portfolio
 
 
+def load_portfolio_fast(csv_path: str = DEFAULT_CSV_PATH) -> list[dict]:
+    """load_portfolio() using pandas' C parser (large CSVs).
+
+    Returns the same list[dict] as load_portfolio(). purchase_date stays
+    a string. Falls back to the csv module if pandas is unavailable.
+    """
+    csv_path = os.path.normpath(csv_path)
+    if not os.path.exists(csv_path):
+        return []
+    try:
+        import pandas as pd
+    except ImportError:
+        return _load_portfolio_csv(csv_path)
+
+    try:
+        with warnings.catch_warnings():
+            # Rows with extra fields are truncated, as csv.reader rows are
+            warnings.simplefilter("ignore", pd.errors.ParserWarning)
+            df = pd.read_csv(
+                csv_path,
+                encoding="utf-8",
+                dtype={name: ("float64" if name in ("shares", "cost_price") else str)
+                       for name in CSV_COLUMNS},
+                keep_default_na=False,
+                parse_dates=False,
+                index_col=False,
+            )
+    except pd.errors.EmptyDataError:
+        return []
+    except (pd.errors.ParserError, ValueError):
+        return _load_portfolio_csv(csv_path)
+    for name in CSV_COLUMNS:
+        if name not in df.columns:
+            df[name] = _CSV_DEFAULTS[name]
+
+    try:
+        shares = df["shares"].astype("float64").astype("int64")
+        out = pd.DataFrame({
+            "symbol": df["symbol"].str.strip(),
+            "shares": shares,
+            "cost_price": df["cost_price"].astype("float64"),
+            "cost_currency": df["cost_currency"].str.strip(),
+            "purchase_date": df["purchase_date"].str.strip(),
+            "memo": df["memo"].str.strip(),
+        })
+    except (pd.errors.ParserError, ValueError):
+        return _load_portfolio_csv(csv_path)
+    out = out[(out["symbol"] != "") & (shares > 0)]
+    return out.to_dict("records")
+
+
 def save_portfolio(
     portfolio: list[dict], csv_path: str = DEFAULT_CSV_PATH
 ) -> None:
@@ -116,21 +230,22 @@ def save_portfolio(
     """
     csv_path = os.path.normpath(csv_path)
     os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    _portfolio_cache.pop(csv_path, None)
 
     with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for pos in portfolio:
-            writer.writerow(
-                {
-                    "symbol": pos.get("symbol", ""),
-                    "shares": pos.get("shares", 0),
-                    "cost_price": pos.get("cost_price", 0.0),
-                    "cost_currency": pos.get("cost_currency", "JPY"),
-                    "purchase_date": pos.get("purchase_date", ""),
-                    "memo": pos.get("memo", ""),
-                }
-            )
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(
+            [
+                pos.get("symbol", ""),
+                pos.get("shares", 0),
+                pos.get("cost_price", 0.0),
+                pos.get("cost_currency", "JPY"),
+                pos.get("purchase_date", ""),
+                pos.get("memo", ""),
+            ]
+            for pos in portfolio
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -138,6 +253,14 @@ def save_portfolio(
 # ---------------------------------------------------------------------------
 
 
+def _index_portfolio(portfolio: list[dict]) -> dict[str, int]:
+    """Map upper-cased symbol -> index of its first row in *portfolio*."""
+    index: dict[str, int] = {}
+    for i, pos in enumerate(portfolio):
+        index.setdefault(pos["symbol"].upper(), i)
+    return index
+
+
 def add_position(
     csv_path: str,
     symbol: str,
@@ -160,16 +283,13 @@ def add_position(
         更新後のポジション dict
     """
     if purchase_date is None:
-        purchase_date = datetime.now().strftime("%Y-%m-%d")
+        purchase_date = date.today().isoformat()
 
     portfolio = load_portfolio(csv_path)
 
     # Search for existing position with same symbol
-    existing = None
-    for pos in portfolio:
-        if pos["symbol"].upper() == symbol.upper():
-            existing = pos
-            break
+    idx = _index_portfolio(portfolio).get(symbol.upper())
+    existing = portfolio[idx] if idx is not None else None
 
     if existing is not None:
         # 既存ポジションへの追加購入 → 平均取得単価を再計算
@@ -233,11 +353,7 @@ def sell_position(
     """
     portfolio = load_portfolio(csv_path)
 
-    target_idx = None
-    for i, pos in enumerate(portfolio):
-        if pos["symbol"].upper() == symbol.upper():
-            target_idx = i
-            break
+    target_idx = _index_portfolio(portfolio).get(symbol.upper())
 
     if target_idx is None:
         raise ValueError(f"銘柄 {symbol} はポートフォリオに存在しません。")
@@ -278,9 +394,8 @@ def sell_position(
     purchase_date = target.get("purchase_date", "")
     if sell_date and purchase_date:
         try:
-            from datetime import date as _date
-            d1 = _date.fromisoformat(purchase_date)
-            d2 = _date.fromisoformat(sell_date)
+            d1 = date.fromisoformat(purchase_date)
+            d2 = date.fromisoformat(sell_date)
             result["hold_days"] = (d2 - d1).days
         except (ValueError, TypeError):
             result["hold_days"] = None
@@ -328,21 +443,16 @@ def get_performance_review(
 
     all_trades = load_history("trade", base_dir=base_dir)
 
-    # sell かつ realized_pnl があるものだけ
+    # sell かつ realized_pnl があるもの + year / symbol フィルタ (1 pass)
+    year_prefix = str(year) if year is not None else None
+    sym_upper = symbol.upper() if symbol is not None else None
     sells = [
         t for t in all_trades
         if t.get("trade_type") == "sell" and t.get("realized_pnl") is not None
+        and (year_prefix is None or str(t.get("date", "")).startswith(year_prefix))
+        and (sym_upper is None or t.get("symbol", "").upper() == sym_upper)
     ]
 
-    # year フィルタ
-    if year is not None:
-        sells = [t for t in sells if str(t.get("date", "")).startswith(str(year))]
-
-    # symbol フィルタ
-    if symbol is not None:
-        sym_upper = symbol.upper()
-        sells = [t for t in sells if t.get("symbol", "").upper() == sym_upper]
-
     # 統計計算
     total = len(sells)
     if total == 0:
@@ -358,16 +468,30 @@ def get_performance_review(
             },
         }
 
-    wins = sum(1 for t in sells if (t.get("realized_pnl") or 0) > 0)
-    win_rate = wins / total
-
-    pnl_rates_stored = [t["pnl_rate"] for t in sells if t.get("pnl_rate") is not None]
-    avg_return = sum(pnl_rates_stored) / len(pnl_rates_stored) if pnl_rates_stored else None
+    # 1 pass で集計
+    wins = 0
+    rate_sum = 0.0
+    rate_count = 0
+    hold_sum = 0
+    hold_count = 0
+    total_pnl = 0
+    for t in sells:
+        pnl = t["realized_pnl"]
+        if pnl > 0:
+            wins += 1
+        total_pnl += pnl
+        rate = t.get("pnl_rate")
+        if rate is not None:
+            rate_sum += rate
+            rate_count += 1
+        hold_days = t.get("hold_days")
+        if hold_days is not None:
+            hold_sum += hold_days
+            hold_count += 1
 
-    hold_days_list = [t["hold_days"] for t in sells if t.get("hold_days") is not None]
-    avg_hold_days = sum(hold_days_list) / len(hold_days_list) if hold_days_list else None
-
-    total_pnl = sum(t.get("realized_pnl", 0) or 0 for t in sells)
+    win_rate = wins / total
+    avg_return = rate_sum / rate_count if rate_count else None
+    avg_hold_days = hold_sum / hold_count if hold_count else None
 
     return {
         "trades": sells,
@@ -387,11 +511,34 @@ def get_performance_review(
 # ---------------------------------------------------------------------------
 
 
+def _fetch_fx_rate(client, pair: str) -> Optional[float]:
+    """Fetch one FX pair's price, or None (with a warning) if unavailable."""
+    try:
+        info = client.get_stock_info(pair)
+        if info is not None and info.get("price") is not None:
+            return float(info["price"])
+        print(f"[portfolio_manager] Warning: FX rate for {pair} unavailable")
+    except Exception as e:
+        print(f"[portfolio_manager] Warning: FX rate fetch error for {pair}: {e}")
+    return None
+
+
+def _fx_rates_from(pairs: list[str], prices) -> dict:
+    """Build the get_fx_rates() dict from FX pairs and their fetched prices."""
+    rates: dict[str, float] = {"JPY": 1.0}
+    for pair, price in zip(pairs, prices):
+        if price is not None:
+            # pair format: "USDJPY=X" -> currency = "USD"
+            rates[pair.replace("JPY=X", "")] = price
+    return rates
+
+
 def get_fx_rates(client) -> dict:
     """主要為替レートを取得。
 
     yfinance で USDJPY=X 等を取得。JPYは1.0固定。
     client は yahoo_client モジュール（get_stock_info を持つ）。
+    各通貨ペアは最大 _FETCH_WORKERS 並列で取得する。
 
     Returns
     -------
@@ -399,21 +546,9 @@ def get_fx_rates(client) -> dict:
         {"JPY": 1.0, "USD": 150.5, "SGD": 112.3, ...}
         1通貨単位あたりの円。取得失敗した通貨は含まれない。
     """
-    rates: dict[str, float] = {"JPY": 1.0}
-
-    for pair in _FX_PAIRS:
-        # pair format: "USDJPY=X" -> currency = "USD"
-        currency = pair.replace("JPY=X", "")
-        try:
-            info = client.get_stock_info(pair)
-            if info is not None and info.get("price") is not None:
-                rates[currency] = float(info["price"])
-            else:
-                print(f"[portfolio_manager] Warning: FX rate for {pair} unavailable")
-        except Exception as e:
-            print(f"[portfolio_manager] Warning: FX rate fetch error for {pair}: {e}")
-
-    return rates
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        prices = list(pool.map(lambda pair: _fetch_fx_rate(client, pair), _FX_PAIRS))
+    return _fx_rates_from(_FX_PAIRS, prices)
 
 
 def _get_fx_rate_for_currency(
@@ -435,7 +570,9 @@ def _get_fx_rate_for_currency(
 # ---------------------------------------------------------------------------
 
 
-def get_snapshot(csv_path: str, client) -> dict:
+def get_snapshot(
+    csv_path: str, client, portfolio: Optional[list[dict]] = None
+) -> dict:
     """スナップショット生成。
 
     各銘柄について:
@@ -454,6 +591,8 @@ def get_snapshot(csv_path: str, client) -> dict:
         ポートフォリオCSVのパス
     client
         yahoo_client モジュール（get_stock_info を持つ）
+    portfolio : list[dict], optional
+        load_portfolio() 形式のポジション。渡された場合は CSV を読まない。
 
     Returns
     -------
@@ -468,7 +607,11 @@ def get_snapshot(csv_path: str, client) -> dict:
             "as_of": str,
         }
     """
-    portfolio = load_portfolio(csv_path)
+    # load_portfolio() already drops rows with shares <= 0; keep closed
+    # positions out of the fetch and P&L paths whatever the source
+    if portfolio is None:
+        portfolio = load_portfolio(csv_path)
+    portfolio = [pos for pos in portfolio if pos["shares"] > 0]
 
     if not portfolio:
         return {
@@ -481,18 +624,35 @@ def get_snapshot(csv_path: str, client) -> dict:
             "as_of": datetime.now().isoformat(),
         }
 
-    # Collect unique currencies for FX rate fetching
+    # Collect unique currencies for FX rate fetching, and classify each
+    # symbol once (cash symbols infer to their own currency)
     currencies_needed: set[str] = set()
+    inferred_currency: dict[str, str] = {}
+    cash_symbols: set[str] = set()
+    symbols: list[str] = []  # unique non-cash symbols, in portfolio order
     for pos in portfolio:
         currencies_needed.add(pos.get("cost_currency", "JPY"))
         # Also need the market currency (inferred from symbol)
-        currencies_needed.add(_infer_currency(pos["symbol"]))
+        symbol = pos["symbol"]
+        if symbol not in inferred_currency:
+            inferred_currency[symbol] = _infer_currency(symbol)
+            if _is_cash(symbol):
+                cash_symbols.add(symbol)
+            else:
+                symbols.append(symbol)
+        currencies_needed.add(inferred_currency[symbol])
 
-    # Fetch FX rates (only if non-JPY currencies exist)
-    if currencies_needed - {"JPY"}:
-        fx_rates = get_fx_rates(client)
-    else:
-        fx_rates = {"JPY": 1.0}
+    # Fetch FX rates (only if non-JPY currencies exist) and the market data
+    # of every non-cash holding as tasks of one bounded pool
+    fx_pairs = _FX_PAIRS if currencies_needed - {"JPY"} else []
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        fx_prices = pool.map(lambda pair: _fetch_fx_rate(client, pair), fx_pairs)
+        infos = dict(zip(symbols, pool.map(client.get_stock_info, symbols)))
+        fx_rates = _fx_rates_from(fx_pairs, fx_prices)
+
+    # Per-currency JPY rate, resolved (and any missing-rate warning
+    # printed) once per currency
+    fx_of: dict[str, float] = {}
 
     # Fetch current prices and build position details
     positions: list[dict] = []
@@ -506,9 +666,13 @@ def get_snapshot(csv_path: str, client) -> dict:
         cost_currency = pos.get("cost_currency", "JPY")
 
         # Cash positions: skip API call, use cost_price as current price
-        if _is_cash(symbol):
-            cash_currency = _cash_currency(symbol)
-            fx_rate = _get_fx_rate_for_currency(cash_currency, fx_rates)
+        if symbol in cash_symbols:
+            cash_currency = inferred_currency[symbol]
+            fx_rate = fx_of.get(cash_currency)
+            if fx_rate is None:
+                fx_rate = fx_of[cash_currency] = _get_fx_rate_for_currency(
+                    cash_currency, fx_rates
+                )
             value_jpy = cost_price * shares * fx_rate
             cost_jpy = value_jpy  # cash has no P&L
             total_value_jpy += value_jpy
@@ -533,12 +697,12 @@ def get_snapshot(csv_path: str, client) -> dict:
             })
             continue
 
-        # Get current market data
-        info = client.get_stock_info(symbol)
+        # Current market data (fetched above)
+        info = infos.get(symbol)
         current_price = None
         name = None
         sector = None
-        market_currency = _infer_currency(symbol)
+        market_currency = inferred_currency[symbol]
 
         if info is not None:
             current_price = info.get("price")
@@ -559,11 +723,18 @@ def get_snapshot(csv_path: str, client) -> dict:
             evaluation = 0.0
 
         # JPY conversion
-        fx_rate = _get_fx_rate_for_currency(market_currency, fx_rates)
+        fx_rate = fx_of.get(market_currency)
+        if fx_rate is None:
+            fx_rate = fx_of[market_currency] = _get_fx_rate_for_currency(
+                market_currency, fx_rates
+            )
+        cost_fx_rate = fx_of.get(cost_currency)
+        if cost_fx_rate is None:
+            cost_fx_rate = fx_of[cost_currency] = _get_fx_rate_for_currency(
+                cost_currency, fx_rates
+            )
         evaluation_jpy = evaluation * fx_rate
-        cost_jpy = cost_price * shares * _get_fx_rate_for_currency(
-            cost_currency, fx_rates
-        )
+        cost_jpy = cost_price * shares * cost_fx_rate
         pnl_jpy = evaluation_jpy - cost_jpy
 
         total_value_jpy += evaluation_jpy
@@ -610,7 +781,12 @@ def get_snapshot(csv_path: str, client) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def get_structure_analysis(csv_path: str, client) -> dict:
+def get_structure_analysis(
+    csv_path: str,
+    client,
+    snapshot: Optional[dict] = None,
+    portfolio: Optional[list[dict]] = None,
+) -> dict:
     """構造分析。PFの偏りを自動集計。
 
     各銘柄のセクター・地域・通貨をyfinanceから取得し、
@@ -624,6 +800,10 @@ def get_structure_analysis(csv_path: str, client) -> dict:
         ポートフォリオCSVのパス
     client
         yahoo_client モジュール（get_stock_info を持つ）
+    snapshot : dict, optional
+        同じ CSV の get_snapshot() 結果。渡された場合は再取得しない。
+    portfolio : list[dict], optional
+        load_portfolio() 形式のポジション（get_snapshot() に渡す）。
 
     Returns
     -------
@@ -642,7 +822,8 @@ def get_structure_analysis(csv_path: str, client) -> dict:
     from src.core.portfolio.concentration import analyze_concentration
 
     # Get snapshot first (this also fetches current prices and FX rates)
-    snapshot = get_snapshot(csv_path, client)
+    if snapshot is None:
+        snapshot = get_snapshot(csv_path, client, portfolio=portfolio)
     positions = snapshot["positions"]
 
     if not positions:
@@ -662,11 +843,12 @@ def get_structure_analysis(csv_path: str, client) -> dict:
     if total_value <= 0:
         # Fallback: equal weights
         n = len(positions)
-        weights = [1.0 / n] * n
+        weights = np.full(n, 1.0 / n)
     else:
-        weights = [
-            pos["evaluation_jpy"] / total_value for pos in positions
-        ]
+        weights = np.fromiter(
+            (pos["evaluation_jpy"] for pos in positions),
+            dtype=np.float64, count=len(positions),
+        ) / total_value
 
     # Build portfolio_data for analyze_concentration
     portfolio_data: list[dict] = []
@@ -721,6 +903,13 @@ def get_portfolio_shareholder_return(csv_path: str, client) -> dict:
     if not holdings:
         return {"positions": [], "weighted_avg_rate": None}
 
+    # Fetch the detail of every non-cash holding concurrently
+    symbols = list(dict.fromkeys(
+        h["symbol"] for h in holdings if not _is_cash(h["symbol"])
+    ))
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        details = dict(zip(symbols, pool.map(client.get_stock_detail, symbols)))
+
     total_mv = 0.0
     weighted_rate = 0.0
     position_returns: list[dict] = []
@@ -729,7 +918,7 @@ def get_portfolio_shareholder_return(csv_path: str, client) -> dict:
         symbol = h["symbol"]
         if _is_cash(symbol):
             continue
-        detail = client.get_stock_detail(symbol)
+        detail = details.get(symbol)
         if detail is None:
             continue
         sr = calculate_shareholder_return(detail)
@@ -757,7 +946,8 @@ def merge_positions(
 ) -> list[dict]:
     """現在PFに提案銘柄をマージ（加重平均コスト計算）。
 
-    入力リストは変更しない（deep copy して操作）。
+    入力リストは変更しない（各ポジション dict の浅いコピーを操作）。
+    ポジションの値はスカラー・文字列のみのフラットな dict である前提。
 
     Parameters
     ----------
@@ -772,7 +962,7 @@ def merge_positions(
     list[dict]
         マージ後のポートフォリオ。
     """
-    merged = copy.deepcopy(current)
+    merged = [dict(p) for p in current]
     symbol_map: dict[str, int] = {
         p["symbol"].upper(): i for i, p in enumerate(merged)
     }
@@ -2,11 +2,11 @@
 
 Temporarily adds proposed stocks to the portfolio and compares
 before/after metrics (snapshot, concentration, forecast, health).
-Uses a temp CSV approach to leverage existing csv_path-based functions.
+The merged portfolio is passed to the analysis functions in memory.
 """
 
 import os
-import tempfile
+import time
 
 from src.core.portfolio.portfolio_manager import (
     get_fx_rates,
@@ -14,11 +14,15 @@ from src.core.portfolio.portfolio_manager import (
     get_structure_analysis,
     load_portfolio,
     merge_positions,
-    save_portfolio,
 )
 from src.core.return_estimate import estimate_portfolio_return
 from src.core.ticker_utils import infer_currency
 
+# Before-side analysis of an unchanged CSV, reused across What-If runs:
+# (client, path, mtime_ns, size) -> (before_metrics, fx_rates, computed_at)
+_before_cache: dict[tuple, tuple[dict, dict, float]] = {}
+_BEFORE_TTL = 300.0  # prices move; recompute after 5 minutes
+
 
 def parse_add_arg(add_str: str) -> list[dict]:
     """Parse --add argument into a list of proposed positions.
@@ -216,6 +220,38 @@ def _compute_judgment(
     }
 
 
+def _before_analysis(
+    csv_path: str, client, current: list[dict],
+) -> tuple[dict, dict]:
+    """Return (before_metrics, fx_rates) for the current portfolio.
+
+    Results are cached per process for ``_BEFORE_TTL`` seconds, keyed by
+    the CSV's mtime and size, so trying several proposals against the
+    same portfolio computes the before side once. Editing the CSV
+    invalidates the entry.
+    """
+    try:
+        st = os.stat(csv_path)
+        key = (client, os.path.normpath(csv_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    now = time.time()
+    cached = _before_cache.get(key) if key is not None else None
+    if cached is not None and (now - cached[2]) < _BEFORE_TTL:
+        return dict(cached[0]), dict(cached[1])
+
+    snapshot = get_snapshot(csv_path, client, portfolio=current)
+    structure = get_structure_analysis(csv_path, client, snapshot=snapshot)
+    forecast = estimate_portfolio_return(csv_path, client, portfolio=current)
+    metrics = _extract_metrics(snapshot, structure, forecast)
+    fx_rates = snapshot.get("fx_rates", {"JPY": 1.0})
+
+    if key is not None:
+        _before_cache[key] = (metrics, fx_rates, now)
+    return dict(metrics), dict(fx_rates)
+
+
 def run_what_if_simulation(
     csv_path: str,
     proposed: list[dict],
@@ -223,8 +259,8 @@ def run_what_if_simulation(
 ) -> dict:
     """Run What-If simulation comparing before/after portfolio metrics.
 
-    Uses a temp CSV file to leverage existing csv_path-based analysis
-    functions without modifying the original portfolio.
+    The merged positions are analysed in memory (the analysis functions'
+    ``portfolio`` argument), so the original CSV is never modified.
 
     Parameters
     ----------
@@ -243,61 +279,47 @@ def run_what_if_simulation(
     # 1. Load current portfolio
     current = load_portfolio(csv_path)
 
-    # 2. Before analysis (uses cache for subsequent calls)
-    before_snapshot = get_snapshot(csv_path, client)
-    before_structure = get_structure_analysis(csv_path, client)
-    before_forecast = estimate_portfolio_return(csv_path, client)
-    before_metrics = _extract_metrics(
-        before_snapshot, before_structure, before_forecast
-    )
+    # 2. Before analysis (cached while the CSV is unchanged)
+    before_metrics, fx_rates = _before_analysis(csv_path, client, current)
 
     # 3. Merge positions
     merged = merge_positions(current, proposed)
 
-    # 4. Write to temp CSV
-    temp_fd, temp_path = tempfile.mkstemp(suffix=".csv", prefix="whatif_")
-    os.close(temp_fd)
+    # 4. After analysis on the merged positions in memory (new stocks
+    #    will need API calls, existing stocks hit yahoo_client's 24h cache)
+    after_snapshot = get_snapshot(csv_path, client, portfolio=merged)
+    after_structure = get_structure_analysis(
+        csv_path, client, snapshot=after_snapshot
+    )
+    after_forecast = estimate_portfolio_return(
+        csv_path, client, portfolio=merged
+    )
+    after_metrics = _extract_metrics(
+        after_snapshot, after_structure, after_forecast
+    )
 
+    # 5. Health check on proposed stocks only
+    proposed_health: list[dict] = []
     try:
-        save_portfolio(merged, temp_path)
-
-        # 5. After analysis (new stocks will need API calls,
-        #    existing stocks hit yahoo_client's 24h cache)
-        after_snapshot = get_snapshot(temp_path, client)
-        after_structure = get_structure_analysis(temp_path, client)
-        after_forecast = estimate_portfolio_return(temp_path, client)
-        after_metrics = _extract_metrics(
-            after_snapshot, after_structure, after_forecast
-        )
-
-        # 6. Health check on proposed stocks only
-        proposed_health: list[dict] = []
-        try:
-            from src.core.health_check import run_health_check
-
-            health_data = run_health_check(temp_path, client)
-            proposed_symbols = {
-                p["symbol"].upper() for p in proposed
-            }
-            for pos in health_data.get("positions", []):
-                if pos.get("symbol", "").upper() in proposed_symbols:
-                    proposed_health.append(pos)
-        except ImportError:
-            pass
-
-        # 7. FX rates and required cash
-        fx_rates = before_snapshot.get("fx_rates", {"JPY": 1.0})
-        required_cash = _compute_required_cash(proposed, fx_rates)
-
-        # 8. Judgment
-        judgment = _compute_judgment(
-            before_metrics, after_metrics, proposed_health
-        )
-
-    finally:
-        # 9. Cleanup temp CSV
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        from src.core.health_check import run_health_check
+
+        health_data = run_health_check(csv_path, client, portfolio=merged)
+        proposed_symbols = {
+            p["symbol"].upper() for p in proposed
+        }
+        for pos in health_data.get("positions", []):
+            if pos.get("symbol", "").upper() in proposed_symbols:
+                proposed_health.append(pos)
+    except ImportError:
+        pass
+
+    # 6. Required cash
+    required_cash = _compute_required_cash(proposed, fx_rates)
+
+    # 7. Judgment
+    judgment = _compute_judgment(
+        before_metrics, after_metrics, proposed_health
+    )
 
     return {
         "proposed": proposed,
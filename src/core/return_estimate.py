@@ -307,7 +307,9 @@ def estimate_stock_return(
     }
 
 
-def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
+def estimate_portfolio_return(
+    csv_path: str, yahoo_client_module, portfolio: list[dict] | None = None,
+) -> dict:
     """Estimate returns for the entire portfolio.
 
     Fetches detailed data for each position, computes per-stock estimates,
@@ -319,6 +321,9 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
         Path to portfolio CSV.
     yahoo_client_module
         The yahoo_client module (for get_stock_detail, get_stock_news).
+    portfolio : list[dict] | None
+        Positions in load_portfolio() format; when given, *csv_path* is
+        not read.
 
     Returns
     -------
@@ -337,7 +342,8 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
     from src.core.portfolio.portfolio_manager import load_portfolio, get_fx_rates
     from src.core.ticker_utils import infer_currency as _infer_currency
 
-    portfolio = load_portfolio(csv_path)
+    if portfolio is None:
+        portfolio = load_portfolio(csv_path)
     if not portfolio:
         return {
             "positions": [],
@@ -13,6 +13,8 @@ KIK-349 fixes:
   - Earnings growth penalty: negative growth reduces total change score
 """
 
+from functools import lru_cache
+
 import numpy as np
 from typing import Optional
 
@@ -213,6 +215,26 @@ def compute_roe_trend_score(stock_detail: dict) -> tuple[float, Optional[float]]
 _PASS_THRESHOLD = 15.0
 
 
+# stock_detail fields read by compute_change_score(); only the first three
+# entries of each history are used.
+_CHANGE_SCORE_FIELDS = (
+    "net_income_stmt", "operating_cashflow", "total_assets", "sector",
+    "fcf", "market_cap", "earnings_growth",
+)
+_CHANGE_SCORE_HISTORIES = ("revenue_history", "net_income_history", "equity_history")
+
+
+def _history_head(values) -> Optional[tuple]:
+    return None if values is None else tuple(values[:3])
+
+
+@lru_cache(maxsize=2048)
+def _cached_change_score(fields: tuple, histories: tuple) -> dict:
+    detail = dict(zip(_CHANGE_SCORE_FIELDS, fields))
+    detail.update(zip(_CHANGE_SCORE_HISTORIES, histories))
+    return _change_score(detail)
+
+
 def compute_change_score(stock_detail: dict) -> dict:
     """Compute composite change score across all four indicators.
 
@@ -229,7 +251,23 @@ def compute_change_score(stock_detail: dict) -> dict:
             earnings_penalty -- penalty applied for negative earnings growth
             passed_count     -- number of indicators scoring >= 15
             quality_pass     -- True if passed_count >= 3
+
+    Results are memoized on the fields read, so repeated calls for the
+    same stock_detail content skip the indicator math.
     """
+    try:
+        result = _cached_change_score(
+            tuple(stock_detail.get(k) for k in _CHANGE_SCORE_FIELDS),
+            tuple(_history_head(stock_detail.get(k)) for k in _CHANGE_SCORE_HISTORIES),
+        )
+    except TypeError:  # unhashable or non-sequence values
+        return _change_score(stock_detail)
+    return {
+        k: dict(v) if isinstance(v, dict) else v for k, v in result.items()
+    }
+
+
+def _change_score(stock_detail: dict) -> dict:
     acc_score, acc_raw = compute_accruals_score(stock_detail)
     rev_score, rev_raw = compute_revenue_acceleration_score(stock_detail)
     fcf_score, fcf_raw = compute_fcf_yield_score(stock_detail)
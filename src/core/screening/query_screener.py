@@ -4,7 +4,7 @@ from typing import Optional
 
 from src.core.screening.filters import apply_filters
 from src.core.screening.indicators import (
-    calculate_value_score,
+    calculate_value_score_batch,
     calculate_shareholder_return,
     calculate_shareholder_return_history,
     assess_return_stability,
@@ -184,15 +184,11 @@ class QueryScreener:
             return []
 
         # Normalize quotes and calculate value scores
-        results: list[dict] = []
-        for quote in raw_quotes:
-            normalized = self._normalize_quote(quote)
-
-            # calculate_value_score works with our standard keys
-            score = calculate_value_score(normalized)
-
+        results: list[dict] = [self._normalize_quote(q) for q in raw_quotes]
+        # calculate_value_score works with our standard keys
+        scores = calculate_value_score_batch(results).tolist()
+        for normalized, score in zip(results, scores):
             normalized["value_score"] = score
-            results.append(normalized)
 
         # -----------------------------------------------------------
         # Optional shareholder return filter (KIK-378)
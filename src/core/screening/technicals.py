@@ -1,10 +1,78 @@
 """Technical indicators for pullback-in-uptrend screening (KIK-332)."""
 
+import importlib.util
+
 import numpy as np
 import pandas as pd
 
 from src.core._thresholds import th
 
+# numba: optional JIT for the RSI recurrence (plain Python loop otherwise).
+# Imported on first use so commands that never need rsi_values() skip
+# numba's import time; cache=True keeps the compiled kernel on disk
+# between CLI runs.
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+_rsi_kernel = None
+
+
+def _rsi_wilder(close: np.ndarray, period: int) -> np.ndarray:
+    """Streaming Wilder RSI over a float64 close array.
+
+    Walks the array once with the same recurrence as compute_rsi()
+    (ewm with alpha=1/period, adjust=False, first diff counted as 0).
+    The first ``period - 1`` values are NaN.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        gain = 0.0
+        loss = 0.0
+        if i > 0:
+            d = close[i] - close[i - 1]
+            if d > 0:
+                gain = d
+            elif d < 0:
+                loss = -d
+        if i == 0:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+        if i < period - 1:
+            out[i] = np.nan
+        elif avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+def _get_rsi_kernel():
+    """Return _rsi_wilder, JIT-compiled when numba is available."""
+    global _rsi_kernel
+    if _rsi_kernel is None:
+        kernel = _rsi_wilder
+        if HAS_NUMBA:
+            try:
+                from numba import njit
+
+                kernel = njit(cache=True)(_rsi_wilder)
+            except ImportError:
+                pass
+        _rsi_kernel = kernel
+    return _rsi_kernel
+
+
+def rsi_values(close, period: int = 14) -> np.ndarray:
+    """RSI as a float64 array; same values as compute_rsi() without the Series."""
+    return _get_rsi_kernel()(np.asarray(close, dtype=np.float64), period)
+
 
 def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """RSI using Wilder's smoothing method (exponential moving average)."""
@@ -5,6 +5,7 @@ a single source of truth for suffix-based lookups.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from src.core.common import is_cash
@@ -95,15 +96,7 @@ def infer_currency(symbol: str, info: dict | None = None) -> str:
         currency_from_info = info.get("currency")
         if currency_from_info:
             return currency_from_info
-    if is_cash(symbol):
-        return cash_currency(symbol)
-    for suffix, currency in SUFFIX_TO_CURRENCY.items():
-        if symbol.upper().endswith(suffix.upper()):
-            return currency
-    # No suffix typically means USD
-    if "." not in symbol:
-        return "USD"
-    return "USD"
+    return _currency_from_symbol(symbol)
 
 
 def infer_country(symbol: str, info: dict | None = None) -> str:
@@ -117,6 +110,28 @@ def infer_country(symbol: str, info: dict | None = None) -> str:
         country_from_info = info.get("country") or info.get("region")
         if country_from_info:
             return country_from_info
+    return _country_from_symbol(symbol)
+
+
+# Suffix lookups are pure functions of the symbol; portfolio code calls
+# them several times per holding, so memoize per symbol.
+@lru_cache(maxsize=4096)
+def _currency_from_symbol(symbol: str) -> str:
+    """Suffix-based currency for *symbol* (cash symbols use their prefix)."""
+    if is_cash(symbol):
+        return cash_currency(symbol)
+    for suffix, currency in SUFFIX_TO_CURRENCY.items():
+        if symbol.upper().endswith(suffix.upper()):
+            return currency
+    # No suffix typically means USD
+    if "." not in symbol:
+        return "USD"
+    return "USD"
+
+
+@lru_cache(maxsize=4096)
+def _country_from_symbol(symbol: str) -> str:
+    """Suffix-based country for *symbol* (cash symbols map via currency)."""
     if is_cash(symbol):
         cur = cash_currency(symbol)
         # Reverse lookup: find country for this currency
@@ -4,23 +4,17 @@ Detects stocks that appear cheap on valuation metrics but have
 deteriorating fundamentals — a classic 'value trap' pattern.
 """
 
+from functools import lru_cache
+
 from src.core.common import finite_or_none
 
+# stock_detail fields read by detect_value_trap()
+_TRAP_FIELDS = ("per", "pbr", "roe", "eps_growth", "revenue_growth")
 
-def detect_value_trap(stock_detail: dict) -> dict:
-    """Detect value trap: stock appears cheap but fundamentals are deteriorating.
-
-    Returns {"is_trap": bool, "reasons": list[str]}.
-    """
-    if stock_detail is None:
-        return {"is_trap": False, "reasons": []}
-
-    per = finite_or_none(stock_detail.get("per"))
-    pbr = finite_or_none(stock_detail.get("pbr"))
-    roe = finite_or_none(stock_detail.get("roe"))
-    eps_growth = finite_or_none(stock_detail.get("eps_growth"))
-    rev_growth = finite_or_none(stock_detail.get("revenue_growth"))
 
+@lru_cache(maxsize=4096)
+def _value_trap_reasons(per, pbr, roe, eps_growth, rev_growth) -> tuple[str, ...]:
+    """Value trap reasons for one set of (finite or None) metrics."""
     reasons = []
 
     # Condition A: Very low PER + negative earnings growth
@@ -37,4 +31,20 @@ def detect_value_trap(stock_detail: dict) -> dict:
     if pbr is not None and roe is not None and eps_growth is not None:
         if pbr < 0.8 and roe < 0.05 and eps_growth < 0:
             reasons.append("低PBRだがROE低下・利益減少")
-    return {"is_trap": bool(reasons), "reasons": reasons}
+    return tuple(reasons)
+
+
+def detect_value_trap(stock_detail: dict) -> dict:
+    """Detect value trap: stock appears cheap but fundamentals are deteriorating.
+
+    Returns {"is_trap": bool, "reasons": list[str]}.
+    """
+    if not stock_detail:
+        return {"is_trap": False, "reasons": []}
+    values = [stock_detail.get(k) for k in _TRAP_FIELDS]
+    # ETF / cash / failed fetch: nothing to evaluate
+    if all(v is None for v in values):
+        return {"is_trap": False, "reasons": []}
+
+    reasons = _value_trap_reasons(*map(finite_or_none, values))
+    return {"is_trap": bool(reasons), "reasons": list(reasons)}
@@ -0,0 +1,97 @@
+"""Persistent on-disk cache for TEI embeddings.
+
+Summary texts are deterministic, so their embeddings can be reused across
+runs (e.g. ``init_graph.py --rebuild``). Entries are keyed by a BLAKE2b
+hash of the summary text and stored as float16 bytes in SQLite: half
+the size of float32, and the rounding (~1e-3 relative) does not change
+cosine-similarity rankings of the normalized TEI vectors.
+Graceful degradation: SQLite errors are treated as cache misses.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "cache" / "embeddings.sqlite3"
+
+_conn: sqlite3.Connection | None = None
+
+
+def _get_conn() -> sqlite3.Connection | None:
+    """Lazy-open the cache database. Returns None if it cannot be opened."""
+    global _conn
+    if _conn is not None:
+        return _conn
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS emb16 (h BLOB PRIMARY KEY, v BLOB)")
+        _conn = conn
+        return _conn
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def key(text: str) -> bytes:
+    """Return the cache key for a summary text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def get_many(keys: list[bytes]) -> dict[bytes, np.ndarray]:
+    """Look up many keys at once. Returns only the keys that were found.
+
+    Embeddings are returned as float32 arrays.
+    """
+    conn = _get_conn()
+    if conn is None or not keys:
+        return {}
+    found: dict[bytes, np.ndarray] = {}
+    try:
+        # Stay well below SQLite's host-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT h, v FROM emb16 WHERE h IN ({placeholders})", chunk,
+            )
+            for h, v in rows:
+                found[h] = np.frombuffer(v, dtype=np.float16).astype(np.float32)
+    except sqlite3.Error:
+        return found
+    return found
+
+
+def get(h: bytes) -> np.ndarray | None:
+    """Return the cached embedding for key *h*, or None on miss."""
+    return get_many([h]).get(h)
+
+
+def put_many(items: "list[tuple[bytes, list[float] | np.ndarray]]") -> None:
+    """Store many (key, embedding) pairs in one transaction."""
+    conn = _get_conn()
+    if conn is None or not items:
+        return
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO emb16 (h, v) VALUES (?, ?)",
+                [(h, np.asarray(vec, dtype=np.float16).tobytes()) for h, vec in items],
+            )
+    except sqlite3.Error:
+        pass
+
+
+def put(h: bytes, vec: "list[float] | np.ndarray") -> None:
+    """Store one embedding under key *h*."""
+    put_many([(h, vec)])
+
+
+def close() -> None:
+    """Close the cache database (for testing)."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
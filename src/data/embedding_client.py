@@ -5,15 +5,23 @@ Graceful degradation: returns None when TEI is unavailable.
 """
 
 import os
+import sys
 import time
 
 import requests
+from requests.exceptions import ConnectionError as _RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
 
 TEI_URL = os.environ.get("TEI_URL", "http://localhost:8081")
 
 _available: bool | None = None
 _available_checked_at: float = 0.0
 _AVAILABILITY_TTL = 30.0  # re-check every 30s
+_unavailable_warned = False
+
+# Errors meaning "TEI is not reachable" (vs. a bad response for one batch)
+_CONNECT_ERRORS = (_RequestsConnectionError, Timeout, ConnectionError, TimeoutError)
+_CONNECT_ATTEMPTS = 2  # per batch, before treating TEI as down
 
 
 def is_available() -> bool:
@@ -50,8 +58,75 @@ def get_embedding(text: str) -> list[float] | None:
     return None
 
 
+def _circuit_open() -> bool:
+    """True while TEI was recently found unreachable (within the TTL)."""
+    return (_available is False
+            and (time.time() - _available_checked_at) < _AVAILABILITY_TTL)
+
+
+def _mark_unavailable() -> None:
+    """Record TEI as unreachable so further requests fail fast until the TTL."""
+    global _available, _available_checked_at, _unavailable_warned
+    _available = False
+    _available_checked_at = time.time()
+    if not _unavailable_warned:
+        print(
+            "⚠️  TEIに接続できません\n"
+            "    対処: docker compose up -d を実行してください\n"
+            "    → 埋め込みなしで続行します",
+            file=sys.stderr,
+        )
+        _unavailable_warned = True
+
+
+def get_embeddings_batch(
+    texts: list[str], batch_size: int = 32,
+) -> list[list[float] | None]:
+    """Get embedding vectors for many texts, *batch_size* texts per request.
+
+    TEI accepts a list of inputs on /embed; 32 matches its default
+    ``--max-client-batch-size``. The result is aligned with *texts*:
+    empty texts and texts in a failed batch map to None.
+    """
+    results: list[list[float] | None] = [None] * len(texts)
+    indexed = [(i, t) for i, t in enumerate(texts) if t]
+    if indexed and _circuit_open():
+        return results
+    for start in range(0, len(indexed), batch_size):
+        chunk = indexed[start:start + batch_size]
+        resp = None
+        for _ in range(_CONNECT_ATTEMPTS):
+            try:
+                resp = requests.post(
+                    f"{TEI_URL}/embed",
+                    json={"inputs": [t for _, t in chunk]},
+                    timeout=30,
+                )
+                break
+            except _CONNECT_ERRORS:
+                continue
+            except RequestException:
+                break
+        else:
+            # TEI is down: skip the remaining batches instead of waiting
+            # for each of them to fail
+            _mark_unavailable()
+            return results
+        if resp is None or resp.status_code != 200:
+            continue
+        try:
+            data = resp.json()
+        except ValueError:
+            continue
+        if isinstance(data, list) and len(data) == len(chunk):
+            for (i, _), vec in zip(chunk, data):
+                results[i] = vec
+    return results
+
+
 def reset_cache():
     """Reset availability cache (for testing)."""
-    global _available, _available_checked_at
+    global _available, _available_checked_at, _unavailable_warned
     _available = None
     _available_checked_at = 0.0
+    _unavailable_warned = False
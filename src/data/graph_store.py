@@ -192,6 +192,12 @@ _VECTOR_INDEXES = [
 ]
 
 
+def _create_schema(tx) -> None:
+    """Run all constraint/index statements in one transaction."""
+    for stmt in _SCHEMA_CONSTRAINTS + _SCHEMA_INDEXES:
+        tx.run(stmt)
+
+
 def init_schema() -> bool:
     """Create constraints and indexes. Returns True on success."""
     driver = _get_driver()
@@ -199,8 +205,8 @@ def init_schema() -> bool:
         return False
     try:
         with driver.session() as session:
-            for stmt in _SCHEMA_CONSTRAINTS + _SCHEMA_INDEXES:
-                session.run(stmt)
+            # One round-trip transaction instead of one per statement
+            session.execute_write(_create_schema)
             # KIK-420: Vector indexes (separate try/except -- older Neo4j may not support)
             for stmt in _VECTOR_INDEXES:
                 try:
@@ -216,6 +222,17 @@ def init_schema() -> bool:
 # Embedding helper (KIK-420)
 # ---------------------------------------------------------------------------
 
+def _embedding_param(embedding):
+    """Return *embedding* as a Cypher list parameter.
+
+    Embeddings may arrive as float32 numpy arrays (scripts/init_graph.py);
+    they are converted to a plain list only here, at the driver boundary.
+    """
+    if embedding is None or isinstance(embedding, list):
+        return embedding
+    return embedding.tolist()
+
+
 def _set_embedding(session, label: str, node_id: str,
                    semantic_summary: str = "",
                    embedding: list[float] | None = None) -> None:
@@ -229,7 +246,7 @@ def _set_embedding(session, label: str, node_id: str,
         params["summary"] = semantic_summary
     if embedding is not None:
         sets.append("n.embedding = $embedding")
-        params["embedding"] = embedding
+        params["embedding"] = _embedding_param(embedding)
     if sets:
         query = f"MATCH (n:{label} {{id: $id}}) SET {', '.join(sets)}"
         session.run(query, **params)
@@ -562,7 +579,7 @@ def merge_watchlist(name: str, symbols: list[str],
                     _params["summary"] = semantic_summary
                 if embedding is not None:
                     _sets.append("w.embedding = $embedding")
-                    _params["embedding"] = embedding
+                    _params["embedding"] = _embedding_param(embedding)
                 if _sets:
                     session.run(
                         f"MATCH (w:Watchlist {{name: $name}}) SET {', '.join(_sets)}",
@@ -607,6 +624,36 @@ def link_research_supersedes(research_type: str, target: str) -> bool:
         return False
 
 
+def link_research_supersedes_bulk(pairs: list[tuple[str, str]]) -> bool:
+    """Link SUPERSEDES chains for many (research_type, target) pairs at once.
+
+    Same semantics as link_research_supersedes(), but all pairs are
+    processed by a single UNWIND query (one round-trip).
+    """
+    if _get_mode() == "off":
+        return False
+    driver = _get_driver()
+    if driver is None:
+        return False
+    if not pairs:
+        return True
+    try:
+        with driver.session() as session:
+            session.run(
+                "UNWIND $pairs AS p "
+                "MATCH (r:Research {research_type: p.rtype, target: p.target}) "
+                "WITH p, r ORDER BY r.date ASC "
+                "WITH p, collect(r) AS nodes "
+                "UNWIND range(0, size(nodes)-2) AS i "
+                "WITH nodes[i] AS a, nodes[i+1] AS b "
+                "MERGE (a)-[:SUPERSEDES]->(b)",
+                pairs=[{"rtype": rtype, "target": target} for rtype, target in pairs],
+            )
+        return True
+    except Exception:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Portfolio sync (KIK-414)
 # ---------------------------------------------------------------------------
@@ -824,6 +871,303 @@ def merge_forecast(
         return False
 
 
+# ---------------------------------------------------------------------------
+# Bulk merge (UNWIND batches, used by scripts/init_graph.py)
+#
+# Each row is a dict of the keyword arguments of the matching single-record
+# merge_* function. Rows are sent in chunks of _BULK_BATCH_SIZE, one
+# transaction per chunk. semantic_summary/embedding are only overwritten
+# when the row provides them, matching _set_embedding().
+# ---------------------------------------------------------------------------
+
+_BULK_BATCH_SIZE = 1000
+
+_BULK_SET_EMBEDDING = (
+    "n.semantic_summary = CASE WHEN r.semantic_summary <> '' "
+    "THEN r.semantic_summary ELSE n.semantic_summary END, "
+    "n.embedding = coalesce(r.embedding, n.embedding)"
+)
+
+
+def _bulk_params(rows: list[dict], build) -> list[dict]:
+    """Build query parameters for each row, skipping malformed rows.
+
+    Mirrors the single-record functions, where a bad value only fails
+    that one merge.
+    """
+    params = []
+    for r in rows:
+        try:
+            p = build(r)
+        except (TypeError, ValueError, AttributeError, KeyError):
+            continue
+        p["semantic_summary"] = r.get("semantic_summary", "") or ""
+        p["embedding"] = _embedding_param(r.get("embedding"))
+        params.append(p)
+    return params
+
+
+def _run_bulk_chunk(tx, query: str, rows: list[dict]) -> None:
+    """Transaction function for one _run_bulk chunk."""
+    tx.run(query, rows=rows).consume()
+
+
+def _run_bulk(query: str, params: list[dict]) -> bool:
+    """Run an ``UNWIND $rows AS r ...`` query over *params* in chunks.
+
+    Each chunk is a managed write transaction, so the driver retries
+    transient errors (deadlocks, leader changes). On failure, chunks
+    committed before it stay committed; the queries are MERGEs, so
+    re-running the import completes it.
+    """
+    if _get_mode() == "off":
+        return False
+    driver = _get_driver()
+    if driver is None:
+        return False
+    if not params:
+        return True
+    start = 0
+    try:
+        with driver.session() as session:
+            for start in range(0, len(params), _BULK_BATCH_SIZE):
+                session.execute_write(
+                    _run_bulk_chunk, query, params[start:start + _BULK_BATCH_SIZE],
+                )
+        return True
+    except Exception as e:
+        print(
+            f"[graph_store] Warning: bulk write failed "
+            f"({len(params)} rows, from row {start}): {e}",
+            file=sys.stderr,
+        )
+        return False
+
+
+def merge_stocks_bulk(rows: list[dict]) -> bool:
+    """Create or update many Stock nodes (merge_stock rows)."""
+    params = []
+    for r in rows:
+        if not r.get("symbol"):
+            continue
+        params.append({
+            "symbol": r["symbol"], "name": r.get("name", ""),
+            "sector": r.get("sector", ""), "country": r.get("country", ""),
+        })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (s:Stock {symbol: r.symbol}) "
+        "SET s.name = r.name, s.sector = r.sector, s.country = r.country "
+        "FOREACH (_ IN CASE WHEN r.sector <> '' THEN [1] ELSE [] END | "
+        "MERGE (sec:Sector {name: r.sector}) "
+        "MERGE (s)-[:IN_SECTOR]->(sec))",
+        params,
+    )
+
+
+def merge_screens_bulk(rows: list[dict]) -> bool:
+    """Create many Screen nodes and SURFACED relationships (merge_screen rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "id": f"screen_{r['screen_date']}_{r['region']}_{r['preset']}",
+        "date": r["screen_date"], "preset": r["preset"],
+        "region": r["region"], "count": r["count"],
+        "symbols": list(r["symbols"]),
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:Screen {id: r.id}) "
+        "SET n.date = r.date, n.preset = r.preset, "
+        "n.region = r.region, n.count = r.count, "
+        + _BULK_SET_EMBEDDING + " "
+        "WITH n, r "
+        "UNWIND r.symbols AS sym "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:SURFACED]->(s)",
+        params,
+    )
+
+
+def merge_reports_bulk(rows: list[dict]) -> bool:
+    """Create many Report nodes and ANALYZED relationships (merge_report_full rows).
+
+    Valuation properties are only written in 'full' mode, as in
+    merge_report_full().
+    """
+    full = _get_mode() == "full"
+
+    def build(r: dict) -> dict:
+        p = {
+            "id": f"report_{r['report_date']}_{r['symbol']}",
+            "date": r["report_date"], "symbol": r["symbol"],
+            "score": r["score"], "verdict": r["verdict"],
+        }
+        if full:
+            p.update(
+                price=float(r.get("price") or 0), per=float(r.get("per") or 0),
+                pbr=float(r.get("pbr") or 0),
+                div=float(r.get("dividend_yield") or 0),
+                roe=float(r.get("roe") or 0),
+                mcap=float(r.get("market_cap") or 0),
+            )
+        return p
+
+    full_set = (
+        ", n.price = r.price, n.per = r.per, n.pbr = r.pbr, "
+        "n.dividend_yield = r.div, n.roe = r.roe, n.market_cap = r.mcap"
+    ) if full else ""
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:Report {id: r.id}) "
+        "SET n.date = r.date, n.symbol = r.symbol, "
+        "n.score = r.score, n.verdict = r.verdict, "
+        + _BULK_SET_EMBEDDING + full_set + " "
+        "MERGE (s:Stock {symbol: r.symbol}) "
+        "MERGE (n)-[:ANALYZED]->(s)",
+        _bulk_params(rows, build),
+    )
+
+
+def merge_trades_bulk(rows: list[dict]) -> bool:
+    """Create many Trade nodes and BOUGHT/SOLD relationships (merge_trade rows)."""
+    ok = True
+    for rel_type, is_buy in (("BOUGHT", True), ("SOLD", False)):
+        subset = [r for r in rows if (r.get("trade_type") == "buy") == is_buy]
+        if not subset:
+            continue
+        params = _bulk_params(subset, lambda r: {
+            "id": f"trade_{r['trade_date']}_{r['trade_type']}_{r['symbol']}",
+            "date": r["trade_date"], "type": r["trade_type"],
+            "symbol": r["symbol"], "shares": r["shares"], "price": r["price"],
+            "currency": r["currency"], "memo": r.get("memo", ""),
+            "sell_price": r.get("sell_price"),
+            "realized_pnl": r.get("realized_pnl"),
+            "hold_days": r.get("hold_days"),
+        })
+        ok = _run_bulk(
+            "UNWIND $rows AS r "
+            "MERGE (n:Trade {id: r.id}) "
+            "SET n.date = r.date, n.type = r.type, n.symbol = r.symbol, "
+            "n.shares = r.shares, n.price = r.price, n.currency = r.currency, "
+            "n.memo = r.memo, "
+            "n.sell_price = r.sell_price, n.realized_pnl = r.realized_pnl, "
+            "n.hold_days = r.hold_days, "
+            + _BULK_SET_EMBEDDING + " "
+            "MERGE (s:Stock {symbol: r.symbol}) "
+            f"MERGE (n)-[:{rel_type}]->(s)",
+            params,
+        ) and ok
+    return ok
+
+
+def merge_health_checks_bulk(rows: list[dict]) -> bool:
+    """Create many HealthCheck nodes and CHECKED relationships (merge_health rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "id": f"health_{r['health_date']}", "date": r["health_date"],
+        "total": r["summary"].get("total", 0),
+        "healthy": r["summary"].get("healthy", 0),
+        "exit_count": r["summary"].get("exit", 0),
+        "symbols": list(r["symbols"]),
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:HealthCheck {id: r.id}) "
+        "SET n.date = r.date, n.total = r.total, "
+        "n.healthy = r.healthy, n.exit_count = r.exit_count, "
+        + _BULK_SET_EMBEDDING + " "
+        "WITH n, r "
+        "UNWIND r.symbols AS sym "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:CHECKED]->(s)",
+        params,
+    )
+
+
+def merge_notes_bulk(rows: list[dict]) -> bool:
+    """Create many Note nodes and ABOUT relationships (merge_note rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "id": r["note_id"], "date": r["note_date"], "type": r["note_type"],
+        "content": r["content"], "source": r.get("source", ""),
+        "symbol": r.get("symbol") or "",
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:Note {id: r.id}) "
+        "SET n.date = r.date, n.type = r.type, "
+        "n.content = r.content, n.source = r.source, "
+        + _BULK_SET_EMBEDDING + " "
+        "FOREACH (sym IN CASE WHEN r.symbol <> '' THEN [r.symbol] ELSE [] END | "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:ABOUT]->(s))",
+        params,
+    )
+
+
+def merge_watchlists_bulk(rows: list[dict]) -> bool:
+    """Create many Watchlist nodes and BOOKMARKED relationships (merge_watchlist rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "name": r["name"], "symbols": list(r["symbols"]),
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:Watchlist {name: r.name}) "
+        "SET " + _BULK_SET_EMBEDDING + " "
+        "WITH n, r "
+        "UNWIND r.symbols AS sym "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:BOOKMARKED]->(s)",
+        params,
+    )
+
+
+def merge_stress_tests_bulk(rows: list[dict]) -> bool:
+    """Create many StressTest nodes and STRESSED relationships (merge_stress_test rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "id": f"stress_test_{r['test_date']}_{_safe_id(r['scenario'])}",
+        "date": r["test_date"], "scenario": r["scenario"],
+        "impact": float(r["portfolio_impact"]),
+        "var95": float(r.get("var_95", 0)), "var99": float(r.get("var_99", 0)),
+        "symbols": list(r["symbols"]),
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:StressTest {id: r.id}) "
+        "SET n.date = r.date, n.scenario = r.scenario, "
+        "n.portfolio_impact = r.impact, "
+        "n.var_95 = r.var95, n.var_99 = r.var99, "
+        "n.symbol_count = size(r.symbols), "
+        + _BULK_SET_EMBEDDING + " "
+        "WITH n, r "
+        "UNWIND r.symbols AS sym "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:STRESSED]->(s)",
+        params,
+    )
+
+
+def merge_forecasts_bulk(rows: list[dict]) -> bool:
+    """Create many Forecast nodes and FORECASTED relationships (merge_forecast rows)."""
+    params = _bulk_params(rows, lambda r: {
+        "id": f"forecast_{r['forecast_date']}", "date": r["forecast_date"],
+        "opt": float(r["optimistic"]), "base": float(r["base"]),
+        "pess": float(r["pessimistic"]),
+        "total": float(r.get("total_value_jpy", 0)),
+        "symbols": list(r["symbols"]),
+    })
+    return _run_bulk(
+        "UNWIND $rows AS r "
+        "MERGE (n:Forecast {id: r.id}) "
+        "SET n.date = r.date, n.optimistic = r.opt, "
+        "n.base = r.base, n.pessimistic = r.pess, "
+        "n.total_value_jpy = r.total, n.symbol_count = size(r.symbols), "
+        + _BULK_SET_EMBEDDING + " "
+        "WITH n, r "
+        "UNWIND r.symbols AS sym "
+        "MERGE (s:Stock {symbol: sym}) "
+        "MERGE (n)-[:FORECASTED]->(s)",
+        params,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Clear all (KIK-398 --rebuild)
 # ---------------------------------------------------------------------------
@@ -9,6 +9,14 @@ from typing import Optional
 
 import numpy as np
 
+# orjson: optional faster parser for load_history() (stdlib json otherwise)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -756,10 +764,34 @@ def save_forecast(
 # Load functions
 # ---------------------------------------------------------------------------
 
+def _json_literals(value) -> tuple[bytes, ...]:
+    """The ways json.dump can write *value* (with and without ensure_ascii)."""
+    return tuple(dict.fromkeys((
+        json.dumps(value).encode("utf-8"),
+        json.dumps(value, ensure_ascii=False).encode("utf-8"),
+    )))
+
+
+def _loads(raw: bytes):
+    """Parse a history file's bytes.
+
+    Uses orjson when installed; stdlib json handles what orjson rejects
+    (NaN/Infinity literals, integers beyond 64 bits).
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def load_history(
     category: str,
     days_back: int | None = None,
     base_dir: str = "data/history",
+    preset: str | None = None,
+    region: str | None = None,
 ) -> list[dict]:
     """Load history files for a category, sorted newest-first.
 
@@ -771,6 +803,10 @@ def load_history(
         If set, only return files from the last N days.
     base_dir : str
         Root history directory.
+    preset : str | None
+        If set, only return records whose "preset" equals this value.
+    region : str | None
+        If set, only return records whose "region" equals this value.
 
     Returns
     -------
@@ -785,6 +821,14 @@ def load_history(
     if days_back is not None:
         cutoff = (date.today() - timedelta(days=days_back)).isoformat()
 
+    # Field filters. A file whose bytes contain none of the JSON spellings
+    # of a wanted value cannot match, so it is skipped without parsing.
+    filters = [
+        (key, value, _json_literals(value))
+        for key, value in (("preset", preset), ("region", region))
+        if value is not None
+    ]
+
     results = []
     for fp in sorted(d.glob("*.json"), reverse=True):
         # Extract date prefix from filename (YYYY-MM-DD_...)
@@ -795,12 +839,18 @@ def load_history(
             continue
 
         try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            results.append(data)
-        except (json.JSONDecodeError, OSError):
+            raw = fp.read_bytes()
+            if not all(any(lit in raw for lit in lits) for _, _, lits in filters):
+                continue
+            data = _loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             # Skip corrupted files
             continue
+        if filters and not isinstance(data, dict):
+            # A top-level array/scalar has no fields to match
+            continue
+        if all(data.get(key) == value for key, value, _ in filters):
+            results.append(data)
 
     return results
 
@@ -0,0 +1,160 @@
+"""Manifest of history files already imported into Neo4j.
+
+``init_graph.py`` records (path, mtime_ns, size, digest) for every file it
+has merged and, on the next run, skips files whose stat is unchanged.
+Files whose stat changed but whose content did not (touch, git checkout)
+are recognised by a BLAKE2b digest of their bytes and skipped as well.
+The manifest is reset on ``--rebuild``.
+Graceful degradation: SQLite errors mean "not imported yet".
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+# (absolute path, mtime_ns, size, digest); mtime_ns is -1 if stat failed
+Entry = tuple[str, int, int, "bytes | None"]
+
+MANIFEST_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "cache" / "import_manifest.sqlite3"
+
+_conn: sqlite3.Connection | None = None
+
+
+def _get_conn() -> sqlite3.Connection | None:
+    """Lazy-open the manifest database. Returns None if it cannot be opened."""
+    global _conn
+    if _conn is not None:
+        return _conn
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(MANIFEST_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS imported "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest BLOB)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(imported)")}
+        if "digest" not in columns:
+            conn.execute("ALTER TABLE imported ADD COLUMN digest BLOB")
+        _conn = conn
+        return _conn
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def digest(raw: bytes) -> bytes:
+    """Return the content digest recorded for a file's bytes."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def filter_changed(paths: list[str]) -> tuple[list[str], list[Entry]]:
+    """Split off the files whose stat changed since they were last recorded.
+
+    Returns (changed_paths, entries) with one entry per changed path,
+    carrying the current stat and the previously recorded digest (or
+    None). Pass them to skip_same_content() and then record() once the
+    files have been merged. Files that cannot be stat'ed are returned as
+    changed so the caller's own error handling applies.
+    """
+    stats: list[tuple[str, int, int]] = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            stats.append((os.path.abspath(p), -1, -1))
+            continue
+        stats.append((os.path.abspath(p), st.st_mtime_ns, st.st_size))
+
+    known: dict[str, tuple[int, int, bytes | None]] = {}
+    conn = _get_conn()
+    if conn is not None and stats:
+        try:
+            # Stay well below SQLite's host-parameter limit
+            for start in range(0, len(stats), 500):
+                chunk = [e[0] for e in stats[start:start + 500]]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, digest FROM imported "
+                    f"WHERE path IN ({placeholders})",
+                    chunk,
+                )
+                for path, mtime_ns, size, dg in rows:
+                    known[path] = (mtime_ns, size, dg)
+        except sqlite3.Error:
+            known = {}
+
+    changed: list[str] = []
+    entries: list[Entry] = []
+    for p, (path, mtime_ns, size) in zip(paths, stats):
+        prev = known.get(path)
+        if mtime_ns >= 0 and prev is not None and prev[:2] == (mtime_ns, size):
+            continue
+        changed.append(p)
+        entries.append((path, mtime_ns, size, prev[2] if prev else None))
+    return changed, entries
+
+
+def skip_same_content(entries: list[Entry], raws: "list[bytes | None]",
+                      ) -> tuple["list[bytes | None]", list[Entry]]:
+    """Drop files whose bytes match their recorded digest.
+
+    *entries* come from filter_changed() and *raws* holds the bytes read
+    for the same files (None if unreadable). Unchanged files get their new
+    stat recorded right away and map to None in the returned raws. The
+    returned entries are the remaining files with their new digest, to be
+    passed to record() after the merge.
+    """
+    out: list[bytes | None] = []
+    pending: list[Entry] = []
+    touched: list[Entry] = []
+    for (path, mtime_ns, size, prev), raw in zip(entries, raws):
+        if raw is None:
+            out.append(None)
+            continue
+        dg = digest(raw)
+        if prev is not None and prev == dg:
+            touched.append((path, mtime_ns, size, dg))
+            out.append(None)
+            continue
+        out.append(raw)
+        pending.append((path, mtime_ns, size, dg))
+    record(touched)
+    return out, pending
+
+
+def record(entries: list[Entry]) -> None:
+    """Mark files as imported (entries from filter_changed or skip_same_content)."""
+    conn = _get_conn()
+    entries = [e for e in entries if e[1] >= 0]
+    if conn is None or not entries:
+        return
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO imported (path, mtime_ns, size, digest) "
+                "VALUES (?, ?, ?, ?)",
+                entries,
+            )
+    except sqlite3.Error:
+        pass
+
+
+def reset() -> None:
+    """Forget all imported files (used by --rebuild)."""
+    conn = _get_conn()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute("DELETE FROM imported")
+    except sqlite3.Error:
+        pass
+
+
+def close() -> None:
+    """Close the manifest database (for testing)."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
@@ -17,6 +17,7 @@ import yfinance as yf  # noqa: F401  (used by test patches)
 from src.data.yahoo_client._cache import (  # noqa: F401
     CACHE_DIR,
     CACHE_TTL_HOURS,
+    QUOTE_CACHE_TTL_SECONDS,
     _cache_path,
     _read_cache,
     _write_cache,
@@ -25,6 +26,9 @@ from src.data.yahoo_client._cache import (  # noqa: F401
     _read_detail_cache,
     _write_detail_cache,
     _read_stale_detail_cache,
+    _quote_cache_path,
+    _read_quote_cache,
+    _write_quote_cache,
     _is_network_error,
 )
 
@@ -42,6 +46,7 @@ from src.data.yahoo_client.detail import (  # noqa: F401
     _build_dividend_history_from_actions,
     get_stock_info,
     get_multiple_stocks,
+    get_quotes_batch,
     get_stock_detail,
 )
 
@@ -69,6 +74,7 @@ __all__ = [
     # Public functions
     "get_stock_info",
     "get_multiple_stocks",
+    "get_quotes_batch",
     "get_stock_detail",
     "screen_stocks",
     "get_price_history",
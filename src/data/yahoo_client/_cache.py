@@ -8,6 +8,7 @@ from typing import Any, Optional
 
 CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "cache"
 CACHE_TTL_HOURS = 24
+QUOTE_CACHE_TTL_SECONDS = 60
 
 
 def _is_network_error(exc: Exception) -> bool:
@@ -140,3 +141,38 @@ def _read_stale_detail_cache(symbol: str) -> Optional[dict]:
         return data
     except (json.JSONDecodeError, ValueError, KeyError):
         return None
+
+
+# ---------------------------------------------------------------------------
+# Quote cache helpers (short TTL, written by get_quotes_batch)
+# ---------------------------------------------------------------------------
+
+def _quote_cache_path(symbol: str) -> Path:
+    """Return the quote-cache file path for a given symbol."""
+    safe_name = symbol.replace(".", "_").replace("/", "_")
+    return CACHE_DIR / f"{safe_name}_quote.json"
+
+
+def _read_quote_cache(symbol: str) -> Optional[dict]:
+    """Read a cached quote if it is younger than QUOTE_CACHE_TTL_SECONDS."""
+    path = _quote_cache_path(symbol)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cached_at = datetime.fromisoformat(data.get("_cached_at", ""))
+        if datetime.now() - cached_at > timedelta(seconds=QUOTE_CACHE_TTL_SECONDS):
+            return None
+        return data
+    except (json.JSONDecodeError, ValueError, KeyError, OSError):
+        return None
+
+
+def _write_quote_cache(symbol: str, data: dict) -> None:
+    """Write a quote to cache with a timestamp."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    data["_cached_at"] = datetime.now().isoformat()
+    path = _quote_cache_path(symbol)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
@@ -15,6 +15,8 @@ from src.data.yahoo_client._cache import (
     _read_detail_cache,
     _write_detail_cache,
     _read_stale_detail_cache,
+    _read_quote_cache,
+    _write_quote_cache,
     _is_network_error,
 )
 from src.data.yahoo_client._normalize import (
@@ -259,6 +261,80 @@ def get_multiple_stocks(symbols: list[str]) -> dict[str, Optional[dict]]:
     return results
 
 
+# Symbols per yf.download() request in get_quotes_batch()
+_QUOTE_BATCH_SIZE = 20
+
+
+def _last_close(df: Any, symbol: str) -> Optional[float]:
+    """Latest non-NaN close for *symbol* in a yf.download() frame."""
+    if df is None or df.empty:
+        return None
+    try:
+        if isinstance(df.columns, pd.MultiIndex):
+            closes = df[symbol]["Close"]
+        else:
+            closes = df["Close"]
+    except KeyError:
+        return None
+    closes = closes.dropna()
+    if closes.empty:
+        return None
+    price = float(closes.iloc[-1])
+    return price if price > 0 else None
+
+
+def get_quotes_batch(symbols: list[str]) -> dict[str, Optional[dict]]:
+    """Fetch current prices for many symbols in batched requests.
+
+    Symbols with a fresh get_stock_info() cache entry or a quote cached
+    within ``QUOTE_CACHE_TTL_SECONDS`` are answered from the cache; the rest
+    are downloaded ``_QUOTE_BATCH_SIZE`` at a time with a 1-second delay
+    between requests, and each downloaded price is cached per symbol.
+
+    Returns a dict mapping symbol -> {"symbol", "price"}, or None when no
+    price could be read (callers fall back to get_stock_info(), which also
+    handles offline mode).
+    """
+    quotes: dict[str, Optional[dict]] = {}
+    pending: list[str] = []
+    for symbol in dict.fromkeys(symbols):
+        cached = _read_cache(symbol)
+        if cached is None or cached.get("price") is None:
+            cached = _read_quote_cache(symbol)
+        if cached is not None and cached.get("price") is not None:
+            quotes[symbol] = {"symbol": symbol, "price": cached["price"]}
+        else:
+            pending.append(symbol)
+
+    if _OFFLINE_MODE:
+        quotes.update(dict.fromkeys(pending))
+        return quotes
+
+    for start in range(0, len(pending), _QUOTE_BATCH_SIZE):
+        chunk = pending[start:start + _QUOTE_BATCH_SIZE]
+        try:
+            time.sleep(1)  # rate-limit
+            df = yf.download(
+                chunk, period="5d", group_by="ticker", auto_adjust=False,
+                progress=False, threads=False,
+            )
+        except Exception as e:
+            if not _is_network_error(e):
+                print(f"[yahoo_client] Error fetching quotes for {', '.join(chunk)}: {e}")
+            df = None
+        for symbol in chunk:
+            price = _last_close(df, symbol)
+            if price is None:
+                quotes[symbol] = None
+                continue
+            quotes[symbol] = {"symbol": symbol, "price": price}
+            try:
+                _write_quote_cache(symbol, {"symbol": symbol, "price": price})
+            except OSError:
+                pass
+    return quotes
+
+
 # ---------------------------------------------------------------------------
 # get_stock_detail
 # ---------------------------------------------------------------------------
@@ -6,6 +6,7 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -40,8 +41,12 @@ def _make_screening_file(tmp_path, screen_date, preset, region, stocks):
 
 
 def _mock_client(prices=None, price_history=None):
-    """Create a mock yahoo_client module with get_stock_info and get_price_history."""
+    """Create a mock yahoo_client module with get_stock_info and get_price_history.
+
+    get_quotes_batch prices nothing, so current prices come from get_stock_info.
+    """
     mock = MagicMock()
+    mock.get_quotes_batch.side_effect = lambda symbols: {}
 
     if prices is not None:
         def _get_info(symbol):
@@ -187,6 +192,21 @@ class TestRunBacktest:
         assert stock["price_at_screen"] == 2800
         assert stock["screen_date"] == old_date
 
+    def test_duplicate_symbol_skips_unpriced_oldest(self, tmp_path):
+        dates = [(date.today() - timedelta(days=d)).isoformat() for d in (40, 20, 5)]
+        for screen_date, price in zip(dates, (None, 2900, 3000)):
+            _make_screening_file(
+                tmp_path, screen_date, "value", "japan",
+                [{"symbol": "7203.T", "name": "Toyota", "price": price, "value_score": 70}],
+            )
+
+        mock = _mock_client(prices={"7203.T": 3100})
+        result = run_backtest(mock, base_dir=str(tmp_path), days_back=90)
+
+        stock = result["stocks"][0]
+        assert stock["price_at_screen"] == 2900
+        assert stock["screen_date"] == dates[1]
+
     def test_win_rate_calculation(self, tmp_path):
         screen_date = (date.today() - timedelta(days=10)).isoformat()
         _make_screening_file(
@@ -206,6 +226,23 @@ class TestRunBacktest:
         # 2 winners out of 3
         assert result["win_rate"] == pytest.approx(2 / 3)
 
+    def test_summary_stats(self, tmp_path):
+        screen_date = (date.today() - timedelta(days=10)).isoformat()
+        _make_screening_file(
+            tmp_path, screen_date, "value", "japan",
+            [{"symbol": s, "name": s, "price": 100, "value_score": 50}
+             for s in ("A", "B", "C", "D")],
+        )
+        mock = _mock_client(prices={"A": 130, "B": 110, "C": 100, "D": 80})
+
+        result = run_backtest(mock, base_dir=str(tmp_path), days_back=90)
+
+        assert result["avg_return"] == pytest.approx(0.05)
+        assert result["median_return"] == pytest.approx(0.05)
+        assert result["win_rate"] == pytest.approx(0.5)
+        assert all(type(result[k]) is float
+                   for k in ("avg_return", "median_return", "win_rate"))
+
     def test_alpha_calculation(self, tmp_path):
         screen_date = (date.today() - timedelta(days=10)).isoformat()
         _make_screening_file(
@@ -225,6 +262,29 @@ class TestRunBacktest:
         assert result["alpha_nikkei"] == pytest.approx(0.5 - 0.1)
         assert result["alpha_sp500"] == pytest.approx(0.5 - 0.1)
 
+    def test_benchmark_follows_start_when_earliest_stock_drops(self, tmp_path, monkeypatch):
+        from src.core.portfolio import backtest
+
+        monkeypatch.setattr(backtest, "_benchmark_cache", {})
+        old_date = (date.today() - timedelta(days=200)).isoformat()
+        new_date = (date.today() - timedelta(days=10)).isoformat()
+        _make_screening_file(
+            tmp_path, old_date, "value", "japan",
+            [{"symbol": "GONE", "name": "Gone", "price": 100, "value_score": 50}],
+        )
+        _make_screening_file(
+            tmp_path, new_date, "value", "japan",
+            [{"symbol": "KEEP", "name": "Keep", "price": 100, "value_score": 50}],
+        )
+        mock = _mock_client(prices={"KEEP": 150}, price_history=_make_price_df(100, 110))
+
+        result = run_backtest(mock, base_dir=str(tmp_path), days_back=365)
+
+        assert result["period"]["start"] == new_date
+        assert result["benchmark"]["nikkei"] == pytest.approx(0.1)
+        periods = {c.kwargs["period"] for c in mock.get_price_history.call_args_list}
+        assert "1mo" in periods
+
     def test_missing_current_price_skips_stock(self, tmp_path):
         screen_date = (date.today() - timedelta(days=10)).isoformat()
         _make_screening_file(
@@ -241,6 +301,7 @@ class TestRunBacktest:
             return None  # BAD and benchmarks return None
 
         mock = MagicMock()
+        mock.get_quotes_batch.side_effect = lambda symbols: {}
         mock.get_stock_info.side_effect = _get_info
         mock.get_price_history.return_value = None
 
@@ -280,6 +341,19 @@ class TestRunBacktest:
         symbols = [s["symbol"] for s in result["stocks"]]
         assert symbols == ["HIGH", "MID", "LOW"]
 
+    def test_equal_returns_keep_screen_order(self, tmp_path):
+        screen_date = (date.today() - timedelta(days=10)).isoformat()
+        _make_screening_file(
+            tmp_path, screen_date, "value", "japan",
+            [{"symbol": s, "name": s, "price": 100, "value_score": 50}
+             for s in ("B", "A", "C", "D")],
+        )
+        mock = _mock_client(prices={"A": 110, "B": 110, "C": 120, "D": 110})
+
+        result = run_backtest(mock, base_dir=str(tmp_path), days_back=90)
+
+        assert [s["symbol"] for s in result["stocks"]] == ["C", "B", "A", "D"]
+
     def test_days_back_limits_scope(self, tmp_path):
         old_date = (date.today() - timedelta(days=100)).isoformat()
         recent_date = (date.today() - timedelta(days=5)).isoformat()
@@ -302,6 +376,43 @@ class TestRunBacktest:
         assert "NEW" in symbols
         assert "OLD" not in symbols
 
+    def test_batch_quotes_skip_stock_info(self, tmp_path):
+        screen_date = (date.today() - timedelta(days=10)).isoformat()
+        _make_screening_file(
+            tmp_path, screen_date, "value", "japan",
+            [
+                {"symbol": "A", "name": "A", "price": 100, "value_score": 50},
+                {"symbol": "B", "name": "B", "price": 100, "value_score": 50},
+            ],
+        )
+        mock = _mock_client(prices={"B": 90})
+        mock.get_quotes_batch.side_effect = lambda symbols: {
+            "A": {"symbol": "A", "price": 110}, "B": None,
+        }
+
+        result = run_backtest(mock, base_dir=str(tmp_path), days_back=90)
+
+        assert [s["symbol"] for s in result["stocks"]] == ["A", "B"]
+        assert result["stocks"][0]["price_now"] == 110
+        mock.get_stock_info.assert_called_once_with("B")
+
+    def test_max_workers_does_not_change_result(self, tmp_path):
+        screen_date = (date.today() - timedelta(days=10)).isoformat()
+        stocks = [
+            {"symbol": f"S{i}", "name": f"Stock{i}", "price": 100, "value_score": 50}
+            for i in range(20)
+        ]
+        _make_screening_file(tmp_path, screen_date, "value", "japan", stocks)
+        prices = {f"S{i}": 100 + i for i in range(20) if i % 3}
+
+        serial = run_backtest(_mock_client(prices=prices), base_dir=str(tmp_path),
+                              max_workers=1)
+        threaded = run_backtest(_mock_client(prices=prices), base_dir=str(tmp_path),
+                                max_workers=8)
+
+        assert threaded["stocks"] == serial["stocks"]
+        assert threaded["total_stocks"] == len(prices)
+
 
 # ===================================================================
 # _get_benchmark_return
@@ -361,3 +472,97 @@ class TestBenchmark:
 
         result = _get_benchmark_return(mock, "^N225", "2026-01-01")
         assert result is None
+
+    def test_benchmark_result_cached(self, monkeypatch):
+        from src.core.portfolio import backtest
+
+        monkeypatch.setattr(backtest, "_benchmark_cache", {})
+        mock = MagicMock()
+        mock.get_price_history.return_value = _make_price_df(100, 120, n=20)
+
+        first = _get_benchmark_return(mock, "^N225", "2026-01-01")
+        second = _get_benchmark_return(mock, "^N225", "2026-01-01")
+
+        assert first == second == pytest.approx(0.2)
+        assert mock.get_price_history.call_count == 1
+
+    def test_benchmark_cache_expires(self, monkeypatch):
+        from src.core.portfolio import backtest
+
+        monkeypatch.setattr(backtest, "_benchmark_cache", {})
+        mock = MagicMock()
+        mock.get_price_history.return_value = _make_price_df(100, 120, n=20)
+        _get_benchmark_return(mock, "^N225", "2026-01-01")
+
+        for key, (value, fetched_at) in list(backtest._benchmark_cache.items()):
+            backtest._benchmark_cache[key] = (value, fetched_at - backtest._BENCHMARK_TTL - 1)
+        _get_benchmark_return(mock, "^N225", "2026-01-01")
+
+        assert mock.get_price_history.call_count == 2
+
+    def test_benchmark_failure_not_cached(self, monkeypatch):
+        from src.core.portfolio import backtest
+
+        monkeypatch.setattr(backtest, "_benchmark_cache", {})
+        mock = MagicMock()
+        mock.get_price_history.return_value = None
+        assert _get_benchmark_return(mock, "^N225", "2026-01-01") is None
+
+        mock.get_price_history.return_value = _make_price_df(100, 110, n=5)
+        assert _get_benchmark_return(mock, "^N225", "2026-01-01") == pytest.approx(0.1)
+
+    def test_benchmark_period_follows_start_date(self):
+        from src.core.portfolio.backtest import _benchmark_period
+
+        today = date.today()
+        assert _benchmark_period((today - timedelta(days=10)).isoformat()) == "1mo"
+        assert _benchmark_period((today - timedelta(days=60)).isoformat()) == "3mo"
+        assert _benchmark_period((today - timedelta(days=90)).isoformat()) == "6mo"
+        assert _benchmark_period((today - timedelta(days=300)).isoformat()) == "1y"
+        assert _benchmark_period((today - timedelta(days=4000)).isoformat()) == "max"
+        assert _benchmark_period("") == "1y"
+
+    def test_benchmark_requests_narrow_period(self, monkeypatch):
+        from src.core.portfolio import backtest
+
+        monkeypatch.setattr(backtest, "_benchmark_cache", {})
+        mock = MagicMock()
+        mock.get_price_history.return_value = _make_price_df(100, 120, n=20)
+        start = (date.today() - timedelta(days=30)).isoformat()
+
+        _get_benchmark_return(mock, "^N225", start)
+
+        mock.get_price_history.assert_called_once_with("^N225", period="3mo")
+
+
+# ===================================================================
+# to_json_bytes
+# ===================================================================
+
+
+class TestToJsonBytes:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, monkeypatch, use_orjson):
+        from src.core.portfolio import backtest
+
+        if use_orjson and not backtest.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(backtest, "HAS_ORJSON", use_orjson)
+        result = {
+            "period": {"start": "2026-01-01", "end": "2026-02-01"},
+            "stocks": [{"symbol": "7203.T", "name": "トヨタ", "return_pct": 0.1}],
+            "avg_return": np.float64(0.1),
+            "returns": np.array([0.1, -0.2]),
+            "median_return": float("nan"),
+            "alpha_nikkei": None,
+        }
+
+        raw = backtest.to_json_bytes(result)
+
+        assert isinstance(raw, bytes)
+        decoded = json.loads(raw)
+        assert decoded["stocks"][0]["name"] == "トヨタ"
+        assert decoded["avg_return"] == pytest.approx(0.1)
+        assert decoded["returns"] == [0.1, -0.2]
+        assert decoded["median_return"] is None
+        assert decoded["alpha_nikkei"] is None
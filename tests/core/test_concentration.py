@@ -5,6 +5,7 @@ import pytest
 from src.core.portfolio.concentration import (
     compute_hhi,
     get_concentration_multiplier,
+    get_concentration_multiplier_vec,
     analyze_concentration,
     _classify_risk_level,
 )
@@ -63,6 +64,21 @@ class TestComputeHhi:
             hhi = compute_hhi(weights)
             assert 0.0 <= hhi <= 1.0
 
+    def test_ndarray_input(self):
+        """NumPy arrays are accepted directly, including float32 and empty."""
+        import numpy as np
+
+        assert compute_hhi(np.array([0.5, 0.5])) == pytest.approx(0.5)
+        assert compute_hhi(np.array([0.25] * 4, dtype=np.float32)) == pytest.approx(0.25)
+        assert compute_hhi(np.array([])) == 0.0
+        assert isinstance(compute_hhi(np.array([1.0])), float)
+
+    def test_large_input_matches_python_sum(self):
+        """The numpy path for many weights agrees with sum(w*w)."""
+        weights = [1.0 / 200] * 100 + [0.5 / 100] * 100
+        assert isinstance(compute_hhi(weights), float)
+        assert compute_hhi(weights) == pytest.approx(sum(w * w for w in weights))
+
 
 # ===================================================================
 # get_concentration_multiplier tests
@@ -116,6 +132,12 @@ class TestGetConcentrationMultiplier:
             assert m >= prev, f"Non-monotonic at HHI={hhi}: {m} < {prev}"
             prev = m
 
+    def test_vectorised_matches_scalar(self):
+        """The array version agrees element-wise with the scalar version."""
+        hhis = [-0.1, 0.0, 0.24, 0.25, 0.3, 0.5, 0.51, 0.75, 1.0, 1.5]
+        result = get_concentration_multiplier_vec(hhis)
+        assert result.tolist() == [get_concentration_multiplier(h) for h in hhis]
+
 
 # ===================================================================
 # _classify_risk_level tests
@@ -173,6 +195,22 @@ class TestAnalyzeConcentration:
         assert result["concentration_multiplier"] == pytest.approx(1.6)
         assert result["risk_level"] == "危険な集中"
 
+    def test_ndarray_weights_match_list(self):
+        """ndarray weights give the same result with plain float breakdowns."""
+        import numpy as np
+
+        portfolio = [
+            {"sector": "Technology", "country": "US", "currency": "USD"},
+            {"sector": "Technology", "country": "JP", "currency": "JPY"},
+            {"sector": "Energy", "country": "JP", "currency": "JPY"},
+        ]
+        weights = [0.5, 0.3, 0.2]
+        expected = analyze_concentration(portfolio, weights)
+        result = analyze_concentration(portfolio, np.array(weights))
+
+        assert result == expected
+        assert all(type(v) is float for v in result["sector_breakdown"].values())
+
     def test_sector_concentrated_but_region_diversified(self):
         """All same sector but different regions."""
         portfolio = [
@@ -191,6 +229,25 @@ class TestAnalyzeConcentration:
         assert result["max_hhi_axis"] == "sector"
         assert result["max_hhi"] == pytest.approx(1.0)
 
+    def test_max_axis_ties_and_currency(self):
+        """Ties resolve sector > region > currency; currency wins when highest."""
+        portfolio = [
+            {"sector": "Tech", "country": "US", "currency": "USD"},
+            {"sector": "Finance", "country": "JP", "currency": "USD"},
+        ]
+        result = analyze_concentration(portfolio, [0.5, 0.5])
+        assert result["max_hhi_axis"] == "currency"
+        assert result["max_hhi"] == pytest.approx(1.0)
+
+        portfolio[1]["currency"] = "JPY"
+        result = analyze_concentration(portfolio, [0.5, 0.5])
+        assert result["max_hhi_axis"] == "sector"
+
+        portfolio[1]["sector"] = "Tech"
+        portfolio[1]["country"] = "US"
+        result = analyze_concentration(portfolio, [0.5, 0.5])
+        assert result["max_hhi_axis"] == "sector"
+
     def test_missing_keys_use_defaults(self):
         """Missing sector/country/currency should use default labels."""
         portfolio = [
@@ -220,6 +277,57 @@ class TestAnalyzeConcentration:
         assert "Asia" in result["region_breakdown"]
         assert "Europe" in result["region_breakdown"]
 
+    def test_large_portfolio_numpy_grouping_matches(self, monkeypatch):
+        """The bincount path for large portfolios matches the dict path."""
+        from src.core.portfolio import concentration
+
+        portfolio = [
+            {"sector": f"S{i % 7}", "country": None if i % 5 else "Japan",
+             "currency": ("JPY", "USD", None)[i % 3]}
+            for i in range(600)
+        ]
+        weights = [1.0 / 600] * 600
+        keys = ("sector", "country", "region", "currency")
+
+        fast = concentration._group_axes(portfolio, weights, keys, "不明")
+        monkeypatch.setattr(concentration, "_GROUP_NUMPY_MIN", 10**9)
+        slow = concentration._group_axes(portfolio, weights, keys, "不明")
+
+        assert fast == slow
+        assert [list(b) for b in fast] == [list(b) for b in slow]
+
+    def test_large_portfolio_nan_label(self, monkeypatch):
+        """NaN labels are grouped on the bincount path instead of raising."""
+        from src.core.portfolio import concentration
+
+        nan = float("nan")
+        portfolio = [
+            {"sector": nan if i % 4 == 0 else "Tech", "country": "Japan",
+             "currency": "JPY"}
+            for i in range(600)
+        ]
+        weights = [1.0 / 600] * 600
+
+        result = analyze_concentration(portfolio, weights)
+        monkeypatch.setattr(concentration, "_GROUP_NUMPY_MIN", 10**9)
+        expected = analyze_concentration(portfolio, weights)
+
+        fast = result["sector_breakdown"]
+        slow = expected["sector_breakdown"]
+        assert fast["Tech"] == pytest.approx(slow["Tech"]) == pytest.approx(0.75)
+        nan_weights = [w for k, w in fast.items() if k != "Tech"]
+        assert nan_weights == [pytest.approx(0.25)]
+        assert result["sector_hhi"] == pytest.approx(expected["sector_hhi"])
+
+    def test_region_key_ignored_when_any_country_present(self):
+        """'region' is only used when no holding has a 'country'."""
+        portfolio = [
+            {"sector": "Tech", "country": "Japan", "region": "Asia", "currency": "JPY"},
+            {"sector": "Finance", "region": "Europe", "currency": "EUR"},
+        ]
+        result = analyze_concentration(portfolio, [0.5, 0.5])
+        assert result["region_breakdown"] == {"Japan": 0.5, "不明": 0.5}
+
     def test_result_structure(self):
         """Verify all expected keys in result dict."""
         portfolio = [{"sector": "Tech", "country": "US", "currency": "USD"}]
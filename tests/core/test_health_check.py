@@ -12,6 +12,7 @@ from src.core.health_check import (
     ALERT_CAUTION,
     ALERT_EXIT,
     _is_etf,
+    _rolling_mean,
     check_trend_health,
     check_change_quality,
     compute_alert_level,
@@ -143,6 +144,12 @@ class TestCheckTrendHealth:
         result = check_trend_health(short)
         assert result["trend"] == "不明"
 
+    def test_default_result_is_a_fresh_dict(self):
+        first = check_trend_health(None)
+        first["trend"] = "mutated"
+        assert type(first) is dict
+        assert check_trend_health(None)["trend"] == "不明"
+
     def test_missing_close_column(self):
         df = pd.DataFrame({"Open": [100.0] * 300})
         result = check_trend_health(df)
@@ -189,6 +196,79 @@ class TestCheckTrendHealth:
         }
         assert set(result.keys()) == expected_keys
 
+    def test_sma_matches_pandas_rolling(self):
+        rng = np.random.default_rng(0)
+        prices = 100 + np.cumsum(rng.normal(0, 1, 300))
+        hist = pd.DataFrame({"Close": prices, "Volume": [1000] * 300})
+        result = check_trend_health(hist)
+        close = hist["Close"]
+        assert result["sma50"] == pytest.approx(close.rolling(50).mean().iloc[-1], rel=1e-12)
+        assert result["sma200"] == pytest.approx(close.rolling(200).mean().iloc[-1], rel=1e-12)
+
+    def test_long_history_uses_tail_only(self):
+        rng = np.random.default_rng(3)
+        prices = 100 + np.cumsum(rng.normal(0, 1, 1000))
+        long_hist = pd.DataFrame({"Close": prices, "Volume": [1000] * 1000})
+        result = check_trend_health(long_hist)
+        close = long_hist["Close"]
+        assert result["sma200"] == pytest.approx(close.rolling(200).mean().iloc[-1], rel=1e-12)
+        assert result["sma50"] == pytest.approx(close.rolling(50).mean().iloc[-1], rel=1e-12)
+
+    def test_flat_tail_equals_price(self):
+        prices = [90.0 + (i % 7) * 0.37 for i in range(100)] + [100.0] * 200
+        hist = pd.DataFrame({"Close": prices, "Volume": [1000] * 300})
+        result = check_trend_health(hist)
+        assert result["sma50"] == 100.0
+        assert result["price_above_sma50"] is False
+
+    def test_values_not_rounded(self):
+        prices = [100.0 + i * 0.001 for i in range(300)]
+        hist = pd.DataFrame({"Close": prices, "Volume": [1000] * 300})
+        result = check_trend_health(hist)
+        assert result["current_price"] == prices[-1]
+        assert result["sma50"] == pytest.approx(sum(prices[-50:]) / 50, rel=1e-12)
+
+    def test_nan_in_sma_window(self):
+        hist = _make_uptrend_hist()
+        hist.loc[hist.index[-10], "Close"] = np.nan
+        result = check_trend_health(hist)
+        assert math.isnan(result["sma50"])
+        assert math.isnan(result["sma200"])
+
+
+class TestCheckTrendHealthNp:
+    """_check_trend_health_np() works on plain arrays."""
+
+    def test_matches_dataframe_entry(self):
+        from src.core.health_check import _check_trend_health_np
+
+        hist = _make_golden_cross_hist()
+        hist.index = pd.date_range("2024-01-01", periods=len(hist), freq="B")
+        expected = check_trend_health(hist)
+        result = _check_trend_health_np(
+            hist["Close"].to_numpy(), hist.index.to_numpy(),
+        )
+        assert result == expected
+        assert result["cross_date"] is not None
+
+    def test_short_array(self):
+        from src.core.health_check import _check_trend_health_np
+
+        result = _check_trend_health_np(np.full(50, 100.0), list(range(50)))
+        assert result["trend"] == "不明"
+
+
+class TestRollingMean:
+    def test_matches_pandas_with_gaps(self):
+        rng = np.random.default_rng(1)
+        values = 100 + np.cumsum(rng.normal(0, 1, 260))
+        values[[5, 120]] = np.nan
+        expected = pd.Series(values).rolling(50).mean().to_numpy()[49:]
+        np.testing.assert_allclose(_rolling_mean(values, 50), expected)
+
+    def test_length(self):
+        assert len(_rolling_mean(np.arange(10, dtype=float), 4)) == 7
+
 
 # ===================================================================
 # check_change_quality tests
@@ -259,6 +339,23 @@ class TestCheckChangeQuality:
         }
         assert set(result.keys()) == expected_keys
 
+    def test_change_score_memoized_per_content(self):
+        from src.core.screening.alpha import compute_change_score
+
+        first = compute_change_score(_good_stock_detail())
+        score = first["accruals"]["score"]
+        first["accruals"]["score"] = -1
+        again = compute_change_score(_good_stock_detail())
+        assert again["accruals"]["score"] == score
+        assert compute_change_score(_bad_stock_detail())["change_score"] < again["change_score"]
+
+    def test_change_score_reads_history_head_only(self):
+        from src.core.screening.alpha import compute_change_score
+
+        detail = _good_stock_detail()
+        longer = dict(detail, revenue_history=detail["revenue_history"] + [1, 2])
+        assert compute_change_score(longer) == compute_change_score(detail)
+
 
 # ===================================================================
 # compute_alert_level tests
@@ -401,6 +498,33 @@ class TestComputeAlertLevel:
 # format_health_check tests
 # ===================================================================
 
+class TestComputeAlertLevelMemo:
+    """compute_alert_level() memoizes on the extracted signals."""
+
+    _trend = {
+        "trend": "下降", "price_above_sma50": False, "dead_cross": False,
+        "rsi_drop": False, "sma50_approaching_sma200": False,
+        "sma50": 100.0, "current_price": 95.0,
+    }
+
+    def test_reasons_list_not_shared(self):
+        first = compute_alert_level(dict(self._trend), {"quality_label": "良好"})
+        first["reasons"].append("mutated")
+        second = compute_alert_level(dict(self._trend), {"quality_label": "良好"})
+        assert second["reasons"] == ["SMA50を下回り（現在95.0、SMA50=100.0）"]
+
+    def test_reason_values_rounded_for_display(self):
+        trend = dict(self._trend, sma50=100.123456, current_price=95.987654)
+        result = compute_alert_level(trend, {"quality_label": "良好"})
+        assert result["reasons"] == ["SMA50を下回り（現在95.99、SMA50=100.12）"]
+
+    def test_int_and_float_values_kept_apart(self):
+        as_int = dict(self._trend, sma50=100, current_price=95)
+        compute_alert_level(dict(self._trend), {"quality_label": "良好"})
+        result = compute_alert_level(as_int, {"quality_label": "良好"})
+        assert result["reasons"] == ["SMA50を下回り（現在95、SMA50=100）"]
+
+
 class TestFormatHealthCheck:
 
     def test_empty_positions(self):
@@ -955,6 +1079,17 @@ from src.core.health_check import _detect_value_trap
 class TestDetectValueTrap:
     """Tests for _detect_value_trap() (KIK-381)."""
 
+    def test_empty_and_all_none(self):
+        assert _detect_value_trap({}) == {"is_trap": False, "reasons": []}
+        stock = {"symbol": "1306.T", "per": None, "pbr": None, "roe": None}
+        assert _detect_value_trap(stock) == {"is_trap": False, "reasons": []}
+
+    def test_memoized_result_not_shared(self):
+        stock = {"per": 5.0, "eps_growth": -0.10}
+        first = _detect_value_trap(stock)
+        first["reasons"].append("mutated")
+        assert _detect_value_trap(dict(stock))["reasons"] == ["低PERだが利益減少中"]
+
     def test_condition_a_low_per_negative_growth(self):
         stock = {"per": 5.0, "eps_growth": -0.10}
         result = _detect_value_trap(stock)
@@ -1021,6 +1156,49 @@ class TestDetectValueTrap:
 # ===================================================================
 
 
+class TestExtractFundamentals:
+    """The shared fundamentals pass matches the per-check extraction."""
+
+    def test_non_finite_and_missing_become_none(self):
+        from src.core.health_check import _extract_fundamentals
+
+        f = _extract_fundamentals({"per": float("nan"), "roe": 0.12, "pbr": "1.1"})
+        assert f.per is None
+        assert f.roe == 0.12
+        assert f.eps_growth is None
+        assert _extract_fundamentals(None).per is None
+
+    def test_value_trap_matches_detect_value_trap(self):
+        from src.core.health_check import _extract_fundamentals, _value_trap_from
+
+        for stock in (
+            {},
+            {"per": 5.0, "eps_growth": -0.10},
+            {"per": 5.22, "pbr": 1.02, "roe": 0.177, "eps_growth": 2.43, "revenue_growth": -0.118},
+            {"pbr": 0.6, "roe": 0.03, "eps_growth": -0.05},
+        ):
+            assert _value_trap_from(_extract_fundamentals(stock)) == _detect_value_trap(stock)
+
+    def test_long_term_with_fundamentals(self):
+        from src.core.health_check import _extract_fundamentals, check_long_term_suitability
+
+        stock = {"symbol": "7203.T", "roe": 0.20, "eps_growth": 0.15,
+                 "dividend_yield": 0.03, "per": 12.0}
+        assert check_long_term_suitability(
+            stock, fundamentals=_extract_fundamentals(stock),
+        ) == check_long_term_suitability(stock)
+
+    def test_alert_uses_given_value_trap(self):
+        trend = {"trend": "上昇", "rsi": 50.0, "sma50": 100.0, "sma200": 90.0,
+                 "current_price": 105.0}
+        quality = {"quality_label": "良好"}
+        trap = {"is_trap": True, "reasons": ["低PERだが利益減少中"]}
+        alert = compute_alert_level(trend, quality, stock_detail={}, value_trap=trap)
+        assert alert == compute_alert_level(
+            trend, quality, stock_detail={"per": 5.0, "eps_growth": -0.10},
+        )
+
+
 class TestReturnStabilityAlertIntegration:
     """Tests for shareholder return stability in compute_alert_level() (KIK-403)."""
 
@@ -1205,3 +1383,57 @@ class TestReturnStabilityAlertIntegration:
             return_stability=stability,
         )
         assert result["level"] == ALERT_NONE
+
+
+# ===================================================================
+# run_health_check tests
+# ===================================================================
+
+class TestRunHealthCheck:
+    """Tests for run_health_check() with a fake client."""
+
+    class _Client:
+        def __init__(self, hists):
+            self.hists = hists
+            self.calls = []
+
+        def get_price_history(self, symbol, period="1y"):
+            self.calls.append(("hist", symbol))
+            return self.hists.get(symbol)
+
+        def get_stock_detail(self, symbol):
+            self.calls.append(("detail", symbol))
+            return {"symbol": symbol}
+
+    def _run(self, monkeypatch, symbols, hists):
+        from src.core.portfolio import portfolio_manager
+
+        positions = [{"symbol": s, "name": s} for s in symbols]
+        monkeypatch.setattr(
+            portfolio_manager, "get_snapshot",
+            lambda csv_path, client, portfolio=None: {"positions": positions},
+        )
+        from src.core.health_check import run_health_check
+
+        client = self._Client(hists)
+        return run_health_check("unused.csv", client), client
+
+    def test_results_in_portfolio_order(self, monkeypatch):
+        symbols = [f"{1000 + i}.T" for i in range(12)]
+        hists = {s: _make_uptrend_hist() for s in symbols[::2]}
+        hists.update({s: _make_downtrend_hist() for s in symbols[1::2]})
+        result, _ = self._run(monkeypatch, symbols, hists)
+        assert [p["symbol"] for p in result["positions"]] == symbols
+        trends = [p["trend_health"]["trend"] for p in result["positions"]]
+        assert trends == ["上昇", "下降"] * 6
+        assert result["summary"]["total"] == 12
+
+    def test_cash_not_fetched(self, monkeypatch):
+        result, client = self._run(monkeypatch, ["JPY.CASH", "7203.T"], {})
+        assert [p["symbol"] for p in result["positions"]] == ["7203.T"]
+        assert {s for _, s in client.calls} == {"7203.T"}
+
+    def test_only_cash(self, monkeypatch):
+        result, client = self._run(monkeypatch, ["JPY.CASH"], {})
+        assert result["positions"] == []
+        assert client.calls == []
@@ -416,3 +416,9 @@ class TestCheckLongTermSuitabilityWithShareholderReturn:
         sh_return = {"total_return_rate": 0.025}
         result = check_long_term_suitability(detail, shareholder_return_data=sh_return)
         assert result["dividend_status"] == "high"
+
+    def test_repeated_calls_return_fresh_dicts(self):
+        detail = {"symbol": "7203.T", "roe": 0.18, "per": 15.0, "sector": "Auto"}
+        first = check_long_term_suitability(detail)
+        first["label"] = "mutated"
+        assert check_long_term_suitability(detail)["label"] == "要検討"
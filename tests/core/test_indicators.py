@@ -5,6 +5,7 @@ import pytest
 from src.core.screening.indicators import (
     assess_return_stability,
     calculate_value_score,
+    calculate_value_score_batch,
     calculate_shareholder_return,
     calculate_shareholder_return_history,
     _score_per,
@@ -305,6 +306,81 @@ class TestAnomalyValueScoring:
         assert calculate_value_score(stock) == 0.0
 
 
+# ===================================================================
+# calculate_value_score_batch
+# ===================================================================
+
+class TestValueInputKeys:
+    """Key lookup order for calculate_value_score() inputs."""
+
+    def test_zero_raw_per_does_not_fall_through(self):
+        assert calculate_value_score({"trailingPE": 0.0, "per": 5.0}) == 0.0
+
+    def test_none_raw_key_falls_through(self):
+        assert calculate_value_score({"trailingPE": None, "per": 5.0}) == \
+            calculate_value_score({"per": 5.0})
+
+    def test_zero_forward_raw_dividend_kept(self):
+        assert calculate_value_score({"dividendYield": 0.0, "dividend_yield": 0.04}) == 0.0
+
+    def test_normalised_dict_passed_through(self):
+        from src.core.screening.indicators import _normalize_stock_detail
+
+        stock = {"per": 10.0, "pbr": 0.8}
+        assert _normalize_stock_detail(stock) is stock
+
+    def test_raw_keys_folded_without_mutating_input(self):
+        from src.core.screening.indicators import _normalize_stock_detail
+
+        stock = {"trailingPE": 8.0, "per": 10.0, "priceToBook": None, "pbr": 0.8}
+        assert _normalize_stock_detail(stock) == {
+            "trailingPE": 8.0, "per": 8.0, "priceToBook": None, "pbr": 0.8,
+        }
+        assert stock["per"] == 10.0
+
+
+class TestCalculateValueScoreBatch:
+    """The batched score must equal calculate_value_score() per stock."""
+
+    def test_matches_scalar(self):
+        import random
+
+        rng = random.Random(0)
+
+        def val(lo, hi):
+            r = rng.random()
+            if r < 0.1:
+                return None
+            if r < 0.15:
+                return 0.0
+            return round(rng.uniform(lo, hi), rng.choice([1, 2, 3, 4]))
+
+        stocks = [
+            {
+                "per": val(-5, 40), "pbr": val(-0.5, 3),
+                "dividend_yield": val(-0.01, 0.12), "roe": val(-0.2, 0.4),
+                "revenue_growth": val(-0.3, 0.6),
+            }
+            for _ in range(5000)
+        ]
+        thresholds = {"per_max": 12.0, "pbr_max": 1.2,
+                      "dividend_yield_min": 0.025, "roe_min": 0.1}
+        for th in (None, thresholds):
+            expected = [calculate_value_score(s, th) for s in stocks]
+            assert calculate_value_score_batch(stocks, th).tolist() == expected
+
+    def test_yahoo_keys(self):
+        stocks = [{"trailingPE": 10.0, "priceToBook": 0.5, "dividendYield": 0.04}]
+        assert calculate_value_score_batch(stocks)[0] == calculate_value_score(stocks[0])
+
+    def test_empty(self):
+        assert len(calculate_value_score_batch([])) == 0
+
+    def test_nan_scores_zero(self):
+        scores = calculate_value_score_batch([{"per": float("nan"), "roe": float("nan")}])
+        assert scores.tolist() == [0.0]
+
+
 # ===================================================================
 # calculate_shareholder_return (KIK-375)
 # ===================================================================
@@ -1,6 +1,7 @@
 """Tests for src.core.portfolio.portfolio_manager module."""
 
 import os
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -112,6 +113,105 @@ class TestLoadPortfolio:
         loaded = load_portfolio(csv_path)
         assert len(loaded) == 0
 
+    def test_reordered_and_missing_columns(self, csv_path):
+        """Columns are matched by header name; absent ones get defaults."""
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            f.write("shares,symbol,cost_price\n")
+            f.write("10, AAPL ,175.5\n")
+            f.write("\n")
+        loaded = load_portfolio(csv_path)
+        assert loaded == [{
+            "symbol": "AAPL", "shares": 10, "cost_price": 175.5,
+            "cost_currency": "JPY", "purchase_date": "", "memo": "",
+        }]
+
+
+class TestPortfolioCache:
+    def test_returns_independent_copies(self, csv_path, sample_portfolio):
+        save_portfolio(sample_portfolio, csv_path)
+        first = load_portfolio(csv_path)
+        first[0]["shares"] = 999
+        first.pop()
+        assert load_portfolio(csv_path) == load_portfolio(csv_path)
+        assert load_portfolio(csv_path)[0]["shares"] == 100
+        assert len(load_portfolio(csv_path)) == 2
+
+    def test_external_edit_is_reloaded(self, csv_path, sample_portfolio):
+        save_portfolio(sample_portfolio, csv_path)
+        assert len(load_portfolio(csv_path)) == 2
+        with open(csv_path, "a", encoding="utf-8", newline="") as f:
+            f.write("MSFT,5,400.0,USD,,\n")
+        assert [p["symbol"] for p in load_portfolio(csv_path)][-1] == "MSFT"
+
+    def test_save_invalidates(self, csv_path, sample_portfolio):
+        save_portfolio(sample_portfolio, csv_path)
+        load_portfolio(csv_path)
+        save_portfolio(sample_portfolio[:1], csv_path)
+        assert len(load_portfolio(csv_path)) == 1
+
+
+class TestLoadPortfolioFast:
+    def test_matches_csv_reader(self, csv_path):
+        """pandas path returns the same records and types as load_portfolio."""
+        from src.core.portfolio.portfolio_manager import load_portfolio_fast
+
+        portfolio = [
+            {"symbol": "7203.T", "shares": 100, "cost_price": 2850.0,
+             "cost_currency": "JPY", "purchase_date": "2025-01-15", "memo": "NA"},
+            {"symbol": "AAPL", "shares": 10, "cost_price": 175.5,
+             "cost_currency": "USD", "purchase_date": "", "memo": 'a, "b"'},
+            {"symbol": "SKIP", "shares": 0, "cost_price": 1.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": "001"},
+        ]
+        save_portfolio(portfolio, csv_path)
+        fast = load_portfolio_fast(csv_path)
+
+        assert fast == load_portfolio(csv_path)
+        assert [p["symbol"] for p in fast] == ["7203.T", "AAPL"]
+        assert type(fast[0]["shares"]) is int
+        assert type(fast[0]["cost_price"]) is float
+        assert fast[0]["memo"] == "NA"
+
+    def test_large_file_uses_fast_path(self, csv_path, monkeypatch):
+        import src.core.portfolio.portfolio_manager as pm
+
+        save_portfolio([
+            {"symbol": "AAPL", "shares": 1, "cost_price": 1.0,
+             "cost_currency": "USD", "purchase_date": "", "memo": ""},
+        ], csv_path)
+        monkeypatch.setattr(pm, "_FAST_LOAD_MIN_BYTES", 0)
+        monkeypatch.setattr(pm, "_load_portfolio_csv", None)
+        assert [p["symbol"] for p in load_portfolio(csv_path)] == ["AAPL"]
+
+    def test_extra_field_truncated_like_csv_reader(self, csv_path):
+        """An unquoted comma in memo does not shift the columns."""
+        from src.core.portfolio.portfolio_manager import load_portfolio_fast
+
+        save_portfolio([], csv_path)
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("7203.T,100,2500,JPY,2024-01-01,a,b\n")
+            f.write("AAPL,10,175.5,USD,,memo\n")
+        fast = load_portfolio_fast(csv_path)
+
+        assert fast == load_portfolio(csv_path)
+        assert fast[0]["memo"] == "a"
+        assert fast[0]["cost_currency"] == "JPY"
+
+    def test_parser_error_falls_back_to_csv(self, csv_path, monkeypatch):
+        import pandas as pd
+        import src.core.portfolio.portfolio_manager as pm
+
+        save_portfolio([
+            {"symbol": "AAPL", "shares": 1, "cost_price": 1.0,
+             "cost_currency": "USD", "purchase_date": "", "memo": ""},
+        ], csv_path)
+
+        def broken(*args, **kwargs):
+            raise pd.errors.ParserError("bad")
+
+        monkeypatch.setattr(pd, "read_csv", broken)
+        assert [p["symbol"] for p in pm.load_portfolio_fast(csv_path)] == ["AAPL"]
+
 
 # ===================================================================
 # save_portfolio
@@ -612,6 +712,57 @@ class TestInferCountryCash:
 # ===================================================================
 
 
+class TestGetFxRates:
+    @staticmethod
+    def _client(prices):
+        class Client:
+            def __init__(self):
+                self.requested = []
+
+            def get_stock_info(self, symbol):
+                self.requested.append(symbol)
+                if symbol == "EURJPY=X":
+                    raise RuntimeError("boom")
+                price = prices.get(symbol)
+                return None if price is None else {"price": price}
+
+        return Client()
+
+    def test_all_pairs_in_order(self):
+        from src.core.portfolio.portfolio_manager import _FX_PAIRS, get_fx_rates
+
+        client = self._client({"USDJPY=X": 150.0, "SGDJPY=X": 110.0, "GBPJPY=X": 190.0})
+        rates = get_fx_rates(client)
+
+        assert rates == {"JPY": 1.0, "USD": 150.0, "SGD": 110.0, "GBP": 190.0}
+        assert list(rates) == ["JPY", "USD", "SGD", "GBP"]
+        assert sorted(client.requested) == sorted(_FX_PAIRS)
+
+    def test_concurrency_bounded(self):
+        import threading
+        import time
+        from src.core.portfolio.portfolio_manager import _FETCH_WORKERS, get_fx_rates
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        class Client:
+            @staticmethod
+            def get_stock_info(pair):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.01)
+                with lock:
+                    active -= 1
+                return {"price": 1.0}
+
+        rates = get_fx_rates(Client())
+        assert rates["USD"] == 1.0
+        assert peak <= _FETCH_WORKERS
+
+
 class TestGetSnapshotCash:
     def test_cash_position_skips_api(self, csv_path):
         """Cash positions should not trigger API calls."""
@@ -648,6 +799,143 @@ class TestGetSnapshotCash:
         assert not client.called
 
 
+class TestGetSnapshot:
+    def test_prices_and_fx_fetched_once_each(self, csv_path, sample_portfolio):
+        import threading
+
+        from src.core.portfolio.portfolio_manager import get_snapshot
+
+        save_portfolio(sample_portfolio + [
+            {"symbol": "JPY.CASH", "shares": 1, "cost_price": 1000.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": ""},
+        ], csv_path)
+
+        class Client:
+            def __init__(self):
+                self.calls = []
+                self.lock = threading.Lock()
+
+            def get_stock_info(self, symbol):
+                with self.lock:
+                    self.calls.append(symbol)
+                return {
+                    "7203.T": {"price": 3000.0, "name": "Toyota", "currency": "JPY"},
+                    "AAPL": {"price": 200.0, "name": "Apple", "currency": "USD"},
+                    "USDJPY=X": {"price": 150.0},
+                }.get(symbol)
+
+        client = Client()
+        result = get_snapshot(csv_path, client)
+
+        stock_calls = [c for c in client.calls if not c.endswith("=X")]
+        assert sorted(stock_calls) == ["7203.T", "AAPL"]
+        assert [p["symbol"] for p in result["positions"]] == ["7203.T", "AAPL", "JPY.CASH"]
+        toyota, apple, _ = result["positions"]
+        assert toyota["pnl"] == pytest.approx((3000.0 - 2850.0) * 100)
+        assert apple["evaluation_jpy"] == pytest.approx(200.0 * 10 * 150.0)
+        assert result["fx_rates"]["USD"] == 150.0
+
+    def test_fx_and_prices_share_one_bounded_pool(self, csv_path, sample_portfolio):
+        import threading
+        import time
+
+        from src.core.portfolio.portfolio_manager import _FETCH_WORKERS, get_snapshot
+
+        save_portfolio(sample_portfolio, csv_path)
+        lock = threading.Lock()
+        active = peak = 0
+
+        class Client:
+            @staticmethod
+            def get_stock_info(symbol):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.01)
+                with lock:
+                    active -= 1
+                return {"price": 150.0, "currency": "USD"}
+
+        get_snapshot(csv_path, Client())
+        assert peak <= _FETCH_WORKERS
+
+    def test_pure_jpy_portfolio_skips_fx(self, csv_path):
+        from src.core.portfolio.portfolio_manager import get_snapshot
+
+        save_portfolio([
+            {"symbol": "7203.T", "shares": 100, "cost_price": 2850.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": ""},
+            {"symbol": "JPY.CASH", "shares": 1, "cost_price": 5000.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": ""},
+        ], csv_path)
+        client = MagicMock()
+        client.get_stock_info.return_value = {"price": 3000.0, "currency": "JPY"}
+
+        result = get_snapshot(csv_path, client)
+
+        assert [c.args[0] for c in client.get_stock_info.call_args_list] == ["7203.T"]
+        assert result["fx_rates"] == {"JPY": 1.0}
+
+    def test_zero_share_rows_not_fetched(self, csv_path, monkeypatch):
+        import src.core.portfolio.portfolio_manager as pm
+
+        monkeypatch.setattr(pm, "load_portfolio", lambda path: [
+            {"symbol": "7203.T", "shares": 0, "cost_price": 2850.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": ""},
+        ])
+        client = MagicMock()
+
+        result = pm.get_snapshot(csv_path, client)
+
+        client.get_stock_info.assert_not_called()
+        assert result["positions"] == []
+
+    def test_missing_fx_rate_warns_once_per_currency(self, csv_path, capsys):
+        from src.core.portfolio.portfolio_manager import get_snapshot
+
+        save_portfolio([
+            {"symbol": sym, "shares": 1, "cost_price": 10.0,
+             "cost_currency": "EUR", "purchase_date": "", "memo": ""}
+            for sym in ("SAP.DE", "AIR.PA")
+        ], csv_path)
+
+        class Client:
+            def get_stock_info(self, symbol):
+                if symbol.endswith("=X"):
+                    return None
+                return {"price": 12.0, "currency": "EUR"}
+
+        result = get_snapshot(csv_path, Client())
+
+        assert [p["evaluation_jpy"] for p in result["positions"]] == [12.0, 12.0]
+        assert capsys.readouterr().out.count("FX rate for EUR not found") == 1
+
+
+class TestGetStructureAnalysis:
+    def test_reuses_given_snapshot(self, csv_path):
+        from src.core.portfolio.portfolio_manager import get_structure_analysis
+
+        snapshot = {
+            "positions": [
+                {"symbol": "7203.T", "sector": "Consumer Cyclical",
+                 "market_currency": "JPY", "evaluation_jpy": 300000.0},
+                {"symbol": "AAPL", "sector": "Technology",
+                 "market_currency": "USD", "evaluation_jpy": 100000.0},
+            ],
+            "total_value_jpy": 400000.0,
+        }
+        client = MagicMock()
+
+        result = get_structure_analysis(csv_path, client, snapshot=snapshot)
+
+        client.get_stock_info.assert_not_called()
+        assert result["currency_breakdown"] == pytest.approx({"JPY": 0.75, "USD": 0.25})
+        assert result["region_breakdown"] == pytest.approx(
+            {"Japan": 0.75, "United States": 0.25}
+        )
+
+
 class TestGetPortfolioShareholderReturn:
     """Tests for get_portfolio_shareholder_return (KIK-393)."""
 
@@ -395,3 +395,49 @@ class TestRunWhatIfSimulation:
         assert len(after) == len(original)
         assert after[0]["symbol"] == original[0]["symbol"]
         assert after[0]["shares"] == original[0]["shares"]
+
+    def test_no_csv_written(self, portfolio_csv, mock_client, monkeypatch):
+        """The merged portfolio is analysed in memory, not via a temp CSV."""
+        from src.core.portfolio import portfolio_manager
+
+        def fail_save(*args, **kwargs):
+            raise AssertionError("save_portfolio called")
+
+        monkeypatch.setattr(portfolio_manager, "save_portfolio", fail_save)
+        proposed = [
+            {"symbol": "AAPL", "shares": 10, "cost_price": 240.0,
+             "cost_currency": "USD"},
+        ]
+        result = run_what_if_simulation(portfolio_csv, proposed, mock_client)
+
+        assert result["after"]["total_value_jpy"] > result["before"]["total_value_jpy"]
+
+    def test_before_side_reused_across_proposals(self, portfolio_csv, mock_client):
+        calls = []
+        get_stock_info = mock_client.get_stock_info
+
+        def counting_get_stock_info(symbol):
+            calls.append(symbol)
+            return get_stock_info(symbol)
+
+        mock_client.get_stock_info = counting_get_stock_info
+        proposed = [{"symbol": "9984.T", "shares": 10, "cost_price": 7500.0,
+                     "cost_currency": "JPY"}]
+        first = run_what_if_simulation(portfolio_csv, proposed, mock_client)
+        first_calls = list(calls)
+        calls.clear()
+        second = run_what_if_simulation(portfolio_csv, proposed, mock_client)
+
+        assert second["before"] == first["before"]
+        # The second run skips the before-side snapshot of the holdings
+        assert first_calls.count("7203.T") - calls.count("7203.T") == 1
+
+        # Editing the CSV invalidates the cached before side
+        save_portfolio([
+            {"symbol": "7203.T", "shares": 200, "cost_price": 2800.0,
+             "cost_currency": "JPY", "purchase_date": "", "memo": ""},
+        ], portfolio_csv)
+        third = run_what_if_simulation(portfolio_csv, proposed, mock_client)
+        assert third["before"]["total_value_jpy"] == pytest.approx(
+            2 * first["before"]["total_value_jpy"]
+        )
@@ -8,6 +8,7 @@ import pytest
 
 from src.core.screening.technicals import (
     compute_rsi,
+    rsi_values,
     compute_bollinger_bands,
     detect_pullback_in_uptrend,
 )
@@ -78,6 +79,38 @@ class TestComputeRsi:
         assert not pd.isna(rsi.iloc[13])
 
 
+class TestRsiValues:
+    """Tests for rsi_values() (array kernel behind compute_rsi semantics)."""
+
+    def test_matches_compute_rsi(self):
+        np.random.seed(7)
+        prices = np.cumsum(np.random.randn(300)) + 100
+        prices[[40, 41, 200]] = np.nan
+        expected = compute_rsi(pd.Series(prices), period=14).to_numpy()
+        np.testing.assert_allclose(rsi_values(prices, period=14), expected, rtol=1e-12)
+
+    def test_flat_prices_nan(self):
+        rsi = rsi_values([100.0] * 30)
+        assert np.isnan(rsi).all()
+
+    def test_ascending_is_100(self):
+        rsi = rsi_values([float(i) for i in range(30)])
+        assert np.isnan(rsi[:13]).all()
+        assert rsi[-1] == 100.0
+
+    def test_short_input(self):
+        assert np.isnan(rsi_values([1.0, 2.0, 3.0])).all()
+
+    def test_kernel_resolved_once(self):
+        from src.core.screening import technicals
+
+        rsi_values([1.0, 2.0])
+        kernel = technicals._rsi_kernel
+        assert kernel is not None
+        rsi_values([1.0, 2.0])
+        assert technicals._rsi_kernel is kernel
+
+
 # ===================================================================
 # compute_bollinger_bands tests
 # ===================================================================
@@ -0,0 +1,96 @@
+"""Tests for src/data/embedding_cache.py.
+
+The cache database is redirected to tmp_path for every test.
+"""
+
+import numpy as np
+import pytest
+
+from src.data import embedding_cache
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache(tmp_path, monkeypatch):
+    embedding_cache.close()
+    monkeypatch.setattr(embedding_cache, "CACHE_PATH", tmp_path / "cache" / "emb.sqlite3")
+    yield
+    embedding_cache.close()
+
+
+class TestKey:
+    def test_deterministic(self):
+        assert embedding_cache.key("toyota") == embedding_cache.key("toyota")
+
+    def test_distinct_texts(self):
+        assert embedding_cache.key("toyota") != embedding_cache.key("sony")
+
+    def test_digest_size(self):
+        assert len(embedding_cache.key("toyota")) == 16
+
+
+class TestGetPut:
+    def test_miss_returns_none(self):
+        assert embedding_cache.get(embedding_cache.key("missing")) is None
+
+    def test_roundtrip(self):
+        h = embedding_cache.key("7203.T report")
+        embedding_cache.put(h, [0.5, -0.25, 1.0])
+        assert embedding_cache.get(h).tolist() == [0.5, -0.25, 1.0]
+
+    def test_stored_as_float16(self):
+        h = embedding_cache.key("x")
+        embedding_cache.put(h, [0.1, -0.0371])
+        assert embedding_cache.get(h).tolist() == pytest.approx([0.1, -0.0371], rel=1e-3)
+        conn = embedding_cache._get_conn()
+        (blob,) = conn.execute("SELECT v FROM emb16 WHERE h = ?", (h,)).fetchone()
+        assert len(blob) == 4
+
+    def test_persists_across_connections(self):
+        h = embedding_cache.key("persist")
+        embedding_cache.put(h, [1.0, 2.0])
+        embedding_cache.close()
+        assert embedding_cache.get(h).tolist() == [1.0, 2.0]
+
+    def test_returns_float32_array(self):
+        h = embedding_cache.key("arr")
+        embedding_cache.put(h, [0.25, 0.5])
+        vec = embedding_cache.get(h)
+        assert vec.dtype == np.float32
+        assert vec.shape == (2,)
+
+    def test_creates_parent_dir(self, tmp_path):
+        embedding_cache.put(embedding_cache.key("a"), [1.0])
+        assert (tmp_path / "cache" / "emb.sqlite3").exists()
+
+
+class TestMany:
+    def test_get_many_returns_only_hits(self):
+        ha, hb, hc = (embedding_cache.key(t) for t in ("a", "b", "c"))
+        embedding_cache.put_many([(ha, [1.0]), (hc, [3.0])])
+        found = embedding_cache.get_many([ha, hb, hc])
+        assert {h: v.tolist() for h, v in found.items()} == {ha: [1.0], hc: [3.0]}
+
+    def test_get_many_empty(self):
+        assert embedding_cache.get_many([]) == {}
+
+    def test_get_many_large_batch(self):
+        items = [(embedding_cache.key(str(i)), [float(i)]) for i in range(1200)]
+        embedding_cache.put_many(items)
+        found = embedding_cache.get_many([h for h, _ in items])
+        assert len(found) == 1200
+
+    def test_put_many_overwrites(self):
+        h = embedding_cache.key("a")
+        embedding_cache.put(h, [1.0])
+        embedding_cache.put(h, [2.0])
+        assert embedding_cache.get(h).tolist() == [2.0]
+
+
+class TestUnavailable:
+    def test_unwritable_path_degrades(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        monkeypatch.setattr(embedding_cache, "CACHE_PATH", blocker / "sub" / "emb.sqlite3")
+        h = embedding_cache.key("a")
+        embedding_cache.put(h, [1.0])  # no exception
+        assert embedding_cache.get(h) is None
@@ -102,6 +102,82 @@ class TestGetEmbedding:
         assert embedding_client.get_embedding("") is None
 
 
+# ===================================================================
+# get_embeddings_batch
+# ===================================================================
+
+
+class TestGetEmbeddingsBatch:
+    @patch("src.data.embedding_client.requests")
+    def test_single_request_for_batch(self, mock_req):
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.json.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_req.post.return_value = mock_resp
+
+        result = embedding_client.get_embeddings_batch(["a", "b"])
+        assert result == [[0.1] * 384, [0.2] * 384]
+        mock_req.post.assert_called_once()
+        assert mock_req.post.call_args[1]["json"] == {"inputs": ["a", "b"]}
+
+    @patch("src.data.embedding_client.requests")
+    def test_chunks_by_batch_size(self, mock_req):
+        mock_req.post.side_effect = lambda url, json, timeout: MagicMock(
+            status_code=200,
+            json=MagicMock(return_value=[[1.0]] * len(json["inputs"])),
+        )
+        result = embedding_client.get_embeddings_batch(["a", "b", "c"], batch_size=2)
+        assert result == [[1.0], [1.0], [1.0]]
+        assert mock_req.post.call_count == 2
+
+    @patch("src.data.embedding_client.requests")
+    def test_empty_texts_skipped(self, mock_req):
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.json.return_value = [[0.5]]
+        mock_req.post.return_value = mock_resp
+
+        result = embedding_client.get_embeddings_batch(["", "b", ""])
+        assert result == [None, [0.5], None]
+        assert mock_req.post.call_args[1]["json"] == {"inputs": ["b"]}
+
+    @patch("src.data.embedding_client.requests")
+    def test_failed_batch_yields_none(self, mock_req):
+        mock_req.post.side_effect = ConnectionError("refused")
+        assert embedding_client.get_embeddings_batch(["a", "b"]) == [None, None]
+
+    def test_empty_input(self):
+        assert embedding_client.get_embeddings_batch([]) == []
+
+    @patch("src.data.embedding_client.requests")
+    def test_connection_error_opens_circuit(self, mock_req, capsys):
+        """After repeated connection errors, later batches fail fast."""
+        mock_req.post.side_effect = ConnectionError("refused")
+        result = embedding_client.get_embeddings_batch(["a", "b", "c"], batch_size=1)
+        assert result == [None, None, None]
+        assert mock_req.post.call_count == 2  # one batch, retried once
+        assert embedding_client._available is False
+        assert "TEI" in capsys.readouterr().err
+
+        assert embedding_client.get_embeddings_batch(["d"]) == [None]
+        assert mock_req.post.call_count == 2
+
+    @patch("src.data.embedding_client.requests")
+    def test_transient_connection_error_retried(self, mock_req):
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = [[0.3]]
+        mock_req.post.side_effect = [TimeoutError("slow"), ok]
+        assert embedding_client.get_embeddings_batch(["a"]) == [[0.3]]
+        assert embedding_client._available is None
+
+    @patch("src.data.embedding_client.requests")
+    def test_bad_json_skips_batch_only(self, mock_req):
+        bad = MagicMock(status_code=200)
+        bad.json.side_effect = ValueError("not json")
+        good = MagicMock(status_code=200)
+        good.json.return_value = [[0.7]]
+        mock_req.post.side_effect = [bad, good]
+        assert embedding_client.get_embeddings_batch(["a", "b"], batch_size=1) == [None, [0.7]]
+
+
 # ===================================================================
 # reset_cache
 # ===================================================================
@@ -79,9 +79,14 @@ class TestConnection:
 class TestSchema:
     def test_init_schema_success(self, gs_with_driver):
         gs, _, session = gs_with_driver
+        tx = MagicMock()
+        session.execute_write.side_effect = lambda fn: fn(tx)
         assert gs.init_schema() is True
-        # 21 constraints + 14 indexes + 10 vector indexes = 45 (KIK-414/420/428)
-        assert session.run.call_count == 45
+        # 21 constraints + 14 indexes in one transaction (KIK-414/428)
+        session.execute_write.assert_called_once()
+        assert tx.run.call_count == 35
+        # 10 vector indexes run separately (KIK-420)
+        assert session.run.call_count == 10
 
     def test_init_schema_no_driver(self):
         import src.data.graph_store as gs
@@ -90,9 +95,14 @@ class TestSchema:
 
     def test_init_schema_error(self, gs_with_driver):
         gs, driver, session = gs_with_driver
-        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("DB error")
+        session.execute_write.side_effect = Exception("DB error")
         assert gs.init_schema() is False
 
+    def test_init_schema_vector_index_unsupported(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.run.side_effect = Exception("vector indexes not supported")
+        assert gs.init_schema() is True
+
 
 # ===================================================================
 # merge_stock tests
@@ -153,6 +163,16 @@ class TestMergeReport:
         assert gs.merge_report("2025-01-15", "7203.T", 72.5, "割安") is True
         assert session.run.call_count == 2  # MERGE report + ANALYZED rel
 
+    def test_merge_report_numpy_embedding(self, gs_with_driver):
+        import numpy as np
+        gs, _, session = gs_with_driver
+        emb = np.array([0.5, 0.25], dtype=np.float32)
+        assert gs.merge_report("2025-01-15", "7203.T", 72.5, "割安",
+                               embedding=emb) is True
+        sent = session.run.call_args[1]["embedding"]
+        assert type(sent) is list
+        assert sent == [0.5, 0.25]
+
     def test_merge_report_no_driver(self):
         import src.data.graph_store as gs
         with patch("src.data.graph_store._get_driver", return_value=None):
@@ -414,6 +434,34 @@ class TestLinkResearchSupersedes:
         assert gs.link_research_supersedes("stock", "7203.T") is False
 
 
+class TestLinkResearchSupersedesBulk:
+    def test_bulk_single_query(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        pairs = [("stock", "7203.T"), ("industry", "半導体")]
+        assert gs.link_research_supersedes_bulk(pairs) is True
+        assert session.run.call_count == 1
+        kwargs = session.run.call_args[1]
+        assert kwargs["pairs"] == [
+            {"rtype": "stock", "target": "7203.T"},
+            {"rtype": "industry", "target": "半導体"},
+        ]
+
+    def test_bulk_empty_pairs(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        assert gs.link_research_supersedes_bulk([]) is True
+        session.run.assert_not_called()
+
+    def test_bulk_no_driver(self):
+        import src.data.graph_store as gs
+        with patch("src.data.graph_store._get_driver", return_value=None):
+            assert gs.link_research_supersedes_bulk([("stock", "7203.T")]) is False
+
+    def test_bulk_error(self, gs_with_driver):
+        gs, driver, _ = gs_with_driver
+        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("err")
+        assert gs.link_research_supersedes_bulk([("stock", "7203.T")]) is False
+
+
 # ===================================================================
 # clear_all tests (KIK-398)
 # ===================================================================
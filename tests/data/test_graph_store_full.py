@@ -30,6 +30,8 @@ def reset_driver_and_mode():
 def mock_driver():
     driver = MagicMock()
     session = MagicMock()
+    # Managed transactions run their function against the session mock
+    session.execute_write.side_effect = lambda fn, *args, **kwargs: fn(session, *args, **kwargs)
     driver.session.return_value.__enter__ = MagicMock(return_value=session)
     driver.session.return_value.__exit__ = MagicMock(return_value=False)
     return driver, session
@@ -150,6 +152,9 @@ class TestModeOffGuard:
     def test_link_research_supersedes_off(self, gs_off):
         assert gs_off.link_research_supersedes("stock", "7203.T") is False
 
+    def test_link_research_supersedes_bulk_off(self, gs_off):
+        assert gs_off.link_research_supersedes_bulk([("stock", "7203.T")]) is False
+
     def test_merge_market_context_off(self, gs_off):
         assert gs_off.merge_market_context("2025-01-01", []) is False
 
@@ -402,3 +407,166 @@ class TestTruncate:
     def test_custom_max_len(self):
         from src.data.graph_store import _truncate
         assert _truncate("abcdefgh", 5) == "abcde"
+
+
+# ===================================================================
+# Bulk merge tests (UNWIND batches for init_graph)
+# ===================================================================
+
+class TestBulkMerge:
+    def test_screens_single_query(self, gs_full):
+        gs, _, session = gs_full
+        rows = [
+            {"screen_date": "2025-01-15", "preset": "value", "region": "japan",
+             "count": 2, "symbols": ["7203.T", "9984.T"],
+             "semantic_summary": "japan value", "embedding": [0.1]},
+            {"screen_date": "2025-01-16", "preset": "alpha", "region": "us",
+             "count": 1, "symbols": ["AAPL"]},
+        ]
+        assert gs.merge_screens_bulk(rows) is True
+        assert session.run.call_count == 1
+        query = session.run.call_args[0][0]
+        assert query.startswith("UNWIND $rows AS r")
+        params = session.run.call_args[1]["rows"]
+        assert params[0]["id"] == "screen_2025-01-15_japan_value"
+        assert params[0]["symbols"] == ["7203.T", "9984.T"]
+        assert params[0]["semantic_summary"] == "japan value"
+        assert params[1]["semantic_summary"] == ""
+        assert params[1]["embedding"] is None
+
+    def test_stocks_bulk(self, gs_full):
+        gs, _, session = gs_full
+        rows = [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive"},
+            {"symbol": "", "name": "skipped"},
+            {"symbol": "AAPL"},
+        ]
+        assert gs.merge_stocks_bulk(rows) is True
+        assert session.run.call_count == 1
+        assert "IN_SECTOR" in session.run.call_args[0][0]
+        params = session.run.call_args[1]["rows"]
+        assert params == [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive", "country": ""},
+            {"symbol": "AAPL", "name": "", "sector": "", "country": ""},
+        ]
+
+    def test_numpy_embedding_sent_as_list(self, gs_full):
+        import numpy as np
+        gs, _, session = gs_full
+        rows = [{"name": "fav", "symbols": ["AAPL"], "semantic_summary": "fav",
+                 "embedding": np.array([0.5, 0.25], dtype=np.float32)}]
+        assert gs.merge_watchlists_bulk(rows) is True
+        emb = session.run.call_args[1]["rows"][0]["embedding"]
+        assert type(emb) is list
+        assert emb == [0.5, 0.25]
+
+    def test_chunks_by_batch_size(self, gs_full, monkeypatch):
+        gs, _, session = gs_full
+        monkeypatch.setattr(gs, "_BULK_BATCH_SIZE", 2)
+        rows = [
+            {"note_id": f"n{i}", "note_date": "2025-01-15", "note_type": "memo",
+             "content": "c"}
+            for i in range(5)
+        ]
+        assert gs.merge_notes_bulk(rows) is True
+        assert session.run.call_count == 3
+        sizes = [len(c[1]["rows"]) for c in session.run.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_chunks_run_in_write_transactions(self, gs_full, monkeypatch):
+        gs, _, session = gs_full
+        monkeypatch.setattr(gs, "_BULK_BATCH_SIZE", 2)
+        rows = [{"symbol": f"S{i}"} for i in range(3)]
+        assert gs.merge_stocks_bulk(rows) is True
+        assert session.execute_write.call_count == 2
+
+    def test_failure_logged_and_reported(self, gs_full, monkeypatch, capsys):
+        gs, _, session = gs_full
+        monkeypatch.setattr(gs, "_BULK_BATCH_SIZE", 2)
+        session.execute_write.side_effect = [None, Exception("deadlock")]
+        rows = [{"symbol": f"S{i}"} for i in range(3)]
+        assert gs.merge_stocks_bulk(rows) is False
+        err = capsys.readouterr().err
+        assert "[graph_store] Warning: bulk write failed" in err
+        assert "from row 2" in err
+        assert "deadlock" in err
+
+    def test_empty_rows_no_query(self, gs_full):
+        gs, _, session = gs_full
+        assert gs.merge_reports_bulk([]) is True
+        session.run.assert_not_called()
+
+    def test_malformed_row_skipped(self, gs_full):
+        gs, _, session = gs_full
+        rows = [
+            {"forecast_date": "2025-01-15", "optimistic": None, "base": 0.05,
+             "pessimistic": -0.1, "symbols": []},
+            {"forecast_date": "2025-01-16", "optimistic": 0.1, "base": 0.05,
+             "pessimistic": -0.1, "symbols": ["7203.T"]},
+        ]
+        assert gs.merge_forecasts_bulk(rows) is True
+        params = session.run.call_args[1]["rows"]
+        assert [p["id"] for p in params] == ["forecast_2025-01-16"]
+
+    def test_trades_split_by_relationship(self, gs_full):
+        gs, _, session = gs_full
+        rows = [
+            {"trade_date": "2025-01-15", "trade_type": "buy", "symbol": "7203.T",
+             "shares": 100, "price": 2850, "currency": "JPY"},
+            {"trade_date": "2025-02-15", "trade_type": "sell", "symbol": "7203.T",
+             "shares": 100, "price": 3000, "currency": "JPY"},
+        ]
+        assert gs.merge_trades_bulk(rows) is True
+        assert session.run.call_count == 2
+        queries = [c[0][0] for c in session.run.call_args_list]
+        assert "[:BOUGHT]" in queries[0]
+        assert "[:SOLD]" in queries[1]
+
+    def test_reports_full_mode_sets_valuation(self, gs_full):
+        gs, _, session = gs_full
+        rows = [{"report_date": "2025-01-15", "symbol": "7203.T", "score": 72.5,
+                 "verdict": "割安", "price": 2850, "per": None}]
+        assert gs.merge_reports_bulk(rows) is True
+        query = session.run.call_args[0][0]
+        assert "n.market_cap = r.mcap" in query
+        params = session.run.call_args[1]["rows"]
+        assert params[0]["price"] == 2850.0
+        assert params[0]["per"] == 0.0
+
+    def test_reports_summary_mode_skips_valuation(self, gs_summary):
+        gs, _, session = gs_summary
+        rows = [{"report_date": "2025-01-15", "symbol": "7203.T", "score": 72.5,
+                 "verdict": "割安", "price": 2850}]
+        assert gs.merge_reports_bulk(rows) is True
+        query = session.run.call_args[0][0]
+        assert "market_cap" not in query
+        assert "price" not in session.run.call_args[1]["rows"][0]
+
+    def test_health_checks_params(self, gs_full):
+        gs, _, session = gs_full
+        rows = [{"health_date": "2025-01-15",
+                 "summary": {"total": 5, "healthy": 3, "exit": 1},
+                 "symbols": ["7203.T"]}]
+        assert gs.merge_health_checks_bulk(rows) is True
+        p = session.run.call_args[1]["rows"][0]
+        assert p["id"] == "health_2025-01-15"
+        assert (p["total"], p["healthy"], p["exit_count"]) == (5, 3, 1)
+
+    def test_stress_tests_and_watchlists(self, gs_full):
+        gs, _, session = gs_full
+        assert gs.merge_stress_tests_bulk([{
+            "test_date": "2025-01-15", "scenario": "トリプル安",
+            "portfolio_impact": -0.2, "symbols": ["7203.T"],
+        }]) is True
+        assert gs.merge_watchlists_bulk([{"name": "fav", "symbols": ["AAPL"]}]) is True
+        assert session.run.call_count == 2
+
+    def test_off_mode(self, gs_off):
+        assert gs_off.merge_screens_bulk([{"screen_date": "d", "preset": "p",
+                                           "region": "r", "count": 0,
+                                           "symbols": []}]) is False
+
+    def test_driver_error(self, gs_full):
+        gs, driver, _ = gs_full
+        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("err")
+        assert gs.merge_watchlists_bulk([{"name": "fav", "symbols": ["AAPL"]}]) is False
@@ -386,6 +386,58 @@ class TestLoadHistory:
         assert len(results) == 1
         assert results[0]["preset"] == "value"
 
+    def test_load_filters_by_preset_and_region(self, tmp_path):
+        save_screening("value", "japan", _sample_results(), base_dir=str(tmp_path))
+        save_screening("growth", "japan", [], base_dir=str(tmp_path))
+        save_screening("value", "us", [], base_dir=str(tmp_path))
+        save_screening("高配当", "japan", [], base_dir=str(tmp_path))
+
+        results = load_history("screen", base_dir=str(tmp_path), preset="value")
+        assert sorted(r["region"] for r in results) == ["japan", "us"]
+
+        results = load_history(
+            "screen", base_dir=str(tmp_path), preset="value", region="japan",
+        )
+        assert [(r["preset"], r["region"]) for r in results] == [("value", "japan")]
+
+        results = load_history("screen", base_dir=str(tmp_path), preset="高配当")
+        assert [r["preset"] for r in results] == ["高配当"]
+
+    def test_load_filter_matches_field_not_text(self, tmp_path):
+        """A value appearing elsewhere in the file does not make it match."""
+        screen_dir = tmp_path / "screen"
+        screen_dir.mkdir(parents=True, exist_ok=True)
+        today = date.today().isoformat()
+        with open(screen_dir / f"{today}_japan_value.json", "w") as f:
+            json.dump({"date": today, "preset": "value", "region": "japan",
+                       "results": [{"name": "growth"}]}, f)
+
+        assert load_history("screen", base_dir=str(tmp_path), preset="growth") == []
+
+    def test_load_filter_skips_non_object_files(self, tmp_path):
+        screen_dir = tmp_path / "screen"
+        screen_dir.mkdir(parents=True, exist_ok=True)
+        today = date.today().isoformat()
+        with open(screen_dir / f"{today}_list.json", "w") as f:
+            json.dump(["value"], f)
+        save_screening("value", "japan", [], base_dir=str(tmp_path))
+
+        results = load_history("screen", base_dir=str(tmp_path), preset="value")
+        assert [r["preset"] for r in results] == ["value"]
+        assert len(load_history("screen", base_dir=str(tmp_path))) == 2
+
+
+    def test_load_accepts_nan_literals(self, tmp_path):
+        """Files with NaN (written by plain json.dump) still load."""
+        trade_dir = tmp_path / "trade"
+        trade_dir.mkdir(parents=True, exist_ok=True)
+        with open(trade_dir / f"{date.today().isoformat()}_sell_AAPL.json", "w") as f:
+            f.write('{"symbol": "AAPL", "pnl_rate": NaN, "shares": 10}')
+
+        results = load_history("trade", base_dir=str(tmp_path))
+        assert len(results) == 1
+        assert results[0]["shares"] == 10
+        assert math.isnan(results[0]["pnl_rate"])
 
 # ===================================================================
 # list_history_files
@@ -0,0 +1,117 @@
+"""Tests for src/data/import_manifest.py.
+
+The manifest database is redirected to tmp_path for every test.
+"""
+
+import os
+
+import pytest
+
+from src.data import import_manifest
+
+
+@pytest.fixture(autouse=True)
+def _tmp_manifest(tmp_path, monkeypatch):
+    import_manifest.close()
+    monkeypatch.setattr(import_manifest, "MANIFEST_PATH", tmp_path / "cache" / "manifest.sqlite3")
+    yield
+    import_manifest.close()
+
+
+def _file(tmp_path, name, text="{}"):
+    fp = tmp_path / name
+    fp.write_text(text, encoding="utf-8")
+    return str(fp)
+
+
+class TestFilterChanged:
+    def test_new_files_are_changed(self, tmp_path):
+        a, b = _file(tmp_path, "a.json"), _file(tmp_path, "b.json")
+        changed, entries = import_manifest.filter_changed([a, b])
+        assert changed == [a, b]
+        assert [e[0] for e in entries] == [os.path.abspath(a), os.path.abspath(b)]
+
+    def test_recorded_files_skipped(self, tmp_path):
+        a, b = _file(tmp_path, "a.json"), _file(tmp_path, "b.json")
+        _, entries = import_manifest.filter_changed([a, b])
+        import_manifest.record(entries[:1])
+        changed, _ = import_manifest.filter_changed([a, b])
+        assert changed == [b]
+
+    def test_modified_file_is_changed(self, tmp_path):
+        a = _file(tmp_path, "a.json")
+        import_manifest.record(import_manifest.filter_changed([a])[1])
+        _file(tmp_path, "a.json", '{"x": 1}')
+        assert import_manifest.filter_changed([a])[0] == [a]
+
+    def test_missing_file_passed_through(self, tmp_path):
+        missing = str(tmp_path / "missing.json")
+        changed, entries = import_manifest.filter_changed([missing])
+        assert changed == [missing]
+        assert entries == [(os.path.abspath(missing), -1, -1, None)]
+        import_manifest.record(entries)  # unstat-able entries are not recorded
+        assert import_manifest.filter_changed([missing])[0] == [missing]
+
+    def test_empty(self):
+        assert import_manifest.filter_changed([]) == ([], [])
+
+
+class TestSkipSameContent:
+    def _import(self, path):
+        _, entries = import_manifest.filter_changed([path])
+        raw = open(path, "rb").read()
+        _, pending = import_manifest.skip_same_content(entries, [raw])
+        import_manifest.record(pending)
+
+    def test_touched_file_skipped_and_restamped(self, tmp_path):
+        a = _file(tmp_path, "a.json", '{"x": 1}')
+        self._import(a)
+        st = os.stat(a)
+        os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        changed, entries = import_manifest.filter_changed([a])
+        assert changed == [a]
+        raws, pending = import_manifest.skip_same_content(entries, [b'{"x": 1}'])
+        assert raws == [None]
+        assert pending == []
+        # New stat was recorded, so the next run skips it on stat alone
+        assert import_manifest.filter_changed([a])[0] == []
+
+    def test_modified_content_kept(self, tmp_path):
+        a = _file(tmp_path, "a.json", '{"x": 1}')
+        self._import(a)
+        _file(tmp_path, "a.json", '{"x": 22}')
+        changed, entries = import_manifest.filter_changed([a])
+        raws, pending = import_manifest.skip_same_content(entries, [b'{"x": 22}'])
+        assert raws == [b'{"x": 22}']
+        assert pending[0][3] == import_manifest.digest(b'{"x": 22}')
+
+    def test_unreadable_passed_as_none(self, tmp_path):
+        a = _file(tmp_path, "a.json")
+        _, entries = import_manifest.filter_changed([a])
+        raws, pending = import_manifest.skip_same_content(entries, [None])
+        assert raws == [None]
+        assert pending == []
+
+
+class TestReset:
+    def test_reset_forgets_files(self, tmp_path):
+        a = _file(tmp_path, "a.json")
+        import_manifest.record(import_manifest.filter_changed([a])[1])
+        import_manifest.reset()
+        assert import_manifest.filter_changed([a])[0] == [a]
+
+    def test_persists_across_connections(self, tmp_path):
+        a = _file(tmp_path, "a.json")
+        import_manifest.record(import_manifest.filter_changed([a])[1])
+        import_manifest.close()
+        assert import_manifest.filter_changed([a])[0] == []
+
+
+class TestUnavailable:
+    def test_unwritable_path_degrades(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        monkeypatch.setattr(import_manifest, "MANIFEST_PATH", blocker / "sub" / "m.sqlite3")
+        a = _file(tmp_path, "a.json")
+        import_manifest.record(import_manifest.filter_changed([a])[1])  # no exception
+        assert import_manifest.filter_changed([a])[0] == [a]
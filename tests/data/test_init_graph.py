@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from unittest.mock import patch, call
 
+import numpy as np
 import pytest
 
 from scripts.init_graph import (
@@ -19,6 +20,11 @@ from scripts.init_graph import (
     import_notes,
     import_portfolio,
     import_watchlists,
+    _embedding_modules,
+    _list_json,
+    _read_all,
+    _read_all_async,
+    _run_importers,
 )
 
 
@@ -26,6 +32,34 @@ from scripts.init_graph import (
 # Helpers
 # ===================================================================
 
+@pytest.fixture(autouse=True)
+def _isolated_embedding_cache(tmp_path, monkeypatch):
+    """Keep the on-disk embedding cache out of the repository."""
+    from src.data import embedding_cache
+    embedding_cache.close()
+    monkeypatch.setattr(embedding_cache, "CACHE_PATH", tmp_path / "emb.sqlite3")
+    yield
+    embedding_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_seen_stocks():
+    """Each test starts a fresh import run."""
+    import scripts.init_graph as ig
+    ig._seen_stocks.clear()
+    yield
+    ig._seen_stocks.clear()
+
+
+def _stock_rows(mock_bulk) -> list[dict]:
+    """All Stock rows sent to a mocked merge_stocks_bulk."""
+    return [row for c in mock_bulk.call_args_list for row in c[0][0]]
+
+
+def _stock(symbol: str, name: str = "", sector: str = "") -> dict:
+    return {"symbol": symbol, "name": name, "sector": sector}
+
+
 def _write_json(path: Path, data):
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
@@ -37,8 +71,8 @@ def _write_json(path: Path, data):
 # ===================================================================
 
 class TestImportScreens:
-    @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_screens_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_screens_basic(self, mock_stock, mock_screen, tmp_path):
         d = tmp_path / "screen"
         _write_json(d / "2025-01-15_japan_value.json", {
@@ -50,24 +84,24 @@ class TestImportScreens:
                 {"symbol": "9984.T", "name": "SoftBank", "sector": "Tech"},
             ],
         })
-        count = import_screens(str(tmp_path))
+        count = import_screens(tmp_path / "screen")
         assert count == 1
-        assert mock_stock.call_count == 2
+        assert len(_stock_rows(mock_stock)) == 2
         mock_screen.assert_called_once()
 
-    @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_screens_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_screens_empty_dir(self, mock_stock, mock_screen, tmp_path):
-        count = import_screens(str(tmp_path))
+        count = import_screens(tmp_path / "screen")
         assert count == 0
 
-    @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_screens_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_screens_corrupted_file(self, mock_stock, mock_screen, tmp_path):
         d = tmp_path / "screen"
         d.mkdir(parents=True)
         (d / "bad.json").write_text("not json")
-        count = import_screens(str(tmp_path))
+        count = import_screens(tmp_path / "screen")
         assert count == 0
 
 
@@ -76,8 +110,8 @@ class TestImportScreens:
 # ===================================================================
 
 class TestImportReports:
-    @patch("scripts.init_graph.merge_report_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_reports_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_reports_basic(self, mock_stock, mock_report, tmp_path):
         d = tmp_path / "report"
         _write_json(d / "2025-01-15_7203_T.json", {
@@ -88,17 +122,54 @@ class TestImportReports:
             "value_score": 72.5,
             "verdict": "割安",
         })
-        count = import_reports(str(tmp_path))
+        count = import_reports(tmp_path / "report")
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota", sector="Automotive")
+        assert _stock_rows(mock_stock) == [_stock("7203.T", "Toyota", "Automotive")]
         mock_report.assert_called_once()
 
-    @patch("scripts.init_graph.merge_report_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph._get_embeddings")
+    @patch("scripts.init_graph.merge_reports_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_reports_batches_embeddings(self, mock_stock, mock_report, mock_emb, tmp_path):
+        """All report summaries are embedded with a single batched call."""
+        mock_emb.side_effect = lambda texts: [[float(i)] for i in range(len(texts))]
+        d = tmp_path / "report"
+        for sym in ("7203.T", "9984.T", "AAPL"):
+            _write_json(d / f"2025-01-15_{sym}.json", {
+                "date": "2025-01-15", "symbol": sym, "name": sym,
+                "value_score": 50, "verdict": "普通",
+            })
+        count = import_reports(tmp_path / "report")
+        assert count == 3
+        mock_emb.assert_called_once()
+        assert len(mock_emb.call_args[0][0]) == 3
+        rows = mock_report.call_args[0][0]
+        assert [r["embedding"] for r in rows] == [[0.0], [1.0], [2.0]]
+
+    @patch("src.data.embedding_client.get_embeddings_batch")
+    @patch("scripts.init_graph.merge_reports_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_reports_embedding_cache_hit(self, mock_stock, mock_report, mock_batch, tmp_path):
+        """A second import reuses cached embeddings without calling TEI."""
+        mock_batch.side_effect = lambda texts: [[0.5]] * len(texts)
+        d = tmp_path / "report"
+        _write_json(d / "2025-01-15_7203_T.json", {
+            "date": "2025-01-15", "symbol": "7203.T", "name": "Toyota",
+            "value_score": 72.5, "verdict": "割安",
+        })
+        import_reports(tmp_path / "report")
+        import_reports(tmp_path / "report")
+        assert mock_batch.call_count == 1
+        emb = mock_report.call_args_list[1][0][0][0]["embedding"]
+        assert emb.dtype == np.float32
+        assert emb.tolist() == [0.5]
+
+    @patch("scripts.init_graph.merge_reports_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_reports_no_symbol(self, mock_stock, mock_report, tmp_path):
         d = tmp_path / "report"
         _write_json(d / "2025-01-15_empty.json", {"date": "2025-01-15"})
-        count = import_reports(str(tmp_path))
+        count = import_reports(tmp_path / "report")
         assert count == 0
 
 
@@ -107,8 +178,8 @@ class TestImportReports:
 # ===================================================================
 
 class TestImportTrades:
-    @patch("scripts.init_graph.merge_trade")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_trades_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_trades_basic(self, mock_stock, mock_trade, tmp_path):
         d = tmp_path / "trade"
         _write_json(d / "2025-01-15_buy_7203_T.json", {
@@ -120,12 +191,14 @@ class TestImportTrades:
             "currency": "JPY",
             "memo": "test buy",
         })
-        count = import_trades(str(tmp_path))
+        count = import_trades(tmp_path / "trade")
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T")
+        assert _stock_rows(mock_stock) == [_stock("7203.T")]
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_trade.assert_called_once()
-        call_kwargs = mock_trade.call_args[1]
+        (rows,) = mock_trade.call_args[0]
+        assert len(rows) == 1
+        call_kwargs = rows[0]
         assert call_kwargs["trade_date"] == "2025-01-15"
         assert call_kwargs["trade_type"] == "buy"
         assert call_kwargs["symbol"] == "7203.T"
@@ -136,12 +209,36 @@ class TestImportTrades:
         assert "semantic_summary" in call_kwargs
         assert "embedding" in call_kwargs
 
-    @patch("scripts.init_graph.merge_trade")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_trades_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_trades_repeated_symbol_merged_once(self, mock_stock, mock_trade, tmp_path):
+        d = tmp_path / "trade"
+        for day in ("15", "16", "17"):
+            _write_json(d / f"2025-01-{day}_buy_7203_T.json", {
+                "date": f"2025-01-{day}", "symbol": "7203.T", "trade_type": "buy",
+            })
+        assert import_trades(tmp_path / "trade") == 3
+        assert _stock_rows(mock_stock) == [_stock("7203.T")]
+
+    @patch("scripts.init_graph.merge_trades_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_trades_defaults(self, mock_stock, mock_trade, tmp_path):
+        d = tmp_path / "trade"
+        _write_json(d / "2025-01-15_7203_T.json", {"symbol": "7203.T"})
+        assert import_trades(tmp_path / "trade") == 1
+        row = mock_trade.call_args[0][0][0]
+        assert row["trade_date"] == ""
+        assert row["trade_type"] == "buy"
+        assert row["shares"] == 0
+        assert row["currency"] == "JPY"
+        assert row["memo"] == ""
+
+    @patch("scripts.init_graph.merge_trades_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_trades_no_symbol(self, mock_stock, mock_trade, tmp_path):
         d = tmp_path / "trade"
         _write_json(d / "2025-01-15_buy_empty.json", {"date": "2025-01-15"})
-        count = import_trades(str(tmp_path))
+        count = import_trades(tmp_path / "trade")
         assert count == 0
 
 
@@ -150,7 +247,7 @@ class TestImportTrades:
 # ===================================================================
 
 class TestImportHealth:
-    @patch("scripts.init_graph.merge_health")
+    @patch("scripts.init_graph.merge_health_checks_bulk")
     def test_import_health_basic(self, mock_health, tmp_path):
         d = tmp_path / "health"
         _write_json(d / "2025-01-15_health.json", {
@@ -161,18 +258,18 @@ class TestImportHealth:
                 {"symbol": "AAPL"},
             ],
         })
-        count = import_health(str(tmp_path))
+        count = import_health(tmp_path / "health")
         assert count == 1
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_health.assert_called_once()
-        call_args = mock_health.call_args
-        assert call_args[0][0] == "2025-01-15"
-        assert call_args[0][1] == {"total": 5, "healthy": 3, "exit": 1}
-        assert call_args[0][2] == ["7203.T", "AAPL"]
-        assert "semantic_summary" in call_args[1]
-        assert "embedding" in call_args[1]
-
-    @patch("scripts.init_graph.merge_health")
+        (rows,) = mock_health.call_args[0]
+        assert rows[0]["health_date"] == "2025-01-15"
+        assert rows[0]["summary"] == {"total": 5, "healthy": 3, "exit": 1}
+        assert rows[0]["symbols"] == ["7203.T", "AAPL"]
+        assert "semantic_summary" in rows[0]
+        assert "embedding" in rows[0]
+
+    @patch("scripts.init_graph.merge_health_checks_bulk")
     def test_import_health_empty_positions(self, mock_health, tmp_path):
         d = tmp_path / "health"
         _write_json(d / "2025-01-15_health.json", {
@@ -180,7 +277,7 @@ class TestImportHealth:
             "summary": {},
             "positions": [],
         })
-        count = import_health(str(tmp_path))
+        count = import_health(tmp_path / "health")
         assert count == 1
 
 
@@ -189,7 +286,7 @@ class TestImportHealth:
 # ===================================================================
 
 class TestImportNotes:
-    @patch("scripts.init_graph.merge_note")
+    @patch("scripts.init_graph.merge_notes_bulk")
     def test_import_notes_list_format(self, mock_note, tmp_path):
         _write_json(tmp_path / "2025-01-15_7203_T_thesis.json", [
             {
@@ -211,9 +308,10 @@ class TestImportNotes:
         ])
         count = import_notes(str(tmp_path))
         assert count == 2
-        assert mock_note.call_count == 2
+        mock_note.assert_called_once()
+        assert len(mock_note.call_args[0][0]) == 2
 
-    @patch("scripts.init_graph.merge_note")
+    @patch("scripts.init_graph.merge_notes_bulk")
     def test_import_notes_single_object(self, mock_note, tmp_path):
         _write_json(tmp_path / "2025-01-15_note.json", {
             "id": "note_2025-01-15_general_abc1",
@@ -225,7 +323,7 @@ class TestImportNotes:
         count = import_notes(str(tmp_path))
         assert count == 1
 
-    @patch("scripts.init_graph.merge_note")
+    @patch("scripts.init_graph.merge_notes_bulk")
     def test_import_notes_no_id_skipped(self, mock_note, tmp_path):
         _write_json(tmp_path / "bad_note.json", [
             {"date": "2025-01-15", "content": "No ID"},
@@ -233,12 +331,12 @@ class TestImportNotes:
         count = import_notes(str(tmp_path))
         assert count == 0
 
-    @patch("scripts.init_graph.merge_note")
+    @patch("scripts.init_graph.merge_notes_bulk")
     def test_import_notes_empty_dir(self, mock_note, tmp_path):
         count = import_notes(str(tmp_path))
         assert count == 0
 
-    @patch("scripts.init_graph.merge_note")
+    @patch("scripts.init_graph.merge_notes_bulk")
     def test_import_notes_nonexistent_dir(self, mock_note, tmp_path):
         count = import_notes(str(tmp_path / "nonexistent"))
         assert count == 0
@@ -249,9 +347,9 @@ class TestImportNotes:
 # ===================================================================
 
 class TestImportResearch:
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_stock(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_stock_7203_T.json", {
@@ -261,9 +359,9 @@ class TestImportResearch:
             "name": "Toyota",
             "summary": "Strong fundamentals",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota")
+        assert _stock_rows(mock_stock) == [_stock("7203.T", "Toyota")]
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_research.assert_called_once()
         call_kwargs = mock_research.call_args[1]
@@ -274,11 +372,11 @@ class TestImportResearch:
         assert call_kwargs["grok_research"] is None
         assert "semantic_summary" in call_kwargs
         assert "embedding" in call_kwargs
-        mock_link.assert_called_once_with("stock", "7203.T")
+        mock_link.assert_called_once_with([("stock", "7203.T")])
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_industry(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_industry_semiconductor.json", {
@@ -287,15 +385,15 @@ class TestImportResearch:
             "target": "半導体",
             "summary": "Growing demand",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 1
         mock_stock.assert_not_called()  # industry type: no Stock merge
         mock_research.assert_called_once()
-        mock_link.assert_called_once_with("industry", "半導体")
+        mock_link.assert_called_once_with([("industry", "半導体")])
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_market(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_market_nikkei.json", {
@@ -304,13 +402,13 @@ class TestImportResearch:
             "target": "日経平均",
             "summary": "Bullish trend",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 1
         mock_stock.assert_not_called()  # market type: no Stock merge
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_business(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_business_7751_T.json", {
@@ -319,27 +417,27 @@ class TestImportResearch:
             "target": "7751.T",
             "summary": "Diversified revenue",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7751.T", name="")
+        assert _stock_rows(mock_stock) == [_stock("7751.T", "")]
         mock_research.assert_called_once()
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_no_target_skipped(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_bad.json", {
             "date": "2025-01-15",
             "research_type": "stock",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 0
         mock_research.assert_not_called()
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_supersedes_chains(self, mock_stock, mock_research, mock_link, tmp_path):
         """Multiple research files for same target should create one SUPERSEDES chain."""
         d = tmp_path / "research"
@@ -355,27 +453,27 @@ class TestImportResearch:
             "target": "7203.T",
             "summary": "Second",
         })
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 2
         assert mock_research.call_count == 2
-        # link_research_supersedes called once for (stock, 7203.T)
-        mock_link.assert_called_once_with("stock", "7203.T")
+        # one bulk SUPERSEDES call with the single (stock, 7203.T) pair
+        mock_link.assert_called_once_with([("stock", "7203.T")])
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_empty_dir(self, mock_stock, mock_research, mock_link, tmp_path):
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 0
 
-    @patch("scripts.init_graph.link_research_supersedes")
+    @patch("scripts.init_graph.link_research_supersedes_bulk")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_research_corrupted_file(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         d.mkdir(parents=True)
         (d / "bad.json").write_text("not json")
-        count = import_research(str(tmp_path))
+        count = import_research(tmp_path / "research")
         assert count == 0
 
 
@@ -396,7 +494,7 @@ def _write_csv(path: Path, rows: list[dict]):
 
 
 class TestImportPortfolio:
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_portfolio_basic(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -405,11 +503,11 @@ class TestImportPortfolio:
         ])
         count = import_portfolio(str(csv_path))
         assert count == 2
-        assert mock_stock.call_count == 2
-        mock_stock.assert_any_call(symbol="7203.T", name="Toyota")
-        mock_stock.assert_any_call(symbol="AAPL", name="Apple")
+        assert len(_stock_rows(mock_stock)) == 2
+        assert _stock("7203.T", "Toyota") in _stock_rows(mock_stock)
+        assert _stock("AAPL", "Apple") in _stock_rows(mock_stock)
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_portfolio_skip_cash(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -418,15 +516,39 @@ class TestImportPortfolio:
         ])
         count = import_portfolio(str(csv_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota")
+        assert _stock_rows(mock_stock) == [_stock("7203.T", "Toyota")]
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_portfolio_nonexistent(self, mock_stock, tmp_path):
         count = import_portfolio(str(tmp_path / "missing.csv"))
         assert count == 0
         mock_stock.assert_not_called()
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.sync_portfolio")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_portfolio_holdings_columns(self, mock_stock, mock_sync, tmp_path):
+        csv_path = tmp_path / "portfolio.csv"
+        _write_csv(csv_path, [
+            {"symbol": "7203.T", "shares": "100", "cost_price": "2850",
+             "cost_currency": "JPY", "purchase_date": "2025-01-15",
+             "memo": "Toyota", "note": "ignored"},
+        ])
+        assert import_portfolio(str(csv_path)) == 1
+        (holdings,) = mock_sync.call_args[0]
+        assert holdings == [{
+            "symbol": "7203.T", "shares": "100", "cost_price": "2850",
+            "cost_currency": "JPY", "purchase_date": "2025-01-15",
+            "memo": "Toyota",
+        }]
+
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_import_portfolio_no_symbol_column(self, mock_stock, tmp_path):
+        csv_path = tmp_path / "portfolio.csv"
+        csv_path.write_text("ticker,shares\n7203.T,100\n", encoding="utf-8")
+        assert import_portfolio(str(csv_path)) == 0
+        mock_stock.assert_not_called()
+
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_portfolio_empty_symbol(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -441,52 +563,54 @@ class TestImportPortfolio:
 # ===================================================================
 
 class TestImportWatchlists:
-    @patch("scripts.init_graph._get_embedding", return_value=None)
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph._get_embeddings", side_effect=lambda texts: [None] * len(texts))
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_basic(self, mock_stock, mock_wl, mock_emb, tmp_path):
         _write_json(tmp_path / "favorites.json", ["7203.T", "AAPL", "D05.SI"])
         count = import_watchlists(str(tmp_path))
         assert count == 1
-        assert mock_stock.call_count == 3
-        mock_wl.assert_called_once_with(
-            "favorites", ["7203.T", "AAPL", "D05.SI"],
-            semantic_summary="favorites watchlist: 7203.T, AAPL, D05.SI",
-            embedding=None,
-        )
-
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+        assert len(_stock_rows(mock_stock)) == 3
+        mock_wl.assert_called_once_with([{
+            "name": "favorites",
+            "symbols": ["7203.T", "AAPL", "D05.SI"],
+            "semantic_summary": "favorites watchlist: 7203.T, AAPL, D05.SI",
+            "embedding": None,
+        }])
+
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_multiple_files(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "japan.json", ["7203.T", "9984.T"])
         _write_json(tmp_path / "us.json", ["AAPL", "MSFT"])
         count = import_watchlists(str(tmp_path))
         assert count == 2
-        assert mock_wl.call_count == 2
+        mock_wl.assert_called_once()
+        assert len(mock_wl.call_args[0][0]) == 2
 
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_empty_list(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "empty.json", [])
         count = import_watchlists(str(tmp_path))
         assert count == 0
         mock_wl.assert_not_called()
 
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_not_a_list(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "bad.json", {"key": "value"})
         count = import_watchlists(str(tmp_path))
         assert count == 0
 
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_nonexistent_dir(self, mock_stock, mock_wl, tmp_path):
         count = import_watchlists(str(tmp_path / "missing"))
         assert count == 0
 
-    @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
     def test_import_watchlists_corrupted_file(self, mock_stock, mock_wl, tmp_path):
         tmp_path.mkdir(exist_ok=True)
         (tmp_path / "bad.json").write_text("not json")
@@ -494,6 +618,34 @@ class TestImportWatchlists:
         assert count == 0
 
 
+# ===================================================================
+# Large notes/watchlist files (memory-mapped parse)
+# ===================================================================
+
+class TestLargeArrayFiles:
+    @patch("scripts.init_graph.HAS_IJSON", False)
+    @patch("scripts.init_graph._MMAP_THRESHOLD", 16)
+    @patch("scripts.init_graph.merge_watchlists_bulk")
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_watchlist_parsed_from_mmap(self, mock_stock, mock_wl, tmp_path):
+        pytest.importorskip("orjson")
+        _write_json(tmp_path / "big.json", [f"{i}.T" for i in range(100)])
+        with patch("mmap.mmap", wraps=__import__("mmap").mmap) as spy:
+            assert import_watchlists(str(tmp_path)) == 1
+        spy.assert_called_once()
+        assert len(mock_wl.call_args[0][0][0]["symbols"]) == 100
+
+    @patch("scripts.init_graph.HAS_IJSON", False)
+    @patch("scripts.init_graph._MMAP_THRESHOLD", 16)
+    @patch("scripts.init_graph.merge_notes_bulk")
+    def test_note_object_parsed_from_mmap(self, mock_note, tmp_path):
+        pytest.importorskip("orjson")
+        _write_json(tmp_path / "note.json", {
+            "id": "n1", "date": "2025-01-15", "type": "memo", "content": "x" * 64,
+        })
+        assert import_notes(str(tmp_path)) == 1
+
+
 # ===================================================================
 # import_market_context tests (KIK-399)
 # ===================================================================
@@ -509,7 +661,7 @@ class TestImportMarketContext:
                 {"name": "日経平均", "price": 40000},
             ],
         })
-        count = import_market_context(str(tmp_path))
+        count = import_market_context(tmp_path / "market_context")
         assert count == 1
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_mc.assert_called_once()
@@ -525,7 +677,7 @@ class TestImportMarketContext:
 
     @patch("scripts.init_graph.merge_market_context_full")
     def test_import_market_context_empty_dir(self, mock_mc, tmp_path):
-        count = import_market_context(str(tmp_path))
+        count = import_market_context(tmp_path / "market_context")
         assert count == 0
         mock_mc.assert_not_called()
 
@@ -535,7 +687,7 @@ class TestImportMarketContext:
         _write_json(d / "2025-02-17_context.json", {
             "indices": [{"name": "VIX", "price": 15}],
         })
-        count = import_market_context(str(tmp_path))
+        count = import_market_context(tmp_path / "market_context")
         assert count == 0
         mock_mc.assert_not_called()
 
@@ -544,5 +696,215 @@ class TestImportMarketContext:
         d = tmp_path / "market_context"
         d.mkdir(parents=True)
         (d / "bad.json").write_text("not json")
-        count = import_market_context(str(tmp_path))
+        count = import_market_context(tmp_path / "market_context")
         assert count == 0
+
+    @patch("scripts.init_graph.merge_market_context_full")
+    def test_failed_rows_not_counted(self, mock_mc, tmp_path):
+        d = tmp_path / "market_context"
+        for day in ("15", "16", "17"):
+            _write_json(d / f"2025-02-{day}_context.json", {"date": f"2025-02-{day}"})
+        mock_mc.side_effect = [True, False, RuntimeError("boom")]
+        assert import_market_context(d) == 1
+        assert mock_mc.call_count == 3
+
+
+# ===================================================================
+# Import manifest (skip unchanged files)
+# ===================================================================
+
+class TestImportManifest:
+    @pytest.fixture()
+    def manifest_on(self, tmp_path, monkeypatch):
+        import scripts.init_graph as ig
+        from src.data import import_manifest
+        import_manifest.close()
+        monkeypatch.setattr(import_manifest, "MANIFEST_PATH", tmp_path / "m.sqlite3")
+        monkeypatch.setattr(ig, "_use_manifest", True)
+        monkeypatch.setattr(ig, "_embedding_modules", lambda: {})
+        yield
+        import_manifest.close()
+
+    @patch("scripts.init_graph.merge_health_checks_bulk", return_value=True)
+    def test_unchanged_files_skipped(self, mock_health, tmp_path, manifest_on):
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {"date": "2025-01-15"})
+        assert import_health(tmp_path / "health") == 1
+        assert import_health(tmp_path / "health") == 0
+        _write_json(d / "2025-01-16_health.json", {"date": "2025-01-16"})
+        assert import_health(tmp_path / "health") == 1
+        assert mock_health.call_args[0][0][0]["health_date"] == "2025-01-16"
+
+    @patch("scripts.init_graph.merge_health_checks_bulk", return_value=True)
+    def test_touched_file_not_reparsed(self, mock_health, tmp_path, manifest_on):
+        import os
+        d = tmp_path / "health"
+        fp = d / "2025-01-15_health.json"
+        _write_json(fp, {"date": "2025-01-15"})
+        assert import_health(d) == 1
+        st = os.stat(fp)
+        os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        with patch("scripts.init_graph._parse_or_none", wraps=lambda r: None) as parse:
+            assert import_health(d) == 0
+        assert all(c[0][0] is None for c in parse.call_args_list)
+
+    @patch("scripts.init_graph.merge_health_checks_bulk", return_value=False)
+    def test_failed_merge_not_recorded(self, mock_health, tmp_path, manifest_on):
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {"date": "2025-01-15"})
+        assert import_health(tmp_path / "health") == 0
+        assert import_health(tmp_path / "health") == 0
+        assert mock_health.call_count == 2
+
+    @patch("scripts.init_graph.merge_health_checks_bulk", return_value=True)
+    def test_missing_embeddings_not_recorded(self, mock_health, tmp_path,
+                                             manifest_on, monkeypatch):
+        import scripts.init_graph as ig
+        monkeypatch.setattr(ig, "_embedding_modules", lambda: {"x": None})
+        monkeypatch.setattr(ig, "_emb_active", False)
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {"date": "2025-01-15"})
+        assert import_health(d) == 1
+        assert import_health(d) == 1
+
+    @patch("scripts.init_graph.merge_health_checks_bulk", return_value=True)
+    def test_disabled_by_default(self, mock_health, tmp_path):
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {"date": "2025-01-15"})
+        assert import_health(tmp_path / "health") == 1
+        assert import_health(tmp_path / "health") == 1
+
+
+# ===================================================================
+# Summary building gated on TEI availability
+# ===================================================================
+
+class TestEmbeddingActive:
+    @patch("scripts.init_graph._emb_active", False)
+    @patch("scripts.init_graph._get_embeddings")
+    @patch("scripts.init_graph.merge_health_checks_bulk")
+    def test_tei_down_skips_summaries(self, mock_health, mock_emb, tmp_path):
+        mock_emb.side_effect = lambda texts: [None] * len(texts)
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {
+            "date": "2025-01-15", "summary": {"total": 1},
+        })
+        with patch("src.data.summary_builder.build_health_summary") as mock_build:
+            assert import_health(d) == 1
+        mock_build.assert_not_called()
+        assert mock_health.call_args[0][0][0]["semantic_summary"] == ""
+
+    @patch("scripts.init_graph._emb_active", True)
+    @patch("scripts.init_graph.merge_health_checks_bulk")
+    def test_tei_up_builds_summaries(self, mock_health, tmp_path):
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {
+            "date": "2025-01-15", "summary": {"total": 1},
+        })
+        with patch("src.data.summary_builder.build_health_summary",
+                   return_value="health 2025-01-15"), \
+                patch("src.data.embedding_client.get_embeddings_batch",
+                      return_value=[None]):
+            assert import_health(d) == 1
+        assert mock_health.call_args[0][0][0]["semantic_summary"] == "health 2025-01-15"
+
+
+# ===================================================================
+# Lazy imports
+# ===================================================================
+
+class TestLazyImports:
+    def test_embedding_modules_memoized(self):
+        mods = _embedding_modules()
+        assert set(mods) == {"embedding_client", "summary_builder", "embedding_cache"}
+        assert _embedding_modules() is mods
+
+    def test_module_import_skips_embedding_client(self):
+        """Importing the script does not pull in requests via embedding_client."""
+        import subprocess
+        import sys
+        root = Path(__file__).resolve().parents[2]
+        code = ("import sys; import scripts.init_graph; "
+                "print('src.data.embedding_client' in sys.modules)")
+        out = subprocess.run([sys.executable, "-c", code], cwd=root,
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+
+# ===================================================================
+# Parallel parsing / importer dispatch
+# ===================================================================
+
+def _count_files(d: Path) -> int:
+    """Module-level importer stand-in (picklable for worker processes)."""
+    return len(list(d.glob("*.json")))
+
+
+def _stock_importer(d: Path) -> int:
+    """Importer stand-in that finds one Stock (picklable)."""
+    import scripts.init_graph as ig
+    ig._merge_stocks([("7203.T", d.name, "Auto")])
+    return 1
+
+
+class TestParallelImport:
+    def test_read_all_preserves_order(self, tmp_path):
+        files = []
+        for i in range(20):
+            fp = tmp_path / f"{i:02d}.json"
+            _write_json(fp, {"i": i})
+            files.append(fp)
+        assert [d["i"] for d in _read_all(files)] == list(range(20))
+
+    def test_read_all_bad_files_are_none(self, tmp_path):
+        good = tmp_path / "good.json"
+        _write_json(good, {"ok": True})
+        bad = tmp_path / "bad.json"
+        bad.write_text("{broken", encoding="utf-8")
+        missing = tmp_path / "missing.json"
+        assert _read_all([good, bad, missing]) == [{"ok": True}, None, None]
+
+    def test_list_json_filters_and_orders_by_inode(self, tmp_path):
+        import os
+        for name in ("b.json", "a.json", "c.json", "notes.txt"):
+            (tmp_path / name).write_text("{}", encoding="utf-8")
+        (tmp_path / "sub.json").mkdir()
+        paths = _list_json(tmp_path)
+        assert sorted(Path(p).name for p in paths) == ["a.json", "b.json", "c.json"]
+        inodes = [os.stat(p).st_ino for p in paths]
+        assert inodes == sorted(inodes)
+
+    def test_read_all_async_bounded(self, tmp_path):
+        import asyncio
+        files = []
+        for i in range(5):
+            fp = tmp_path / f"{i}.json"
+            _write_json(fp, [i])
+            files.append(fp)
+        assert asyncio.run(_read_all_async(files, limit=2)) == [[0], [1], [2], [3], [4]]
+
+    def test_read_all_empty(self):
+        assert _read_all([]) == []
+
+    def test_run_importers_sequential(self, tmp_path):
+        _write_json(tmp_path / "a.json", {})
+        counts = _run_importers(
+            {"A": (_count_files, tmp_path), "B": (lambda d: 7, tmp_path)}, jobs=1)
+        assert counts == {"A": 1, "B": 7}
+
+    def test_run_importers_process_pool(self, tmp_path):
+        _write_json(tmp_path / "a.json", {})
+        _write_json(tmp_path / "b.json", {})
+        counts = _run_importers(
+            {"A": (_count_files, tmp_path), "B": (_count_files, tmp_path)}, jobs=2)
+        assert list(counts) == ["A", "B"]
+        assert counts == {"A": 2, "B": 2}
+
+    @patch("scripts.init_graph.merge_stocks_bulk")
+    def test_worker_stocks_merged_in_parent(self, mock_stocks, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        counts = _run_importers({"A": (_stock_importer, tmp_path / "a"),
+                                 "B": (_stock_importer, tmp_path / "b")}, jobs=2)
+        assert counts == {"A": 1, "B": 1}
+        assert [r["name"] for r in _stock_rows(mock_stocks)] == ["a", "b"]
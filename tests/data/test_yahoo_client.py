@@ -32,6 +32,7 @@ from src.data.yahoo_client import (
     _write_cache,
     _write_detail_cache,
     get_macro_indicators,
+    get_quotes_batch,
 )
 
 # Patch target for CACHE_DIR: must target the submodule where it's defined (KIK-449)
@@ -683,3 +684,94 @@ class TestStaleCacheRead:
             assert result is not None
             assert result["per"] == 10.5
             assert result.get("_stale") is True
+
+
+# ---------------------------------------------------------------------------
+# get_quotes_batch
+# ---------------------------------------------------------------------------
+
+class TestGetQuotesBatch:
+    """Tests for get_quotes_batch()."""
+
+    @staticmethod
+    def _download_frame(closes_by_symbol):
+        frames = {
+            sym: pd.DataFrame({"Close": closes}) for sym, closes in closes_by_symbol.items()
+        }
+        return pd.concat(frames, axis=1)
+
+    def test_batches_and_reads_last_close(self, tmp_path, monkeypatch):
+        import yfinance as yf
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        calls = []
+
+        def _download(symbols, **kwargs):
+            calls.append(list(symbols))
+            return self._download_frame({
+                sym: [100.0, float("nan") if sym == "S1" else 101.0] for sym in symbols
+            })
+
+        monkeypatch.setattr(yf, "download", _download)
+        symbols = [f"S{i}" for i in range(25)]
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            result = get_quotes_batch(symbols)
+
+        assert [len(c) for c in calls] == [20, 5]
+        assert result["S0"] == {"symbol": "S0", "price": 101.0}
+        assert result["S1"]["price"] == 100.0
+        assert list(result) == symbols
+
+    def test_fresh_cache_skips_download(self, tmp_path, monkeypatch):
+        import yfinance as yf
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        download = MagicMock()
+        monkeypatch.setattr(yf, "download", download)
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_cache("7203.T", {"symbol": "7203.T", "price": 2850.0})
+            result = get_quotes_batch(["7203.T"])
+
+        assert result == {"7203.T": {"symbol": "7203.T", "price": 2850.0}}
+        download.assert_not_called()
+
+    def test_missing_symbol_and_error_map_to_none(self, tmp_path, monkeypatch):
+        import yfinance as yf
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        monkeypatch.setattr(
+            yf, "download", lambda symbols, **kwargs: self._download_frame({"A": [10.0]}),
+        )
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            assert get_quotes_batch(["A", "B"]) == {
+                "A": {"symbol": "A", "price": 10.0}, "B": None,
+            }
+
+        def _fail(symbols, **kwargs):
+            raise ValueError("boom")
+
+        monkeypatch.setattr(yf, "download", _fail)
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            assert get_quotes_batch(["C"]) == {"C": None}
+
+    def test_downloaded_quotes_cached_briefly(self, tmp_path, monkeypatch):
+        import yfinance as yf
+        from src.data.yahoo_client import QUOTE_CACHE_TTL_SECONDS, _quote_cache_path
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        calls = []
+
+        def _download(symbols, **kwargs):
+            calls.append(list(symbols))
+            return self._download_frame({sym: [50.0] for sym in symbols})
+
+        monkeypatch.setattr(yf, "download", _download)
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            first = get_quotes_batch(["AAPL"])
+            second = get_quotes_batch(["AAPL"])
+            assert first == second == {"AAPL": {"symbol": "AAPL", "price": 50.0}}
+            assert len(calls) == 1
+
+            path = _quote_cache_path("AAPL")
+            data = json.loads(path.read_text(encoding="utf-8"))
+            expired = datetime.now() - timedelta(seconds=QUOTE_CACHE_TTL_SECONDS + 5)
+            data["_cached_at"] = expired.isoformat()
+            path.write_text(json.dumps(data), encoding="utf-8")
+            get_quotes_batch(["AAPL"])
+            assert len(calls) == 2
@@ -0,0 +1,106 @@
+"""Tests for .github/scripts/collect_market_data.py helpers."""
+
+import importlib.util
+import math
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / ".github" / "scripts" / "collect_market_data.py"
+
+
+@pytest.fixture(scope="module")
+def cmd():
+    spec = importlib.util.spec_from_file_location("collect_market_data", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+NOW = "2025-01-15T00:00:00+00:00"
+
+
+class TestNormalizeStockInfos:
+    def test_empty(self, cmd):
+        assert cmd._normalize_stock_infos([], NOW) == []
+
+    def test_missing_fields_are_none(self, cmd):
+        (entry,) = cmd._normalize_stock_infos([("7203.T", {"shortName": "Toyota"})], NOW)
+        assert entry["symbol"] == "7203.T"
+        assert entry["name"] == "Toyota"
+        assert entry["price"] is None
+        assert entry["per"] is None
+        assert entry["_market_data_updated"] == NOW
+
+    def test_nan_and_inf_fall_back_to_next_key(self, cmd):
+        (entry,) = cmd._normalize_stock_infos([("A", {
+            "regularMarketPrice": math.nan, "currentPrice": 100,
+            "trailingPE": math.inf, "priceToBook": "1.5",
+        })], NOW)
+        assert entry["price"] == 100.0
+        assert entry["per"] is None
+        assert entry["pbr"] == 1.5
+
+    def test_strings_pass_through(self, cmd):
+        (entry,) = cmd._normalize_stock_infos([("A", {
+            "regularMarketPrice": "n/a", "currentPrice": 100,
+            "trailingPE": "Infinity?", "dividendYield": "n/a",
+        })], NOW)
+        assert entry["price"] == "n/a"
+        assert entry["per"] == "Infinity?"
+        assert entry["dividend_yield"] is None
+
+    def test_ratio_percentages_converted(self, cmd):
+        a, b = cmd._normalize_stock_infos([
+            ("A", {"dividendYield": 2.5}), ("B", {"dividendYield": 0.03}),
+        ], NOW)
+        assert a["dividend_yield"] == pytest.approx(0.025)
+        assert b["dividend_yield"] == pytest.approx(0.03)
+
+
+class TestIsFresh:
+    def _write(self, cmd, path, updated):
+        cmd._write_json(path, {"_market_data_updated": updated})
+
+    def test_recent_file_is_fresh(self, cmd, tmp_path):
+        fp = tmp_path / "a.json"
+        now = datetime.now(timezone.utc)
+        self._write(cmd, fp, now.isoformat())
+        assert cmd._is_fresh(fp, now - timedelta(hours=1))
+
+    def test_old_timestamp_is_stale(self, cmd, tmp_path):
+        fp = tmp_path / "a.json"
+        now = datetime.now(timezone.utc)
+        self._write(cmd, fp, (now - timedelta(hours=2)).isoformat())
+        assert not cmd._is_fresh(fp, now - timedelta(hours=1))
+
+    def test_naive_timestamp_is_stale(self, cmd, tmp_path):
+        fp = tmp_path / "a.json"
+        now = datetime.now(timezone.utc)
+        self._write(cmd, fp, now.replace(tzinfo=None).isoformat())
+        assert not cmd._is_fresh(fp, now - timedelta(hours=1))
+
+    def test_missing_file_is_stale(self, cmd, tmp_path):
+        assert not cmd._is_fresh(tmp_path / "none.json", datetime.now(timezone.utc))
+
+
+class TestCollectRegion:
+    def test_stocks_written_in_chunks(self, cmd, tmp_path, monkeypatch):
+        symbols = ["1001.T", "1002.T", "1003.T", "1004.T", "1005.T"]
+        monkeypatch.setattr(cmd, "JAPAN_SCREEN_PRESETS", [])
+        monkeypatch.setattr(cmd, "JAPAN_CORE_STOCKS", symbols)
+        monkeypatch.setattr(cmd.time, "sleep", lambda s: None)
+        monkeypatch.setattr(cmd, "_WRITE_CHUNK", 2)
+        monkeypatch.setattr(cmd, "fetch_stock_info",
+                            lambda symbol, verbose=False: {"regularMarketPrice": 10})
+        chunks = []
+        write = cmd._write_stock_infos
+        monkeypatch.setattr(cmd, "_write_stock_infos",
+                            lambda raw, d, now: chunks.append(len(raw)) or write(raw, d, now))
+
+        meta = cmd.collect_region("japan", tmp_path, verbose=False, max_age_hours=0)
+
+        assert chunks == [2, 2, 1]
+        assert meta["stocks_collected"] == 5
+        assert len(list((tmp_path / "japan" / "stocks").glob("*.json"))) == 5